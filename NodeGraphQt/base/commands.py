@@ -157,6 +157,68 @@ class NodeMovedCmd(QtWidgets.QUndoCommand):
         self.node.model.pos = self.pos
 
 
+class NodesMovedCmd(QtWidgets.QUndoCommand):
+    """
+    Move several nodes in a single undo step.
+
+    Args:
+        nodes_pos (dict): {NodeGraphQt.NodeObject: (x, y)} new positions.
+        prev_nodes_pos (dict): {NodeGraphQt.NodeObject: (x, y)} previous
+            positions.
+    """
+
+    def __init__(self, nodes_pos, prev_nodes_pos):
+        QtWidgets.QUndoCommand.__init__(self)
+        self.setText('moved nodes')
+        self.nodes_pos = nodes_pos
+        self.prev_nodes_pos = prev_nodes_pos
+
+    @staticmethod
+    def _set_positions(nodes_pos):
+        for node, pos in nodes_pos.items():
+            pos = [float(pos[0]), float(pos[1])]
+            node.model.pos = pos
+            if node.has_view():
+                node.view.xy_pos = pos
+            else:
+                node.graph.viewer().update_deferred_node(node)
+
+    def undo(self):
+        self._set_positions(self.prev_nodes_pos)
+
+    def redo(self):
+        self._set_positions(self.nodes_pos)
+
+
+def _add_deferred_node(graph, node, pos=None):
+    """
+    Add a node without node item to the viewer, the item is created once
+    the node gets near the viewport.
+
+    Args:
+        graph (NodeGraphQt.NodeGraph): node graph.
+        node (NodeGraphQt.NodeObject): node.
+        pos (tuple(float, float)): node position (optional).
+    """
+    if pos:
+        node.model.pos = [float(pos[0]), float(pos[1])]
+    graph.viewer().add_deferred_node(node)
+
+
+def _remove_node_view(graph, node):
+    """
+    Remove the node item (or the node without node item) from the viewer.
+
+    Args:
+        graph (NodeGraphQt.NodeGraph): node graph.
+        node (NodeGraphQt.NodeObject): node.
+    """
+    if node.has_view():
+        node.view.delete()
+    else:
+        graph.viewer().remove_deferred_node(node)
+
+
 class NodeAddedCmd(QtWidgets.QUndoCommand):
     """
     Node added command.
@@ -179,20 +241,23 @@ class NodeAddedCmd(QtWidgets.QUndoCommand):
     def undo(self):
         node_id = self.node.id
         self.pos = self.pos or self.node.pos()
-        self.graph.model.nodes.pop(self.node.id)
-        self.node.view.delete()
+        self.graph.model.remove_node(self.node.id)
+        _remove_node_view(self.graph, self.node)
 
         if self.emit_signal:
             self.graph.nodes_deleted.emit([node_id])
 
     def redo(self):
-        self.graph.model.nodes[self.node.id] = self.node
-        self.graph.viewer().add_node(self.node.view, self.pos)
+        self.graph.model.add_node(self.node)
+        if not self.node.has_view():
+            _add_deferred_node(self.graph, self.node, self.pos)
+        else:
+            self.graph.viewer().add_node(self.node.view, self.pos)
 
-        # node width & height is calculated when it's added to the scene,
-        # so we have to update the node model here.
-        self.node.model.width = self.node.view.width
-        self.node.model.height = self.node.view.height
+            # node width & height is calculated when it's added to the scene,
+            # so we have to update the node model here.
+            self.node.model.width = self.node.view.width
+            self.node.model.height = self.node.view.height
 
         if self.emit_signal:
             self.graph.node_created.emit(self.node)
@@ -217,8 +282,11 @@ class NodesRemovedCmd(QtWidgets.QUndoCommand):
 
     def undo(self):
         for node in self.nodes:
-            self.graph.model.nodes[node.id] = node
-            self.graph.scene().addItem(node.view)
+            self.graph.model.add_node(node)
+            if node.has_view():
+                self.graph.scene().addItem(node.view)
+            else:
+                _add_deferred_node(self.graph, node)
 
             if self.emit_signal:
                 self.graph.node_created.emit(node)
@@ -227,13 +295,66 @@ class NodesRemovedCmd(QtWidgets.QUndoCommand):
         node_ids = []
         for node in self.nodes:
             node_ids.append(node.id)
-            self.graph.model.nodes.pop(node.id)
-            node.view.delete()
+            self.graph.model.remove_node(node.id)
+            _remove_node_view(self.graph, node)
 
         if self.emit_signal:
             self.graph.nodes_deleted.emit(node_ids)
 
 
+class NodesAddedCmd(QtWidgets.QUndoCommand):
+    """
+    Nodes added in bulk command, the nodes and their connections are added
+    and removed as a single undo entry.
+
+    Args:
+        graph (NodeGraphQt.NodeGraph): node graph.
+        nodes (list[NodeGraphQt.NodeObject]): nodes.
+        positions (list[tuple(float, float)]): initial node positions (optional).
+        pipes (list[tuple(NodeGraphQt.Port, NodeGraphQt.Port)]):
+            (input port, output port) connections between the nodes (optional).
+    """
+
+    def __init__(self, graph, nodes, positions=None, pipes=None):
+        QtWidgets.QUndoCommand.__init__(self)
+        self.setText('added nodes')
+        self.graph = graph
+        self.nodes = nodes
+        self.positions = positions or [None] * len(nodes)
+        self.pipe_cmds = [PortConnectedCmd(in_port, out_port, False)
+                          for in_port, out_port in pipes or []]
+
+    def undo(self):
+        for cmd in reversed(self.pipe_cmds):
+            cmd.undo()
+        self.positions = [n.pos() for n in self.nodes]
+        for node in self.nodes:
+            self.graph.model.remove_node(node.id)
+            _remove_node_view(self.graph, node)
+
+    def redo(self):
+        views = []
+        view_positions = []
+        for node, pos in zip(self.nodes, self.positions):
+            self.graph.model.add_node(node)
+            if node.has_view():
+                views.append(node.view)
+                view_positions.append(pos)
+            else:
+                _add_deferred_node(self.graph, node, pos)
+        self.graph.viewer().add_nodes(views, view_positions)
+
+        # node width & height is calculated when it's added to the scene,
+        # so we have to update the node model here.
+        for node in self.nodes:
+            if node.has_view():
+                node.model.width = node.view.width
+                node.model.height = node.view.height
+
+        for cmd in self.pipe_cmds:
+            cmd.redo()
+
+
 class NodeInputConnectedCmd(QtWidgets.QUndoCommand):
     """
     "BaseNode.on_input_connected()" command.
@@ -288,6 +409,55 @@ class NodeInputDisconnectedCmd(QtWidgets.QUndoCommand):
         node.on_input_disconnected(self.source, self.target)
 
 
+def _update_reachability(src_port, trg_port, connected):
+    """
+    Add or remove the pipe edge in the graph model reachability index.
+
+    Args:
+        src_port (NodeGraphQt.Port): source port.
+        trg_port (NodeGraphQt.Port): target port.
+        connected (bool): true if the ports were connected.
+    """
+    if src_port.type_() == PortTypeEnum.IN.value:
+        src_port, trg_port = trg_port, src_port
+    reachability = src_port.node().graph.model.reachability
+    if connected:
+        reachability.add_edge(src_port.node().id, trg_port.node().id)
+    else:
+        reachability.remove_edge(src_port.node().id, trg_port.node().id)
+
+
+def _connect_port_views(src_port, trg_port):
+    """
+    Draw the pipe between the port items, a node without node item gets its
+    pipes once the item is created (see "BaseNode.create_view()").
+
+    Args:
+        src_port (NodeGraphQt.Port): source port.
+        trg_port (NodeGraphQt.Port): target port.
+    """
+    src_node, trg_node = src_port.node(), trg_port.node()
+    if src_node.has_view() and trg_node.has_view():
+        src_port.view.connect_to(trg_port.view)
+    elif src_node.has_view() or trg_node.has_view():
+        # the pipe of a node item is always drawn, the created node item
+        # draws it.
+        src_node.create_view()
+        trg_node.create_view()
+
+
+def _disconnect_port_views(src_port, trg_port):
+    """
+    Remove the pipe between the port items.
+
+    Args:
+        src_port (NodeGraphQt.Port): source port.
+        trg_port (NodeGraphQt.Port): target port.
+    """
+    if src_port.node().has_view() and trg_port.node().has_view():
+        src_port.view.disconnect_from(trg_port.view)
+
+
 class PortConnectedCmd(QtWidgets.QUndoCommand):
     """
     Port connected command.
@@ -321,8 +491,11 @@ class PortConnectedCmd(QtWidgets.QUndoCommand):
             del trg_model.connected_ports[src_id]
         if port_names and self.source.name() in port_names:
             port_names.remove(self.source.name())
+        self.source._remove_peer(self.target)
+        self.target._remove_peer(self.source)
+        _update_reachability(self.source, self.target, False)
 
-        self.source.view.disconnect_from(self.target.view)
+        _disconnect_port_views(self.source, self.target)
 
         # emit "port_disconnected" signal from the parent graph.
         if self.emit_signal:
@@ -339,8 +512,11 @@ class PortConnectedCmd(QtWidgets.QUndoCommand):
 
         src_model.connected_ports[trg_id].append(self.target.name())
         trg_model.connected_ports[src_id].append(self.source.name())
+        self.source._add_peer(self.target)
+        self.target._add_peer(self.source)
+        _update_reachability(self.source, self.target, True)
 
-        self.source.view.connect_to(self.target.view)
+        _connect_port_views(self.source, self.target)
 
         # emit "port_connected" signal from the parent graph.
         if self.emit_signal:
@@ -374,8 +550,11 @@ class PortDisconnectedCmd(QtWidgets.QUndoCommand):
 
         src_model.connected_ports[trg_id].append(self.target.name())
         trg_model.connected_ports[src_id].append(self.source.name())
+        self.source._add_peer(self.target)
+        self.target._add_peer(self.source)
+        _update_reachability(self.source, self.target, True)
 
-        self.source.view.connect_to(self.target.view)
+        _connect_port_views(self.source, self.target)
 
         # emit "port_connected" signal from the parent graph.
         if self.emit_signal:
@@ -401,8 +580,11 @@ class PortDisconnectedCmd(QtWidgets.QUndoCommand):
             del trg_model.connected_ports[src_id]
         if port_names and self.source.name() in port_names:
             port_names.remove(self.source.name())
+        self.source._remove_peer(self.target)
+        self.target._remove_peer(self.source)
+        _update_reachability(self.source, self.target, False)
 
-        self.source.view.disconnect_from(self.target.view)
+        _disconnect_port_views(self.source, self.target)
 
         # emit "port_disconnected" signal from the parent graph.
         if self.emit_signal:
@@ -1,6 +1,7 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 import copy
+import io
 import json
 import os
 import re
@@ -9,19 +10,23 @@ from pathlib import Path
 from Qt import QtCore, QtWidgets
 
 from NodeGraphQt.base.commands import (NodeAddedCmd,
+                                       NodesAddedCmd,
                                        NodesRemovedCmd,
                                        NodeMovedCmd,
-                                       PortConnectedCmd)
+                                       NodesMovedCmd)
 from NodeGraphQt.base.factory import NodeFactory
+from NodeGraphQt.base.layout_job import LayoutJob, LayoutSnapshot
 from NodeGraphQt.base.menu import NodeGraphMenu, NodesMenu
 from NodeGraphQt.base.model import NodeGraphModel
 from NodeGraphQt.base.node import NodeObject
 from NodeGraphQt.base.port import Port
+from NodeGraphQt.base.serializer import serialize_nodes, write_nodes
 from NodeGraphQt.constants import (
     MIME_TYPE,
     URI_SCHEME,
     URN_SCHEME,
     LayoutDirectionEnum,
+    LayoutModeEnum,
     PipeLayoutEnum,
     PortTypeEnum,
     ViewerEnum
@@ -155,6 +160,11 @@ class NodeGraph(QtCore.QObject):
         )
         self._widget = None
         self._sub_graphs = {}
+        self._layout_job = None
+        # node items used to measure the nodes created without node item.
+        # (see "NodeGraph._deferred_view_size()")
+        self._view_templates = {}
+        self._view_sizes = {}
         self._viewer = (
             kwargs.get('viewer') or NodeViewer(undo_stack=self._undo_stack)
         )
@@ -181,6 +191,7 @@ class NodeGraph(QtCore.QObject):
         # for the user interaction with the live pipe.
         self._viewer.accept_connection_types = self._model.accept_connection_types
         self._viewer.reject_connection_types = self._model.reject_connection_types
+        self._viewer.reachability = self._model.reachability
 
         self._context_menu = {}
 
@@ -225,6 +236,7 @@ class NodeGraph(QtCore.QObject):
         self._viewer.node_backdrop_updated.connect(
             self._on_node_backdrop_updated)
         self._viewer.insert_node.connect(self._on_insert_node)
+        self._viewer.nodes_attached.connect(self._on_nodes_attached)
 
         # pass through translated signals.
         self._viewer.node_selected.connect(self._on_node_selected)
@@ -233,6 +245,12 @@ class NodeGraph(QtCore.QObject):
         self._viewer.data_dropped.connect(self._on_node_data_dropped)
         self._viewer.context_menu_prompt.connect(self._on_context_menu_prompt)
 
+        # topology changes make a running layout job stale.
+        self.node_created.connect(self._cancel_layout_job)
+        self.nodes_deleted.connect(self._cancel_layout_job)
+        self.port_connected.connect(self._cancel_layout_job)
+        self.port_disconnected.connect(self._cancel_layout_job)
+
     def _on_context_menu_prompt(self, menu_name, node_id):
         """
         Slot function triggered just before a context menu is shown.
@@ -245,6 +263,23 @@ class NodeGraph(QtCore.QObject):
         menu = self.get_context_menu(menu_name)
         self.context_menu_prompt.emit(menu, node)
 
+    def _on_nodes_attached(self, node_ids):
+        """
+        Slot function triggered when node items were attached to the scene
+        in virtualized mode, the connected nodes without node item get one
+        so all the pipes of the attached nodes are drawn.
+
+        Args:
+            node_ids (list[str]): attached node ids.
+        """
+        for node_id in node_ids:
+            node = self._model.nodes.get(node_id)
+            if not isinstance(node, BaseNode):
+                continue
+            for port in node.input_ports() + node.output_ports():
+                for connected_port in port.connected_ports():
+                    connected_port.node().create_view()
+
     def _on_insert_node(self, pipe, node_id, prev_node_pos):
         """
         Slot function triggered when a selected node has collided with a pipe.
@@ -961,6 +996,35 @@ class NodeGraph(QtCore.QObject):
         self._model.acyclic = mode
         self._viewer.acyclic = self._model.acyclic
 
+    def strongly_connected_nodes(self):
+        """
+        Returns the nodes grouped by strongly connected components, every
+        node of a group can be reached from all the other nodes in the group.
+
+        See Also:
+            :meth:`NodeGraph.node_cycles`
+
+        Returns:
+            list[list[NodeGraphQt.BaseNode]]: node groups.
+        """
+        components = self._model.reachability.strongly_connected_components()
+        return [[self._model.nodes[n_id] for n_id in c] for c in components]
+
+    def node_cycles(self):
+        """
+        Returns the groups of nodes connected in a loop, useful when the
+        graph isn't acyclic (see :meth:`NodeGraph.set_acyclic`) and pipelines
+        loop on purpose.
+
+        See Also:
+            :meth:`NodeGraph.strongly_connected_nodes`
+
+        Returns:
+            list[list[NodeGraphQt.BaseNode]]: looping node groups.
+        """
+        cycles = self._model.reachability.cycles()
+        return [[self._model.nodes[n_id] for n_id in c] for c in cycles]
+
     def pipe_collision(self):
         """
         Returns if pipe collision is enabled.
@@ -1022,6 +1086,35 @@ class NodeGraph(QtCore.QObject):
         self._model.pipe_slicing = mode
         self._viewer.pipe_slicing = self._model.pipe_slicing
 
+    def virtualized(self):
+        """
+        Returns if the virtualized scene mode is enabled.
+
+        See Also:
+            :meth:`NodeGraph.set_virtualized`
+
+        Returns:
+            bool: True if virtualized.
+        """
+        return self._model.virtualized
+
+    def set_virtualized(self, mode=True):
+        """
+        Enable/Disable the virtualized scene mode for very large graphs.
+
+        Nodes (and their positions) stay in the model but only the node items
+        intersecting the viewport plus a margin and their pipes are kept in
+        the scene, node items are detached again when they scroll away.
+
+        See Also:
+            :meth:`NodeGraph.virtualized`
+
+        Args:
+            mode (bool): False to keep every node item in the scene.
+        """
+        self._model.virtualized = mode
+        self._viewer.set_virtualized(self._model.virtualized)
+
     def pipe_style(self):
         """
         Returns the current pipe layout style.
@@ -1108,6 +1201,34 @@ class NodeGraph(QtCore.QObject):
             node.set_layout_direction(direction)
         self._viewer.set_layout_direction(direction)
 
+    def layout_mode(self):
+        """
+        Return the algorithm used by :meth:`NodeGraph.auto_layout_nodes`.
+
+        See Also:
+            :meth:`NodeGraph.set_layout_mode`
+
+        Returns:
+            int: layout mode. :attr:`NodeGraphQt.constants.LayoutModeEnum`
+        """
+        return self._model.layout_mode
+
+    def set_layout_mode(self, mode):
+        """
+        Set the algorithm used by :meth:`NodeGraph.auto_layout_nodes`.
+
+        **Layout Modes:**
+
+        - :attr:`NodeGraphQt.constants.LayoutModeEnum.LAYERED`
+        - :attr:`NodeGraphQt.constants.LayoutModeEnum.FORCE_DIRECTED`
+
+        Args:
+            mode (int): layout mode.
+        """
+        if mode not in [e.value for e in LayoutModeEnum]:
+            mode = LayoutModeEnum.LAYERED.value
+        self._model.layout_mode = mode
+
     def fit_to_selection(self):
         """
         Sets the zoom level to fit selected nodes.
@@ -1116,7 +1237,7 @@ class NodeGraph(QtCore.QObject):
         nodes = self.selected_nodes() or self.all_nodes()
         if not nodes:
             return
-        self._viewer.zoom_to_nodes([n.view for n in nodes])
+        self._viewer.zoom_to_nodes(self._viewer_nodes(nodes))
 
     def reset_zoom(self):
         """
@@ -1150,7 +1271,7 @@ class NodeGraph(QtCore.QObject):
             nodes (list[NodeGraphQt.BaseNode]): a list of nodes.
         """
         nodes = nodes or []
-        self._viewer.center_selection([n.view for n in nodes])
+        self._viewer.center_selection(self._viewer_nodes(nodes))
 
     def center_selection(self):
         """
@@ -1194,6 +1315,72 @@ class NodeGraph(QtCore.QObject):
         self._viewer.rebuild_tab_search()
         self.nodes_registered.emit(nodes)
 
+    @staticmethod
+    def _viewer_nodes(nodes):
+        """
+        Returns the node items for the viewer, the nodes without node item
+        are passed as is so their items aren't created.
+
+        Args:
+            nodes (list[NodeGraphQt.NodeObject]): nodes.
+
+        Returns:
+            list[AbstractNodeItem or NodeGraphQt.NodeObject]: viewer nodes.
+        """
+        return [n.view if n.has_view() else n for n in nodes]
+
+    def _create_node_instance(self, node_type, defer_view=False):
+        """
+        Create a node instance from the node factory.
+        (used internally by the node graph)
+
+        Args:
+            node_type (str): node instance type.
+            defer_view (bool): only create the node item once it's needed
+                (see :meth:`NodeObject.create_view`).
+
+        Returns:
+            NodeGraphQt.NodeObject: node instance or None.
+        """
+        NodeObject._defer_view = defer_view
+        try:
+            node = self._node_factory.create_node_instance(node_type)
+        finally:
+            NodeObject._defer_view = False
+        if node and not isinstance(node, BaseNode):
+            # only the node items are virtualized.
+            node.create_view()
+        return node
+
+    def _deferred_view_size(self, node):
+        """
+        Returns the size of the node item of a node created without node
+        item, measured on a node item of the same type.
+        (used internally by the node graph)
+
+        Args:
+            node (NodeGraphQt.BaseNode): node without node item.
+
+        Returns:
+            tuple(float, float): width, height.
+        """
+        key = (node.type_, node.model.layout_direction)
+        template = self._view_templates.get(key)
+        if template is None:
+            template = self._create_node_instance(node.type_).view
+            template.layout_direction = node.model.layout_direction
+            template.post_init(self._viewer)
+            self._view_templates[key] = template
+
+        # the name is the only attribute that differs between the nodes.
+        template.name = node.model.name
+        key += (template.text_item.boundingRect().width(),)
+        size = self._view_sizes.get(key)
+        if size is None:
+            template.draw_node()
+            size = self._view_sizes[key] = (template.width, template.height)
+        return size
+
     def create_node(self, node_type, name=None, selected=True, color=None,
                     text_color=None, pos=None, push_undo=True):
         """
@@ -1214,7 +1401,10 @@ class NodeGraph(QtCore.QObject):
         Returns:
             BaseNode: the created instance of the node.
         """
-        node = self._node_factory.create_node_instance(node_type)
+        # virtualized mode: the node item is created once the node is near
+        # the viewport.
+        node = self._create_node_instance(
+            node_type, defer_view=self.virtualized() and not selected)
         if node:
             node._graph = self
             node.model._graph_model = self.model
@@ -1284,6 +1474,9 @@ class NodeGraph(QtCore.QObject):
             node.model.layout_direction = self.layout_direction()
 
             node.update()
+            if not node.has_view():
+                node.model.width, node.model.height = \
+                    self._deferred_view_size(node)
 
             undo_cmd = NodeAddedCmd(
                 self, node, pos=node.model.pos, emit_signal=True
@@ -1317,7 +1510,27 @@ class NodeGraph(QtCore.QObject):
             push_undo (bool): register the command to the undo stack. (default: True)
         """
         assert isinstance(node, NodeObject), 'node must be a Node instance.'
+        self._prepare_node(node)
+
+        undo_cmd = NodeAddedCmd(self, node, pos=pos, emit_signal=False)
+        if push_undo:
+            self._undo_stack.beginMacro('add node: "{}"'.format(node.name()))
+            self._undo_stack.push(undo_cmd)
+            if selected:
+                node.set_selected(True)
+            self._undo_stack.endMacro()
+        else:
+            undo_cmd.redo()
+
+    def _prepare_node(self, node):
+        """
+        Register the node type attributes and bind the node to the graph
+        before it's added to the scene.
+        (used internally by the node graph)
 
+        Args:
+            node (NodeGraphQt.NodeObject): node object.
+        """
         wid_types = node.model.__dict__.pop('_TEMP_property_widget_types')
         prop_attrs = node.model.__dict__.pop('_TEMP_property_attrs')
 
@@ -1372,16 +1585,9 @@ class NodeGraph(QtCore.QObject):
 
         # update method must be called before it's been added to the viewer.
         node.update()
-
-        undo_cmd = NodeAddedCmd(self, node, pos=pos, emit_signal=False)
-        if push_undo:
-            self._undo_stack.beginMacro('add node: "{}"'.format(node.name()))
-            self._undo_stack.push(undo_cmd)
-            if selected:
-                node.set_selected(True)
-            self._undo_stack.endMacro()
-        else:
-            undo_cmd.redo()
+        if not node.has_view():
+            node.model.width, node.model.height = \
+                self._deferred_view_size(node)
 
     def delete_node(self, node, push_undo=True):
         """
@@ -1630,9 +1836,9 @@ class NodeGraph(QtCore.QObject):
         Returns:
             NodeGraphQt.NodeObject: node object.
         """
-        for node_id, node in self._model.nodes.items():
-            if node.name() == name:
-                return node
+        node_ids = self._model.node_ids_by_name(name)
+        if node_ids:
+            return self._model.nodes[node_ids[0]]
 
     def get_nodes_by_type(self, node_type):
         """
@@ -1657,25 +1863,7 @@ class NodeGraph(QtCore.QObject):
         Returns:
             str: unique node name.
         """
-        name = ' '.join(name.split())
-        node_names = [n.name() for n in self.all_nodes()]
-        if name not in node_names:
-            return name
-
-        regex = re.compile(r'\w+ (\d+)$')
-        search = regex.search(name)
-        if not search:
-            for x in range(1, len(node_names) + 2):
-                new_name = '{} {}'.format(name, x)
-                if new_name not in node_names:
-                    return new_name
-
-        version = search.group(1)
-        name = name[:len(version) * -1].strip()
-        for x in range(1, len(node_names) + 2):
-            new_name = '{} {}'.format(name, x)
-            if new_name not in node_names:
-                return new_name
+        return self._model.unique_name(name)
 
     def current_session(self):
         """
@@ -1689,100 +1877,86 @@ class NodeGraph(QtCore.QObject):
     def clear_session(self):
         """
         Clears the current node graph session.
+
+        Note:
+            The scene and the model are cleared in one go, the
+            :attr:`NodeGraph.nodes_deleted` signal is emitted once with all
+            the node ids and no port disconnection signals are emitted.
         """
-        nodes = self.all_nodes()
-        for n in nodes:
-            if isinstance(n, BaseNode):
-                for p in n.input_ports():
-                    if p.locked():
-                        p.set_locked(False, connected_ports=False)
-                    p.clear_connections()
-                for p in n.output_ports():
-                    if p.locked():
-                        p.set_locked(False, connected_ports=False)
-                    p.clear_connections()
-        self._undo_stack.push(NodesRemovedCmd(self, nodes))
+        node_ids = list(self._model.nodes.keys())
+
+        # the undo commands reference the nodes that are about to be deleted.
         self._undo_stack.clear()
+        self._viewer.clear_nodes()
+        self._model.clear_nodes()
         self._model.session = ''
 
-    def _serialize(self, nodes):
+        if node_ids:
+            self.nodes_deleted.emit(node_ids)
+
+    def _serialize_graph(self):
         """
-        serialize nodes to a dict.
+        serialize the graph session settings to a dict.
         (used internally by the node graph)
 
-        Args:
-            nodes (list[NodeGraphQt.Nodes]): list of node instances.
-
         Returns:
-            dict: serialized data.
+            dict: serialized graph settings.
         """
-        serial_data = {'graph': {}, 'nodes': {}, 'connections': []}
-        nodes_data = {}
-
-        # serialize graph session.
-        serial_data['graph']['layout_direction'] = self.layout_direction()
-        serial_data['graph']['acyclic'] = self.acyclic()
-        serial_data['graph']['pipe_collision'] = self.pipe_collision()
-        serial_data['graph']['pipe_slicing'] = self.pipe_slicing()
-        serial_data['graph']['pipe_style'] = self.pipe_style()
+        graph_data = {
+            'layout_direction': self.layout_direction(),
+            'acyclic': self.acyclic(),
+            'pipe_collision': self.pipe_collision(),
+            'pipe_slicing': self.pipe_slicing(),
+            'pipe_style': self.pipe_style(),
+        }
 
         # connection constrains.
-        serial_data['graph']['accept_connection_types'] = {
+        graph_data['accept_connection_types'] = {
             k: list(v) for k, v in self.model.accept_connection_types.items()
         }
-        serial_data['graph']['reject_connection_types'] = {
+        graph_data['reject_connection_types'] = {
             k: list(v) for k, v in self.model.reject_connection_types.items()
         }
+        return graph_data
 
-        # serialize nodes.
-        for n in nodes:
-            # update the node model.
-            n.update_model()
-
-            node_dict = n.model.to_dict
-            nodes_data.update(node_dict)
-
-        for n_id, n_data in nodes_data.items():
-            serial_data['nodes'][n_id] = n_data
-
-            # serialize connections
-            inputs = n_data.pop('inputs') if n_data.get('inputs') else {}
-            outputs = n_data.pop('outputs') if n_data.get('outputs') else {}
+    def _serialize(self, nodes):
+        """
+        serialize nodes to a dict.
+        (used internally by the node graph)
 
-            for pname, conn_data in inputs.items():
-                for conn_id, prt_names in conn_data.items():
-                    for conn_prt in prt_names:
-                        pipe = {
-                            PortTypeEnum.IN.value: [n_id, pname],
-                            PortTypeEnum.OUT.value: [conn_id, conn_prt]
-                        }
-                        if pipe not in serial_data['connections']:
-                            serial_data['connections'].append(pipe)
+        Args:
+            nodes (list[NodeGraphQt.Nodes]): list of node instances.
 
-            for pname, conn_data in outputs.items():
-                for conn_id, prt_names in conn_data.items():
-                    for conn_prt in prt_names:
-                        pipe = {
-                            PortTypeEnum.OUT.value: [n_id, pname],
-                            PortTypeEnum.IN.value: [conn_id, conn_prt]
-                        }
-                        if pipe not in serial_data['connections']:
-                            serial_data['connections'].append(pipe)
+        Returns:
+            dict: serialized data.
+        """
+        return serialize_nodes(self._serialize_graph(), nodes)
 
-        if not serial_data['connections']:
-            serial_data.pop('connections')
+    def _serialize_to_file(self, nodes, file_out, **kwargs):
+        """
+        serialize nodes straight to a file object as JSON.
+        (used internally by the node graph)
 
-        return serial_data
+        Args:
+            nodes (list[NodeGraphQt.Nodes]): list of node instances.
+            file_out (file): text file object to write to.
+            kwargs: json ``indent``, ``separators`` and ``default`` args.
+        """
+        write_nodes(self._serialize_graph(), nodes, file_out, **kwargs)
 
-    def _deserialize(self, data, relative_pos=False, pos=None):
+    def _deserialize(self, data, relative_pos=False, pos=None, push_undo=True):
         """
         deserialize node data.
         (used internally by the node graph)
 
+        All the nodes and connections are added in one batch as a single
+        undo command.
+
         Args:
             data (dict): node data.
             relative_pos (bool): position node relative to the cursor.
             pos (tuple or list): custom x, y position.
+            push_undo (bool): register the command to the undo stack.
 
         Returns:
             list[NodeGraphQt.Nodes]: list of node instances.
@@ -1810,11 +1984,14 @@ class NodeGraph(QtCore.QObject):
                     k: set(v) for k, v in attr_value.items()
                 }
 
-        # build the nodes.
+        # build the node models, in virtualized mode the node items are
+        # created once the nodes are near the viewport.
+        defer_view = self.virtualized() and not (relative_pos or pos)
         nodes = {}
+        positions = []
         for n_id, n_data in data.get('nodes', {}).items():
             identifier = n_data['type_']
-            node = self._node_factory.create_node_instance(identifier)
+            node = self._create_node_instance(identifier, defer_view)
             if node:
                 node.NODE_NAME = n_data.get('name', node.NODE_NAME)
                 # set properties.
@@ -1824,12 +2001,12 @@ class NodeGraph(QtCore.QObject):
                 # set custom properties.
                 for prop, val in n_data.get('custom', {}).items():
                     node.model.set_property(prop, val)
-                    if isinstance(node, BaseNode):
+                    if isinstance(node, BaseNode) and node.has_view():
                         if prop in node.view.widgets:
                             node.view.widgets[prop].set_value(val)
 
-                nodes[n_id] = node
-                self.add_node(node, n_data.get('pos'))
+                if node.model.selected:
+                    node.create_view()
 
                 if n_data.get('port_deletion_allowed', None):
                     node.set_ports({
@@ -1837,7 +2014,16 @@ class NodeGraph(QtCore.QObject):
                         'output_ports': n_data['output_ports']
                     })
 
-        # build the connections.
+                self._prepare_node(node)
+                # register the node so the following nodes get unique names.
+                self._model.add_node(node)
+                nodes[n_id] = node
+                positions.append(n_data.get('pos'))
+
+        # resolve the connections.
+        pipes = []
+        input_connected = []
+        connected_inputs = set()
         for connection in data.get('connections', []):
             nid, pname = connection.get('in', ('', ''))
             in_node = nodes.get(nid) or self.get_node_by_id(nid)
@@ -1855,18 +2041,29 @@ class NodeGraph(QtCore.QObject):
                 # only connect if input port is not connected yet or input port
                 # can have multiple connections.
                 # important when duplicating nodes.
-                allow_connection = any([not in_port.model.connected_ports,
-                                        in_port.model.multi_connection])
+                allow_connection = any([
+                    not (in_port.model.connected_ports or
+                         in_port in connected_inputs),
+                    in_port.model.multi_connection
+                ])
                 if allow_connection:
-                    self._undo_stack.push(
-                        PortConnectedCmd(in_port, out_port, emit_signal=False)
-                    )
+                    pipes.append((in_port, out_port))
+                    connected_inputs.add(in_port)
+                input_connected.append((in_port, out_port))
 
-                # Run on_input_connected to ensure connections are fully set up
-                # after deserialization.
-                in_node.on_input_connected(in_port, out_port)
+        # add the nodes to the scene and connect them in one batch.
+        node_objs = list(nodes.values())
+        undo_cmd = NodesAddedCmd(self, node_objs, positions, pipes)
+        if push_undo:
+            self._undo_stack.push(undo_cmd)
+        else:
+            undo_cmd.redo()
+
+        # Run on_input_connected to ensure connections are fully set up
+        # after deserialization.
+        for in_port, out_port in input_connected:
+            in_port.node().on_input_connected(in_port, out_port)
 
-        node_objs = nodes.values()
         if relative_pos:
             self._viewer.move_nodes([n.view for n in node_objs])
             [setattr(n.model, 'pos', n.view.xy_pos) for n in node_objs]
@@ -1907,7 +2104,8 @@ class NodeGraph(QtCore.QObject):
         """
         if clear_session:
             self.clear_session()
-        self._deserialize(layout_data)
+        # a cleared undo stack doesn't need an undo entry for the import.
+        self._deserialize(layout_data, push_undo=not clear_undo_stack)
         self.clear_selection()
         if clear_undo_stack:
             self._undo_stack.clear()
@@ -1924,7 +2122,6 @@ class NodeGraph(QtCore.QObject):
         Args:
             file_path (str): path to the saved node layout.
         """
-        serialized_data = self.serialize_session()
         file_path = file_path.strip()
 
         def default(obj):
@@ -1933,8 +2130,8 @@ class NodeGraph(QtCore.QObject):
             return obj
 
         with open(file_path, 'w') as file_out:
-            json.dump(
-                serialized_data,
+            self._serialize_to_file(
+                self.all_nodes(),
                 file_out,
                 indent=2,
                 separators=(',', ':'),
@@ -2009,8 +2206,9 @@ class NodeGraph(QtCore.QObject):
         if not nodes:
             return False
         clipboard = QtWidgets.QApplication.clipboard()
-        serial_data = self._serialize(nodes)
-        serial_str = json.dumps(serial_data)
+        serial_str = io.StringIO()
+        self._serialize_to_file(nodes, serial_str)
+        serial_str = serial_str.getvalue()
         if serial_str:
             clipboard.setText(serial_str)
             return True
@@ -2159,68 +2357,35 @@ class NodeGraph(QtCore.QObject):
     # auto layout node functions.
     # --------------------------------------------------------------------------
 
-    @staticmethod
-    def _update_node_rank(node, nodes_rank, down_stream=True):
+    def apply_node_positions(self, nodes_pos, prev_nodes_pos=None,
+                             name='move nodes', backdrops=None):
         """
-        Recursive function for updating the node ranking.
+        Move several nodes in a single undo command.
 
         Args:
-            node (NodeGraphQt.BaseNode): node to start from.
-            nodes_rank (dict): node ranking object to be updated.
-            down_stream (bool): true to rank down stram.
+            nodes_pos (dict): {NodeGraphQt.NodeObject: (x, y)} new positions.
+            prev_nodes_pos (dict): {NodeGraphQt.NodeObject: (x, y)} positions
+                to restore on undo, defaults to the current positions.
+            name (str): undo command name.
+            backdrops (dict): {BackdropNode: [node, ...]} backdrops to wrap
+                around their nodes afterwards. (optional)
         """
-        if down_stream:
-            node_values = node.connected_output_nodes().values()
-        else:
-            node_values = node.connected_input_nodes().values()
-
-        connected_nodes = set()
-        for nodes in node_values:
-            connected_nodes.update(nodes)
-
-        rank = nodes_rank[node] + 1
-        for n in connected_nodes:
-            if n in nodes_rank:
-                nodes_rank[n] = max(nodes_rank[n], rank)
-            else:
-                nodes_rank[n] = rank
-            NodeGraph._update_node_rank(n, nodes_rank, down_stream)
+        if prev_nodes_pos is None:
+            prev_nodes_pos = {n: tuple(n.pos()) for n in nodes_pos}
+        self.begin_undo(name)
+        self._undo_stack.push(NodesMovedCmd(nodes_pos, prev_nodes_pos))
+        for backdrop, contained_nodes in (backdrops or {}).items():
+            backdrop.wrap_nodes(contained_nodes)
+        self.end_undo()
 
-    @staticmethod
-    def _compute_node_rank(nodes, down_stream=True):
+    def _create_layout_job(self, nodes, down_stream, start_nodes, mode,
+                           warm_start, animate=False, duration=300):
         """
-        Compute the ranking of nodes.
-
-        Args:
-            nodes (list[NodeGraphQt.BaseNode]): nodes to start ranking from.
-            down_stream (bool): true to compute down stream.
+        Snapshot the nodes into a layout job.
 
         Returns:
-            dict: {NodeGraphQt.BaseNode: node_rank, ...}
-        """
-        nodes_rank = {}
-        for node in nodes:
-            nodes_rank[node] = 0
-            NodeGraph._update_node_rank(node, nodes_rank, down_stream)
-        return nodes_rank
-
-    def auto_layout_nodes(self, nodes=None, down_stream=True, start_nodes=None):
-        """
-        Auto layout the nodes in the node graph.
-
-        Note:
-            If the node graph is acyclic then the ``start_nodes`` will need
-            to be specified.
-
-        Args:
-            nodes (list[NodeGraphQt.BaseNode]): list of nodes to auto layout
-                if nodes is None then all nodes is layed out.
-            down_stream (bool): false to layout up stream.
-            start_nodes (list[NodeGraphQt.BaseNode]):
-                list of nodes to start the auto layout from (Optional).
+            LayoutJob: layout job or None if there is nothing to layout.
         """
-        self.begin_undo('Auto Layout Nodes')
-
         nodes = nodes or self.all_nodes()
 
         # filter out the backdrops.
@@ -2228,77 +2393,106 @@ class NodeGraph(QtCore.QObject):
             n: n.nodes() for n in nodes if isinstance(n, BackdropNode)
         }
         filtered_nodes = [n for n in nodes if not isinstance(n, BackdropNode)]
+        if not filtered_nodes:
+            return None
+
+        snapshot = LayoutSnapshot(
+            filtered_nodes,
+            mode=self._model.layout_mode if mode is None else mode,
+            direction=self._viewer.get_layout_direction(),
+            down_stream=down_stream,
+            start_nodes=start_nodes,
+            warm_start=warm_start
+        )
+        return LayoutJob(self, snapshot, backdrops, animate, duration, self)
 
-        start_nodes = start_nodes or []
-        if down_stream:
-            start_nodes += [
-                n for n in filtered_nodes
-                if not any(n.connected_input_nodes().values())
-            ]
-        else:
-            start_nodes += [
-                n for n in filtered_nodes
-                if not any(n.connected_output_nodes().values())
-            ]
+    def _cancel_layout_job(self, *args):
+        """
+        Cancel the running layout job when the graph changes.
+        """
+        if self._layout_job is not None:
+            self._layout_job.cancel()
 
-        if not start_nodes:
-            return
+    def _on_layout_job_done(self, job):
+        if self._layout_job is job:
+            self._layout_job = None
+        job.deleteLater()
 
-        node_views = [n.view for n in nodes]
-        nodes_center_0 = self.viewer().nodes_rect_center(node_views)
+    def auto_layout_nodes(self, nodes=None, down_stream=True, start_nodes=None,
+                          mode=None, warm_start=True):
+        """
+        Auto layout the nodes in the node graph.
 
-        nodes_rank = NodeGraph._compute_node_rank(start_nodes, down_stream)
+        Nodes are arranged in layers (Sugiyama style): cycles are broken by
+        reversing back edges, nodes are ranked by their longest path and the
+        order inside each layer is improved with barycentric crossing
+        reduction. Graphs with loops are supported.
 
-        rank_map = {}
-        for node, rank in nodes_rank.items():
-            if rank in rank_map:
-                rank_map[rank].append(node)
-            else:
-                rank_map[rank] = [node]
+        With :attr:`NodeGraphQt.constants.LayoutModeEnum.FORCE_DIRECTED` the
+        nodes are instead arranged by a force directed layout that takes the
+        node sizes into account and refines the current positions.
 
-        node_layout_direction = self._viewer.get_layout_direction()
+        The new positions are applied as a single undo command.
 
-        if node_layout_direction is LayoutDirectionEnum.HORIZONTAL.value:
-            current_x = 0
-            node_height = 120
-            for rank in sorted(range(len(rank_map)), reverse=not down_stream):
-                ranked_nodes = rank_map[rank]
-                max_width = max([node.view.width for node in ranked_nodes])
-                current_x += max_width
-                current_y = 0
-                for idx, node in enumerate(ranked_nodes):
-                    dy = max(node_height, node.view.height)
-                    current_y += 0 if idx == 0 else dy
-                    node.set_pos(current_x, current_y)
-                    current_y += dy * 0.5 + 10
-
-                current_x += max_width * 0.5 + 100
-        elif node_layout_direction is LayoutDirectionEnum.VERTICAL.value:
-            current_y = 0
-            node_width = 250
-            for rank in sorted(range(len(rank_map)), reverse=not down_stream):
-                ranked_nodes = rank_map[rank]
-                max_height = max([node.view.height for node in ranked_nodes])
-                current_y += max_height
-                current_x = 0
-                for idx, node in enumerate(ranked_nodes):
-                    dx = max(node_width, node.view.width)
-                    current_x += 0 if idx == 0 else dx
-                    node.set_pos(current_x, current_y)
-                    current_x += dx * 0.5 + 10
-
-                current_y += max_height * 0.5 + 100
-
-        nodes_center_1 = self.viewer().nodes_rect_center(node_views)
-        dx = nodes_center_0[0] - nodes_center_1[0]
-        dy = nodes_center_0[1] - nodes_center_1[1]
-        [n.set_pos(n.x_pos() + dx, n.y_pos() + dy) for n in nodes]
-
-        # wrap the backdrop nodes.
-        for backdrop, contained_nodes in backdrops.items():
-            backdrop.wrap_nodes(contained_nodes)
+        See Also:
+            :meth:`NodeGraph.auto_layout_nodes_async`
 
-        self.end_undo()
+        Args:
+            nodes (list[NodeGraphQt.BaseNode]): list of nodes to auto layout
+                if nodes is None then all nodes is layed out.
+            down_stream (bool): false to layout up stream.
+            start_nodes (list[NodeGraphQt.BaseNode]):
+                list of nodes preferred as roots when breaking cycles
+                (Optional).
+            mode (int): layout mode, defaults to :meth:`NodeGraph.layout_mode`.
+            warm_start (bool): false to ignore the current positions in
+                force directed mode.
+        """
+        job = self._create_layout_job(
+            nodes, down_stream, start_nodes, mode, warm_start
+        )
+        if job is not None:
+            job.run()
+            job.deleteLater()
+
+    def auto_layout_nodes_async(self, nodes=None, down_stream=True,
+                                start_nodes=None, mode=None, warm_start=True,
+                                animate=True, duration=300):
+        """
+        Same as :meth:`NodeGraph.auto_layout_nodes` but the layout is
+        computed in a worker thread so the editor stays responsive.
+
+        A previous job that is still running gets cancelled, and the job is
+        dropped if nodes or connections change before it finishes.
+
+        Args:
+            nodes (list[NodeGraphQt.BaseNode]): list of nodes to auto layout
+                if nodes is None then all nodes is layed out.
+            down_stream (bool): false to layout up stream.
+            start_nodes (list[NodeGraphQt.BaseNode]):
+                list of nodes preferred as roots when breaking cycles
+                (Optional).
+            mode (int): layout mode, defaults to :meth:`NodeGraph.layout_mode`.
+            warm_start (bool): false to ignore the current positions in
+                force directed mode.
+            animate (bool): interpolate the nodes to their new positions.
+            duration (int): animation length in milliseconds.
+
+        Returns:
+            NodeGraphQt.base.layout_job.LayoutJob: the started job or None.
+        """
+        self._cancel_layout_job()
+        job = self._create_layout_job(
+            nodes, down_stream, start_nodes, mode, warm_start,
+            animate, duration
+        )
+        if job is None:
+            return None
+        job.finished.connect(self._on_layout_job_done)
+        job.cancelled.connect(self._on_layout_job_done)
+        self._layout_job = job
+        job.start()
+        return job
 
     # convenience dialog functions.
     # --------------------------------------------------------------------------
@@ -2651,15 +2845,19 @@ class SubGraph(NodeGraph):
 
         return input_nodes, output_nodes
 
-    def _deserialize(self, data, relative_pos=False, pos=None):
+    def _deserialize(self, data, relative_pos=False, pos=None, push_undo=True):
         """
         deserialize node data.
         (used internally by the node graph)
 
+        All the nodes and connections are added in one batch as a single
+        undo command.
+
         Args:
             data (dict): node data.
             relative_pos (bool): position node relative to the cursor.
             pos (tuple or list): custom x, y position.
+            push_undo (bool): register the command to the undo stack.
 
         Returns:
             list[NodeGraphQt.Nodes]: list of node instances.
@@ -2674,8 +2872,10 @@ class SubGraph(NodeGraph):
         # build the port input & output nodes here.
         input_nodes, output_nodes = self._build_port_nodes()
 
-        # build the nodes.
+        # build the node models.
         nodes = {}
+        new_nodes = []
+        positions = []
         for n_id, n_data in data.get('nodes', {}).items():
             identifier = n_data['type_']
             name = n_data.get('name')
@@ -2701,16 +2901,21 @@ class SubGraph(NodeGraph):
             for prop, val in n_data.get('custom', {}).items():
                 node.model.set_property(prop, val)
 
-            nodes[n_id] = node
-            self.add_node(node, n_data.get('pos'))
-
             if n_data.get('port_deletion_allowed', None):
                 node.set_ports({
                     'input_ports': n_data['input_ports'],
                     'output_ports': n_data['output_ports']
                 })
 
-        # build the connections.
+            self._prepare_node(node)
+            # register the node so the following nodes get unique names.
+            self._model.add_node(node)
+            nodes[n_id] = node
+            new_nodes.append(node)
+            positions.append(n_data.get('pos'))
+
+        # resolve the connections.
+        pipes = []
         for connection in data.get('connections', []):
             nid, pname = connection.get('in', ('', ''))
             in_node = nodes.get(nid)
@@ -2725,9 +2930,14 @@ class SubGraph(NodeGraph):
             out_port = out_node.outputs().get(pname) if out_node else None
 
             if in_port and out_port:
-                self._undo_stack.push(
-                    PortConnectedCmd(in_port, out_port, emit_signal=False)
-                )
+                pipes.append((in_port, out_port))
+
+        # add the nodes to the scene and connect them in one batch.
+        undo_cmd = NodesAddedCmd(self, new_nodes, positions, pipes)
+        if push_undo:
+            self._undo_stack.push(undo_cmd)
+        else:
+            undo_cmd.redo()
 
         node_objs = list(nodes.values())
         if relative_pos:
@@ -0,0 +1,459 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Graph layout algorithms used by :meth:`NodeGraph.auto_layout_nodes`.
+
+The functions here only work on plain hashable node keys and adjacency
+dicts (no Qt objects) so they can be reused on topology snapshots.
+"""
+
+
+def break_cycles(nodes, successors, roots=None):
+    """
+    Find the back edges of a directed graph with an iterative depth first
+    search. Reversing these edges makes the graph acyclic.
+
+    Args:
+        nodes (list): all node keys in a stable order.
+        successors (dict): {node: [successor, ...]}.
+        roots (list): nodes to start the search from first (optional).
+
+    Returns:
+        set[tuple]: back edges as ``(source, target)`` tuples, self loops
+            included.
+    """
+    on_stack, done = 1, 2
+    state = {}
+    back_edges = set()
+    for root in list(roots or []) + list(nodes):
+        if root in state:
+            continue
+        state[root] = on_stack
+        stack = [(root, iter(successors.get(root, ())))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                child_state = state.get(child)
+                if child_state is None:
+                    state[child] = on_stack
+                    stack.append((child, iter(successors.get(child, ()))))
+                    break
+                if child_state == on_stack:
+                    back_edges.add((node, child))
+            else:
+                state[node] = done
+                stack.pop()
+    return back_edges
+
+
+def acyclic_successors(nodes, successors, roots=None):
+    """
+    Build the adjacency of the graph with its back edges reversed and self
+    loops and duplicate edges removed.
+
+    Args:
+        nodes (list): all node keys in a stable order.
+        successors (dict): {node: [successor, ...]}.
+        roots (list): nodes to start the cycle search from first (optional).
+
+    Returns:
+        dict: {node: [successor, ...]} of a directed acyclic graph.
+    """
+    back_edges = break_cycles(nodes, successors, roots)
+    dag = {node: {} for node in nodes}
+    for node in nodes:
+        for child in successors.get(node, ()):
+            if child == node or child not in dag:
+                continue
+            if (node, child) in back_edges:
+                dag[child][node] = None
+            else:
+                dag[node][child] = None
+    return {node: list(children) for node, children in dag.items()}
+
+
+def longest_path_ranks(nodes, successors):
+    """
+    Rank the nodes of a directed acyclic graph by their longest path from a
+    source node in O(V + E).
+
+    Args:
+        nodes (list): all node keys in a stable order.
+        successors (dict): {node: [successor, ...]} (must be acyclic).
+
+    Returns:
+        dict: {node: rank, ...} ordered topologically.
+    """
+    in_degree = {node: 0 for node in nodes}
+    for node in nodes:
+        for child in successors[node]:
+            in_degree[child] += 1
+
+    queue = [node for node in nodes if in_degree[node] == 0]
+    ranks = dict.fromkeys(queue, 0)
+    index = 0
+    while index < len(queue):
+        node = queue[index]
+        index += 1
+        rank = ranks[node] + 1
+        for child in successors[node]:
+            if ranks.get(child, -1) < rank:
+                ranks[child] = rank
+            in_degree[child] -= 1
+            if in_degree[child] == 0:
+                queue.append(child)
+    return {node: ranks[node] for node in queue}
+
+
+def reduce_crossings(layers, successors, predecessors, iterations=4):
+    """
+    Reorder the nodes inside each layer with the barycenter heuristic,
+    alternating downward and upward sweeps.
+
+    Args:
+        layers (list[list]): nodes per rank, modified in place.
+        successors (dict): {node: [successor, ...]}.
+        predecessors (dict): {node: [predecessor, ...]}.
+        iterations (int): number of down + up sweep pairs.
+    """
+    position = {}
+    for layer in layers:
+        for idx, node in enumerate(layer):
+            position[node] = idx
+
+    def sweep(layer_indices, neighbours):
+        for layer_idx in layer_indices:
+            layer = layers[layer_idx]
+            barycenters = {}
+            for node in layer:
+                linked = neighbours[node]
+                if linked:
+                    barycenters[node] = (
+                        sum(position[n] for n in linked) / len(linked)
+                    )
+                else:
+                    barycenters[node] = position[node]
+            layer.sort(key=barycenters.__getitem__)
+            for idx, node in enumerate(layer):
+                position[node] = idx
+
+    for _ in range(iterations):
+        sweep(range(1, len(layers)), predecessors)
+        sweep(range(len(layers) - 2, -1, -1), successors)
+
+
+def layered_layout(nodes, successors, down_stream=True, start_nodes=None,
+                   iterations=4):
+    """
+    Sugiyama style layering of a directed graph that may contain cycles.
+
+    Cycles are broken by reversing back edges, nodes are ranked by their
+    longest path and the order inside each rank is improved with barycentric
+    crossing reduction.
+
+    Args:
+        nodes (list): all node keys in a stable order.
+        successors (dict): {node: [successor, ...]}.
+        down_stream (bool): false to rank from the sink nodes so they all
+            line up in the last layer.
+        start_nodes (list): nodes preferred as roots when breaking cycles.
+        iterations (int): crossing reduction sweep pairs.
+
+    Returns:
+        list[list]: nodes per layer, first layer first.
+    """
+    nodes = list(nodes)
+    dag = acyclic_successors(nodes, successors, start_nodes)
+    predecessors = {node: [] for node in nodes}
+    for node in nodes:
+        for child in dag[node]:
+            predecessors[child].append(node)
+
+    if down_stream:
+        ranks = longest_path_ranks(nodes, dag)
+    else:
+        ranks = longest_path_ranks(nodes, predecessors)
+        last_rank = max(ranks.values(), default=0)
+        ranks = {node: last_rank - rank for node, rank in ranks.items()}
+
+    layers = [[] for _ in range(max(ranks.values(), default=-1) + 1)]
+    for node, rank in ranks.items():
+        layers[rank].append(node)
+    reduce_crossings(layers, dag, predecessors, iterations)
+    return layers
+
+
+def layered_positions(layers, sizes, horizontal=True):
+    """
+    Compute the node positions for the layers from :func:`layered_layout`.
+
+    Args:
+        layers (list[list]): nodes per layer.
+        sizes (dict): {node: (width, height)}.
+        horizontal (bool): false to stack the layers top to bottom.
+
+    Returns:
+        dict: {node: (x, y)} top left positions.
+    """
+    positions = {}
+    if horizontal:
+        current_x = 0
+        node_height = 120
+        for ranked_nodes in layers:
+            max_width = max([sizes[node][0] for node in ranked_nodes])
+            current_x += max_width
+            current_y = 0
+            for idx, node in enumerate(ranked_nodes):
+                dy = max(node_height, sizes[node][1])
+                current_y += 0 if idx == 0 else dy
+                positions[node] = (current_x, current_y)
+                current_y += dy * 0.5 + 10
+
+            current_x += max_width * 0.5 + 100
+    else:
+        current_y = 0
+        node_width = 250
+        for ranked_nodes in layers:
+            max_height = max([sizes[node][1] for node in ranked_nodes])
+            current_y += max_height
+            current_x = 0
+            for idx, node in enumerate(ranked_nodes):
+                dx = max(node_width, sizes[node][0])
+                current_x += 0 if idx == 0 else dx
+                positions[node] = (current_x, current_y)
+                current_x += dx * 0.5 + 10
+
+            current_y += max_height * 0.5 + 100
+    return positions
+
+
+def rect_center(positions, sizes):
+    """
+    Get the center of the rectangle around the nodes.
+
+    Args:
+        positions (dict): {node: (x, y)} top left positions.
+        sizes (dict): {node: (width, height)}.
+
+    Returns:
+        tuple[float, float]: x, y center.
+    """
+    if not positions:
+        return 0.0, 0.0
+    left = min(x for x, _ in positions.values())
+    top = min(y for _, y in positions.values())
+    right = max(x + sizes[n][0] for n, (x, _) in positions.items())
+    bottom = max(y + sizes[n][1] for n, (_, y) in positions.items())
+    return (left + right) * 0.5, (top + bottom) * 0.5
+
+
+def _grid_pairs(np, centers, cell_size):
+    """
+    Find the pairs of nodes in the same or neighbouring grid cells, each
+    pair is only returned once.
+
+    Args:
+        np (module): numpy.
+        centers (numpy.ndarray): (n, 2) node centers.
+        cell_size (float): grid cell size, the repulsion cut off distance.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: node indices ``(i, j)``.
+    """
+    cells = np.floor((centers - centers.min(axis=0)) / cell_size).astype(np.int64)
+    columns = int(cells[:, 1].max()) + 3
+    keys = (cells[:, 0] + 1) * columns + cells[:, 1] + 1
+    order = np.argsort(keys, kind='stable')
+    cell_keys, starts, counts = np.unique(
+        keys[order], return_index=True, return_counts=True
+    )
+    indices = np.arange(len(centers))
+    pairs_i, pairs_j = [], []
+    # half of the neighbourhood so every pair of cells is visited once.
+    for dx, dy in ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1)):
+        neighbour = keys + dx * columns + dy
+        slot = np.searchsorted(cell_keys, neighbour)
+        slot = np.minimum(slot, len(cell_keys) - 1)
+        found = cell_keys[slot] == neighbour
+        node_i = indices[found]
+        start = starts[slot[found]]
+        count = counts[slot[found]]
+        total = int(count.sum())
+        if not total:
+            continue
+        rep_i = np.repeat(node_i, count)
+        offset = np.arange(total) - np.repeat(np.cumsum(count) - count, count)
+        rep_j = order[np.repeat(start, count) + offset]
+        keep = rep_i < rep_j if dx == dy == 0 else slice(None)
+        pairs_i.append(rep_i[keep])
+        pairs_j.append(rep_j[keep])
+    if not pairs_i:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+    return np.concatenate(pairs_i), np.concatenate(pairs_j)
+
+
+def _remove_overlaps(np, centers, size, margin, passes=20):
+    """
+    Push overlapping node rectangles apart along their axis of least overlap.
+
+    Args:
+        np (module): numpy.
+        centers (numpy.ndarray): (n, 2) node centers, modified in place.
+        size (numpy.ndarray): (n, 2) node widths and heights.
+        margin (float): minimum gap between nodes.
+        passes (int): maximum number of passes.
+    """
+    half = 0.5 * size + 0.5 * margin
+    cell_size = 2.0 * float(half.max())
+    count = len(centers)
+    for _ in range(passes):
+        pair_i, pair_j = _grid_pairs(np, centers, cell_size)
+        delta = centers[pair_i] - centers[pair_j]
+        overlap = half[pair_i] + half[pair_j] - np.abs(delta)
+        hit = (overlap[:, 0] > 0) & (overlap[:, 1] > 0)
+        if not hit.any():
+            return
+        pair_i, pair_j = pair_i[hit], pair_j[hit]
+        delta, overlap = delta[hit], overlap[hit]
+        axis = np.argmin(overlap, axis=1)
+        rows = np.arange(len(axis))
+        sign = np.where(delta[rows, axis] >= 0, 1.0, -1.0)
+        push = np.zeros_like(delta)
+        push[rows, axis] = 0.5 * overlap[rows, axis] * sign
+        for dim in (0, 1):
+            shift = np.bincount(pair_i, push[:, dim], minlength=count)
+            shift -= np.bincount(pair_j, push[:, dim], minlength=count)
+            centers[:, dim] += shift
+
+
+def force_directed_layout(nodes, successors, sizes, positions=None,
+                          iterations=None, spacing=60.0, seed=0,
+                          should_stop=None):
+    """
+    Fruchterman-Reingold force directed layout vectorised with numpy.
+
+    Repulsion is only computed between nodes in neighbouring grid cells
+    (the grid variant of the algorithm) with a weak pull to the centroid
+    keeping disconnected parts together. Distances are measured between node
+    outlines so large nodes get more room. A cold start begins from the
+    layered layout so fewer steps are needed.
+
+    Args:
+        nodes (list): all node keys in a stable order.
+        successors (dict): {node: [successor, ...]}, treated as undirected.
+        sizes (dict): {node: (width, height)}.
+        positions (dict): {node: (x, y)} top left positions to warm start
+            from, nodes missing from it are placed near the middle. When
+            ``None`` or most nodes share a position the layout starts from
+            the layered layout. (optional)
+        iterations (int): number of steps, defaults to 50 for a cold start
+            and 20 for a warm start.
+        spacing (float): preferred gap between connected nodes.
+        seed (int): random seed for jittering the initial positions.
+        should_stop (callable): polled every step, returning true aborts
+            the layout. (optional)
+
+    Returns:
+        dict: {node: (x, y)} top left positions or None if aborted.
+    """
+    import numpy as np
+
+    nodes = list(nodes)
+    count = len(nodes)
+    if not count:
+        return {}
+    index = {node: idx for idx, node in enumerate(nodes)}
+    size = np.array([sizes[node] for node in nodes], dtype=float).reshape(count, 2)
+    radius = 0.5 * np.hypot(size[:, 0], size[:, 1])
+    mean_radius = float(radius.mean())
+    k = 2.0 * mean_radius + spacing
+
+    rng = np.random.default_rng(seed)
+    centers = None
+    if positions:
+        known = [index[node] for node in nodes if node in positions]
+        # stacked nodes (e.g. all freshly created at the origin) are no
+        # useful starting point.
+        distinct = {tuple(positions[nodes[idx]]) for idx in known}
+        if len(distinct) * 2 > len(known):
+            known_pos = np.array(
+                [positions[nodes[idx]] for idx in known], dtype=float
+            ) + 0.5 * size[known]
+            centers = known_pos.mean(axis=0) + rng.uniform(-k, k, (count, 2))
+            centers[known] = known_pos
+    warm = centers is not None
+    if not warm:
+        centers = np.zeros((count, 2))
+        for rank, layer in enumerate(layered_layout(nodes, successors)):
+            for row, node in enumerate(layer):
+                centers[index[node]] = (rank * k, (row - 0.5 * len(layer)) * k)
+        centers += rng.uniform(-0.1 * k, 0.1 * k, (count, 2))
+    if iterations is None:
+        iterations = 20 if warm else 50
+
+    edge_i, edge_j = [], []
+    for node in nodes:
+        for child in successors.get(node, ()):
+            if child != node and child in index:
+                edge_i.append(index[node])
+                edge_j.append(index[child])
+    edge_i = np.array(edge_i, dtype=np.int64)
+    edge_j = np.array(edge_j, dtype=np.int64)
+
+    # nodes bigger than average are pushed apart from further away.
+    cut_off = 1.5 * k
+    cell_size = cut_off + 2.0 * (float(radius.max()) - mean_radius)
+    gravity = 0.1 / np.sqrt(count)
+    temperature = k if warm else 0.1 * k * np.sqrt(count)
+    min_gap = 0.01 * k
+
+    for step in range(iterations):
+        if should_stop is not None and should_stop():
+            return None
+        force = np.zeros((count, 2))
+
+        pair_i, pair_j = _grid_pairs(np, centers, cell_size)
+        if len(pair_i):
+            delta = centers[pair_i] - centers[pair_j]
+            dist = np.hypot(delta[:, 0], delta[:, 1])
+            # coincident nodes get a random push direction.
+            same = dist < 1e-9
+            if same.any():
+                delta[same] = rng.uniform(-1.0, 1.0, (int(same.sum()), 2))
+                dist[same] = np.hypot(delta[same, 0], delta[same, 1])
+            gap = dist - radius[pair_i] - radius[pair_j] + 2.0 * mean_radius
+            np.maximum(gap, min_gap, out=gap)
+            strength = np.where(gap < cut_off, k * k / gap, 0.0) / dist
+            push_x = delta[:, 0] * strength
+            push_y = delta[:, 1] * strength
+            force[:, 0] += np.bincount(pair_i, push_x, minlength=count)
+            force[:, 1] += np.bincount(pair_i, push_y, minlength=count)
+            force[:, 0] -= np.bincount(pair_j, push_x, minlength=count)
+            force[:, 1] -= np.bincount(pair_j, push_y, minlength=count)
+
+        if len(edge_i):
+            delta = centers[edge_j] - centers[edge_i]
+            dist = np.maximum(np.hypot(delta[:, 0], delta[:, 1]), 1e-9)
+            gap = dist - radius[edge_i] - radius[edge_j] + 2.0 * mean_radius
+            np.maximum(gap, 0.0, out=gap)
+            strength = gap * gap / k / dist
+            pull_x = delta[:, 0] * strength
+            pull_y = delta[:, 1] * strength
+            force[:, 0] += np.bincount(edge_i, pull_x, minlength=count)
+            force[:, 1] += np.bincount(edge_i, pull_y, minlength=count)
+            force[:, 0] -= np.bincount(edge_j, pull_x, minlength=count)
+            force[:, 1] -= np.bincount(edge_j, pull_y, minlength=count)
+
+        force -= gravity * (centers - centers.mean(axis=0))
+
+        length = np.maximum(np.hypot(force[:, 0], force[:, 1]), 1e-9)
+        step_size = temperature * (1.0 - step / iterations)
+        centers += force * (np.minimum(length, step_size) / length)[:, None]
+
+    _remove_overlaps(np, centers, size, 0.25 * spacing)
+    top_left = centers - 0.5 * size
+    return {
+        node: (float(top_left[idx, 0]), float(top_left[idx, 1]))
+        for idx, node in enumerate(nodes)
+    }
@@ -0,0 +1,259 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+import threading
+
+from Qt import QtCore
+
+from NodeGraphQt.base.layout import (force_directed_layout,
+                                     layered_layout,
+                                     layered_positions,
+                                     rect_center)
+from NodeGraphQt.constants import LayoutDirectionEnum, LayoutModeEnum
+
+
+def layout_topology(nodes):
+    """
+    Collect the downstream connections between the given nodes.
+
+    Args:
+        nodes (list[NodeGraphQt.BaseNode]): nodes to layout.
+
+    Returns:
+        dict: {node_id: [node_id, ...]}
+    """
+    node_ids = {n.id for n in nodes}
+    successors = {}
+    for node in nodes:
+        children = {}
+        for connected in node.connected_output_nodes().values():
+            for child in connected:
+                if child.id in node_ids:
+                    children[child.id] = None
+        successors[node.id] = list(children)
+    return successors
+
+
+class LayoutSnapshot(object):
+    """
+    Plain data copy of the nodes to layout (ids, connections, sizes and
+    positions) that can be computed on in a worker thread.
+
+    Args:
+        nodes (list[NodeGraphQt.BaseNode]): nodes to layout.
+        mode (int): :attr:`NodeGraphQt.constants.LayoutModeEnum` value.
+        direction (int): :attr:`NodeGraphQt.constants.LayoutDirectionEnum`
+            value.
+        down_stream (bool): false to layout up stream.
+        start_nodes (list[NodeGraphQt.BaseNode]): preferred start nodes.
+        warm_start (bool): false to ignore the current positions in force
+            directed mode.
+    """
+
+    def __init__(self, nodes, mode=LayoutModeEnum.LAYERED.value,
+                 direction=LayoutDirectionEnum.HORIZONTAL.value,
+                 down_stream=True, start_nodes=None, warm_start=True):
+        self.node_ids = [n.id for n in nodes]
+        self.successors = layout_topology(nodes)
+        # nodes without node item are measured by the node graph.
+        self.sizes = {
+            n.id: (n.view.width, n.view.height) if n.has_view()
+            else (n.model.width, n.model.height)
+            for n in nodes
+        }
+        self.positions = {n.id: tuple(n.pos()) for n in nodes}
+        self.mode = mode
+        self.direction = direction
+        self.down_stream = down_stream
+        self.start_ids = [n.id for n in start_nodes or []]
+        self.warm_start = warm_start
+
+    def is_current(self, nodes):
+        """
+        Check the nodes still have the topology captured in the snapshot.
+
+        Args:
+            nodes (list[NodeGraphQt.BaseNode]): current nodes, ``None``
+                entries for deleted nodes.
+
+        Returns:
+            bool: false if the snapshot is stale.
+        """
+        if any(n is None for n in nodes):
+            return False
+        current = layout_topology(nodes)
+        if current.keys() != self.successors.keys():
+            return False
+        return all(set(current[node_id]) == set(children)
+                   for node_id, children in self.successors.items())
+
+    def compute(self, should_stop=None):
+        """
+        Compute the layout, safe to call from a worker thread.
+
+        The result is moved so its center matches the center of the
+        current positions.
+
+        Args:
+            should_stop (callable): returns true to abort. (optional)
+
+        Returns:
+            dict: {node_id: (x, y)} new positions or None if aborted.
+        """
+        if self.mode == LayoutModeEnum.FORCE_DIRECTED.value:
+            positions = force_directed_layout(
+                self.node_ids, self.successors, self.sizes,
+                self.positions if self.warm_start else None,
+                should_stop=should_stop
+            )
+            if positions is None:
+                return None
+        else:
+            layers = layered_layout(
+                self.node_ids, self.successors, self.down_stream,
+                self.start_ids
+            )
+            horizontal = self.direction != LayoutDirectionEnum.VERTICAL.value
+            positions = layered_positions(layers, self.sizes, horizontal)
+
+        center_0 = rect_center(self.positions, self.sizes)
+        center_1 = rect_center(positions, self.sizes)
+        dx = center_0[0] - center_1[0]
+        dy = center_0[1] - center_1[1]
+        return {node_id: (x + dx, y + dy)
+                for node_id, (x, y) in positions.items()}
+
+
+class LayoutJob(QtCore.QObject):
+    """
+    Computes a :class:`LayoutSnapshot` in a worker thread and applies the
+    result to the node graph as one undo command, optionally animated.
+
+    The job is dropped without touching the graph when it is cancelled or
+    the nodes changed while it was running.
+    """
+
+    #: emitted with the job once the layout was applied.
+    finished = QtCore.Signal(object)
+    #: emitted with the job when it was cancelled or went stale.
+    cancelled = QtCore.Signal(object)
+
+    # worker thread -> GUI thread.
+    _computed = QtCore.Signal(object)
+
+    def __init__(self, graph, snapshot, backdrops=None, animate=False,
+                 duration=300, parent=None):
+        """
+        Args:
+            graph (NodeGraphQt.NodeGraph): node graph.
+            snapshot (LayoutSnapshot): nodes to layout.
+            backdrops (dict): {BackdropNode: [node, ...]} backdrops to wrap
+                around their nodes afterwards. (optional)
+            animate (bool): interpolate the nodes to their new positions.
+            duration (int): animation length in milliseconds.
+            parent (QtCore.QObject): object parent.
+        """
+        super(LayoutJob, self).__init__(parent)
+        self._graph = graph
+        self._snapshot = snapshot
+        self._backdrops = backdrops or {}
+        self._animate = animate
+        self._duration = duration
+        self._stop = threading.Event()
+        self._thread = None
+        self._timeline = None
+        self._target = {}
+        self._start = {}
+        self._computed.connect(self._on_computed)
+
+    def start(self):
+        """
+        Start computing the layout in a worker thread.
+        """
+        self._thread = threading.Thread(
+            target=self._run, name='LayoutJob', daemon=True
+        )
+        self._thread.start()
+
+    def run(self):
+        """
+        Compute and apply the layout on the calling (GUI) thread.
+        """
+        self._apply(self._snapshot.compute(), animate=False)
+
+    def cancel(self):
+        """
+        Cancel the job, a running animation jumps to its end.
+        """
+        if self._timeline is not None:
+            self._timeline.stop()
+            self._finish_animation()
+            return
+        if not self._stop.is_set():
+            self._stop.set()
+            self.cancelled.emit(self)
+
+    def is_cancelled(self):
+        """
+        Returns:
+            bool: true if the job was cancelled.
+        """
+        return self._stop.is_set()
+
+    def _run(self):
+        positions = self._snapshot.compute(should_stop=self._stop.is_set)
+        if positions is not None and not self._stop.is_set():
+            self._computed.emit(positions)
+
+    def _on_computed(self, positions):
+        if self._stop.is_set():
+            return
+        self._apply(positions, self._animate)
+
+    def _apply(self, positions, animate):
+        nodes = [self._graph.get_node_by_id(node_id)
+                 for node_id in self._snapshot.node_ids]
+        if positions is None or not self._snapshot.is_current(nodes):
+            # the graph changed while the layout was computed.
+            self.cancel()
+            return
+        self._target = {n: positions[n.id] for n in nodes}
+        self._start = {n: tuple(n.pos()) for n in nodes}
+        if not animate or self._duration <= 0:
+            self._commit()
+            return
+        self._timeline = QtCore.QTimeLine(self._duration, self)
+        self._timeline.setUpdateInterval(16)
+        self._timeline.valueChanged.connect(self._on_animation_step)
+        self._timeline.finished.connect(self._finish_animation)
+        self._timeline.start()
+
+    def _on_animation_step(self, value):
+        # only the views move, the model is updated by the undo command.
+        # (nodes without node item are moved by the command)
+        for node, (x1, y1) in self._target.items():
+            if not node.has_view():
+                continue
+            x0, y0 = self._start[node]
+            node.view.xy_pos = [x0 + (x1 - x0) * value,
+                                y0 + (y1 - y0) * value]
+
+    def _finish_animation(self):
+        self._timeline = None
+        alive = self._graph.model.nodes
+        for node in list(self._target):
+            if node.id not in alive:
+                del self._target[node]
+                del self._start[node]
+        self._commit()
+
+    def _commit(self):
+        alive = self._graph.model.nodes
+        backdrops = {
+            backdrop: [n for n in contained_nodes if n and n.id in alive]
+            for backdrop, contained_nodes in self._backdrops.items()
+            if backdrop.id in alive
+        }
+        self._graph.apply_node_positions(
+            self._target, self._start, 'Auto Layout Nodes', backdrops
+        )
+        self.finished.emit(self)
@@ -1,9 +1,12 @@
 #!/usr/bin/python
 import json
+import re
 from collections import defaultdict
 
+from NodeGraphQt.base.reachability import ReachabilityIndex
 from NodeGraphQt.constants import (
     LayoutDirectionEnum,
+    LayoutModeEnum,
     NodePropWidgetEnum,
     PipeLayoutEnum
 )
@@ -120,6 +123,14 @@ class NodeModel(object):
         return '<{}(\'{}\') object at {}>'.format(
             self.__class__.__name__, self.name, self.id)
 
+    def __setattr__(self, name, value):
+        # keep the graph model name index up to date on rename.
+        if name == 'name':
+            graph_model = self.__dict__.get('_graph_model')
+            if graph_model is not None:
+                graph_model.rename_node(self.__dict__.get('id'), value)
+        object.__setattr__(self, name, value)
+
     def add_property(self, name, value, items=None, range=None,
                      widget_type=None, widget_tooltip=None, tab=None):
         """
@@ -450,12 +461,143 @@ class NodeGraphModel(object):
         self.reject_connection_types = {}
 
         self.nodes = {}
+        # node name index {name: {node_id: None}} and unique name counters
+        # {base name: next number to try}, see "unique_name()".
+        self._name_index = {}
+        self._node_names = {}
+        self._name_counters = {}
+        # node connections for the acyclic checks and cycle listings.
+        self.reachability = ReachabilityIndex()
         self.session = ''
         self.acyclic = True
         self.pipe_collision = False
         self.pipe_slicing = True
+        self.virtualized = False
         self.pipe_style = PipeLayoutEnum.CURVED.value
         self.layout_direction = LayoutDirectionEnum.HORIZONTAL.value
+        self.layout_mode = LayoutModeEnum.LAYERED.value
+
+    # matches the trailing number of node names like "foo 12".
+    _NAME_VERSION_REGEX = re.compile(r'\w+ (\d+)$')
+
+    def add_node(self, node):
+        """
+        Register a node in the model and the name index.
+
+        Args:
+            node (NodeGraphQt.NodeObject): node object.
+        """
+        if node.id in self.nodes:
+            self._unindex_name(node.id)
+        self.nodes[node.id] = node
+        self._index_name(node.id, node.model.name)
+        self.reachability.add_node(node.id)
+
+    def remove_node(self, node_id):
+        """
+        Remove a node from the model and the name index.
+
+        Args:
+            node_id (str): node id.
+
+        Returns:
+            NodeGraphQt.NodeObject: removed node or None.
+        """
+        node = self.nodes.pop(node_id, None)
+        if node is not None:
+            self._unindex_name(node_id)
+            self.reachability.remove_node(node_id)
+        return node
+
+    def clear_nodes(self):
+        """
+        Remove all the nodes from the model and reset the name index.
+        """
+        self.nodes = {}
+        self._name_index = {}
+        self._node_names = {}
+        self._name_counters = {}
+        self.reachability.clear()
+
+    def rename_node(self, node_id, name):
+        """
+        Update the name index, called when a node model name is set.
+
+        Args:
+            node_id (str): node id.
+            name (str): new node name.
+        """
+        if node_id not in self._node_names:
+            return
+        self._unindex_name(node_id)
+        self._index_name(node_id, name)
+
+    def node_ids_by_name(self, name):
+        """
+        Returns the ids of the nodes with the name.
+
+        Args:
+            name (str): node name.
+
+        Returns:
+            list[str]: node ids in the order the nodes were named.
+        """
+        return list(self._name_index.get(name, ()))
+
+    def unique_name(self, name):
+        """
+        Returns a node name that's not taken yet, ``"name"`` itself or
+        ``"name <number>"`` with the lowest free number.
+
+        Args:
+            name (str): node name.
+
+        Returns:
+            str: unique node name.
+        """
+        name = ' '.join(name.split())
+        if name not in self._name_index:
+            return name
+
+        search = self._NAME_VERSION_REGEX.search(name)
+        if search:
+            version = search.group(1)
+            name = name[:len(version) * -1].strip()
+
+        # every number below the counter is taken.
+        x = self._name_counters.get(name, 1)
+        new_name = '{} {}'.format(name, x)
+        while new_name in self._name_index:
+            x += 1
+            new_name = '{} {}'.format(name, x)
+        self._name_counters[name] = x
+        return new_name
+
+    def _index_name(self, node_id, name):
+        self._node_names[node_id] = name
+        self._name_index.setdefault(name, {})[node_id] = None
+
+    def _unindex_name(self, node_id):
+        name = self._node_names.pop(node_id, None)
+        if name is None:
+            return
+        node_ids = self._name_index.get(name)
+        if node_ids is not None:
+            node_ids.pop(node_id, None)
+            if node_ids:
+                return
+            del self._name_index[name]
+
+        # the name was freed, lower the counter to keep the lowest free
+        # number reachable.
+        search = self._NAME_VERSION_REGEX.search(name)
+        if not search:
+            return
+        version = search.group(1)
+        base_name = name[:len(version) * -1].strip()
+        counter = self._name_counters.get(base_name)
+        if counter is not None and int(version) < counter:
+            self._name_counters[base_name] = int(version)
 
     def common_properties(self):
         """
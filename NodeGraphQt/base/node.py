@@ -74,6 +74,11 @@ class NodeObject(object):
     :meta hide-value:
     """
 
+    # set by the node graph while it creates the nodes of a virtualized
+    # scene, the node item is then only created once it's needed.
+    # (see "NodeObject.create_view()")
+    _defer_view = False
+
     def __init__(self, qgraphics_item=None):
         """
         Args:
@@ -90,11 +95,12 @@ class NodeObject(object):
                 'No qgraphics item specified for the node object!'
             )
 
-        self._view = _NodeItem()
-        self._view.type_ = self.type_
-        self._view.name = self.model.name
-        self._view.id = self._model.id
-        self._view.layout_direction = self._model.layout_direction
+        self._view_cls = _NodeItem
+        self._view = None
+        # functions called with the node item once it's created.
+        self._view_setup = []
+        if not NodeObject._defer_view:
+            self.create_view()
 
     def __repr__(self):
         return '<{}("{}") object at {}>'.format(
@@ -139,8 +145,68 @@ class NodeObject(object):
         Returns:
             NodeGraphQt.qgraphics.node_abstract.AbstractNodeItem: node item.
         """
+        if self._view is None:
+            return self.create_view()
         return self._view
 
+    def has_view(self):
+        """
+        Returns false while the creation of the node item is deferred.
+
+        See Also:
+            :meth:`NodeObject.create_view`
+
+        Returns:
+            bool: true if the node item has been created.
+        """
+        return self._view is not None
+
+    def create_view(self):
+        """
+        Create the node item if it hasn't been created yet.
+
+        In virtualized mode (see :meth:`NodeGraph.set_virtualized`) the
+        nodes created by the node graph get their node item once they're
+        near the viewport or when :attr:`NodeObject.view` is first read.
+
+        Returns:
+            NodeGraphQt.qgraphics.node_abstract.AbstractNodeItem: node item.
+        """
+        if self._view is not None:
+            return self._view
+        self._view = self._view_cls()
+        self._view.type_ = self.type_
+        self._view.name = self.model.name
+        self._view.id = self._model.id
+        self._view.layout_direction = self._model.layout_direction
+        setup, self._view_setup = self._view_setup, []
+        for func in setup:
+            func(self._view)
+
+        if self._graph is None:
+            return self._view
+        # not "self.update()" as the node only got its item.
+        self._update_view()
+        viewer = self._graph.viewer()
+        if viewer.is_deferred_node(self):
+            viewer.remove_deferred_node(self)
+            viewer.add_node(self._view, self.model.pos)
+            self.model.width = self._view.width
+            self.model.height = self._view.height
+        return self._view
+
+    def _setup_view(self, func):
+        """
+        Call the function with the node item now or once it's created.
+
+        Args:
+            func (function): function taking the node item.
+        """
+        if self._view is None:
+            self._view_setup.append(func)
+        else:
+            func(self._view)
+
     def set_view(self, item):
         """
         Set a new ``QGraphicsItem`` item to be used as the view.
@@ -192,6 +258,9 @@ class NodeObject(object):
         """
         Update the node model from view.
         """
+        if self._view is None:
+            # nothing changed on the node item yet.
+            return
         for name, val in self.view.properties.items():
             if name in self.model.properties.keys():
                 setattr(self.model, name, val)
@@ -202,9 +271,15 @@ class NodeObject(object):
         """
         Update the node view from model.
         """
+        if self._view is None:
+            # updated from the model once it's created.
+            return
+        self._update_view()
+
+    def _update_view(self):
         settings = self.model.to_dict[self.model.id]
         settings['id'] = self.model.id
-        self.view.from_dict(settings)
+        self._view.from_dict(settings)
 
     def serialize(self):
         """
@@ -309,7 +384,8 @@ class NodeObject(object):
         Returns:
             bool: True if the node is selected.
         """
-        self.model.selected = self.view.isSelected()
+        if self._view is not None:
+            self.model.selected = self._view.isSelected()
         return self.model.selected
 
     def set_selected(self, selected=True):
@@ -375,8 +451,8 @@ class NodeObject(object):
         Returns:
             object: property data.
         """
-        if self.graph and name == 'selected':
-            self.model.set_property(name, self.view.selected)
+        if self.graph and name == 'selected' and self._view is not None:
+            self.model.set_property(name, self._view.selected)
 
         return self.model.get_property(name)
 
@@ -491,8 +567,9 @@ class NodeObject(object):
         Returns:
             list[float, float]: x, y position.
         """
-        if self.view.xy_pos and self.view.xy_pos != self.model.pos:
-            self.model.pos = self.view.xy_pos
+        if self._view is not None and self._view.xy_pos and \
+                self._view.xy_pos != self.model.pos:
+            self.model.pos = self._view.xy_pos
 
         return self.model.pos
 
@@ -526,4 +603,5 @@ class NodeObject(object):
             value (int): layout direction mode.
         """
         self.model.layout_direction = value
-        self.view.layout_direction = value
+        if self._view is not None:
+            self._view.layout_direction = value
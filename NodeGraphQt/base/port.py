@@ -28,12 +28,16 @@ class Port(object):
 
     Args:
         node (NodeGraphQt.NodeObject): parent node.
-        port (PortItem): graphic item used for drawing.
+        port (PortItem): graphic item used for drawing, ``None`` while the
+            node item hasn't been created (see :meth:`NodeObject.create_view`).
     """
 
     def __init__(self, node, port):
         self.__view = port
         self.__model = PortModel(node)
+        # connected Port objects, kept in sync with "model.connected_ports"
+        # by the PortConnectedCmd and PortDisconnectedCmd commands.
+        self.__peers = ()
 
     def __repr__(self):
         port = str(self.__class__.__name__)
@@ -48,8 +52,20 @@ class Port(object):
         Returns:
             NodeGraphQt.qgraphics.port.PortItem: port item.
         """
+        if self.__view is None:
+            # the port item is added with the node item.
+            self.node().create_view()
         return self.__view
 
+    def _set_view(self, port):
+        """
+        Set the port item once the node item has been created.
+
+        Args:
+            port (PortItem): port item.
+        """
+        self.__view = port
+
     @property
     def model(self):
         """
@@ -199,16 +215,60 @@ class Port(object):
         Returns:
             list[NodeGraphQt.Port]: list of connected ports.
         """
-        ports = []
-        graph = self.node().graph
-        for node_id, port_names in self.model.connected_ports.items():
-            for port_name in port_names:
-                node = graph.get_node_by_id(node_id)
-                if self.type_() == PortTypeEnum.IN.value:
-                    ports.append(node.outputs()[port_name])
-                elif self.type_() == PortTypeEnum.OUT.value:
-                    ports.append(node.inputs()[port_name])
-        return ports
+        return list(self.__peers)
+
+    def peer_ports(self):
+        """
+        Returns all connected ports without copying, use this on hot paths
+        that only read the connections.
+
+        Returns:
+            tuple[NodeGraphQt.Port]: connected ports (read only).
+        """
+        return self.__peers
+
+    def _add_peer(self, port):
+        """
+        Add a connected port to the adjacency.
+        (used internally by the port connection commands)
+
+        Args:
+            port (NodeGraphQt.Port): connected port.
+        """
+        self.__peers += (port,)
+
+    def _remove_peer(self, port):
+        """
+        Remove a connected port from the adjacency.
+        (used internally by the port connection commands)
+
+        Args:
+            port (NodeGraphQt.Port): disconnected port.
+        """
+        peers = self.__peers
+        for i, peer in enumerate(peers):
+            if peer is port:
+                self.__peers = peers[:i] + peers[i + 1:]
+                return
+
+    def _acyclic_check(self, port):
+        """
+        Validate the connection to the port doesn't make the nodes loop,
+        checked on the graph model so deferred node items aren't built.
+        (same as "NodeViewer.acyclic_check()")
+
+        Args:
+            port (NodeGraphQt.Port): port object.
+
+        Returns:
+            bool: True if port connection is valid.
+        """
+        if port.type_() == PortTypeEnum.IN.value:
+            out_id, in_id = self.node().id, port.node().id
+        else:
+            out_id, in_id = port.node().id, self.node().id
+        reachability = self.node().graph.model.reachability
+        return reachability.accepts_edge(out_id, in_id)
 
     def connect_to(self, port=None, push_undo=True, emit_signal=True):
         """
@@ -223,7 +283,7 @@ class Port(object):
         if not port:
             return
 
-        if self in port.connected_ports():
+        if self in port.peer_ports():
             return
 
         if self.locked() or port.locked():
@@ -261,7 +321,6 @@ class Port(object):
 
         # make the connection from here.
         graph = self.node().graph
-        viewer = graph.viewer()
 
         if push_undo:
             undo_stack = graph.undo_stack()
@@ -285,7 +344,7 @@ class Port(object):
                     NodeInputDisconnectedCmd(self, port).redo()
             return
 
-        if graph.acyclic() and viewer.acyclic_check(self.view, port.view):
+        if graph.acyclic() and self._acyclic_check(port):
             if pre_conn_port:
                 if push_undo:
                     undo_stack.push(
@@ -480,16 +539,16 @@ class Port(object):
 
     @property
     def color(self):
-        return self.__view.color
+        return self.view.color
 
     @color.setter
     def color(self, color=(0, 0, 0, 255)):
-        self.__view.color = color
+        self.view.color = color
 
     @property
     def border_color(self):
-        return self.__view.border_color
+        return self.view.border_color
 
     @border_color.setter
     def border_color(self, color=(0, 0, 0, 255)):
-        self.__view.border_color = color
+        self.view.border_color = color
@@ -0,0 +1,346 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Node reachability index used for the acyclic connection checks.
+
+Like the layout functions it only works on plain hashable node keys (the
+node ids), it doesn't know about ports or Qt objects.
+"""
+
+
+class ReachabilityIndex(object):
+    """
+    Directed node graph (output node -> input node) that keeps an
+    incrementally maintained topological order (Pearce-Kelly) so
+    :meth:`ReachabilityIndex.would_create_cycle` only has to search the
+    nodes between the two node orders, and most of the time nothing at all.
+
+    The graph may contain cycles when the node graph isn't acyclic, the
+    order is then dropped and queries fall back to a depth first search
+    with a visited set until the order can be rebuilt.
+    """
+
+    def __init__(self):
+        # {node: {successor: number of pipes}}
+        self._succ = {}
+        # {node: {predecessor: number of pipes}}
+        self._pred = {}
+        # {node: topological index}
+        self._order = {}
+        self._next_index = 0
+        # false while the graph has a cycle.
+        self._ordered = True
+        # an edge was removed from a cyclic graph, try to rebuild the order.
+        self._dirty = False
+
+    def __contains__(self, node):
+        return node in self._succ
+
+    def clear(self):
+        """
+        Remove all the nodes and edges.
+        """
+        self._succ = {}
+        self._pred = {}
+        self._order = {}
+        self._next_index = 0
+        self._ordered = True
+        self._dirty = False
+
+    def add_node(self, node):
+        """
+        Add a node without edges.
+
+        Args:
+            node (str): node id.
+        """
+        if node in self._succ:
+            return
+        self._succ[node] = {}
+        self._pred[node] = {}
+        self._order[node] = self._next_index
+        self._next_index += 1
+
+    def remove_node(self, node):
+        """
+        Remove a node and its edges.
+
+        Args:
+            node (str): node id.
+        """
+        if node not in self._succ:
+            return
+        for successor in self._succ.pop(node):
+            if successor != node:
+                self._pred[successor].pop(node, None)
+        for predecessor in self._pred.pop(node):
+            if predecessor != node:
+                self._succ[predecessor].pop(node, None)
+        del self._order[node]
+        if not self._ordered:
+            self._dirty = True
+
+    def add_edge(self, source, target):
+        """
+        Add an edge, called for every pipe so the same edge can be added
+        more than once (connections between different ports).
+
+        Args:
+            source (str): id of the node with the output port.
+            target (str): id of the node with the input port.
+        """
+        self.add_node(source)
+        self.add_node(target)
+        count = self._succ[source].get(target, 0)
+        self._succ[source][target] = count + 1
+        self._pred[target][source] = count + 1
+        if count or not self._ordered:
+            return
+        if source == target:
+            self._ordered = False
+            return
+
+        lower = self._order[target]
+        upper = self._order[source]
+        if lower > upper:
+            # already in topological order.
+            return
+
+        order = self._order
+        forward = self._search(target, self._succ,
+                               lambda n: order[n] <= upper, stop=source)
+        if forward is None:
+            # the edge closed a cycle.
+            self._ordered = False
+            return
+        backward = self._search(source, self._pred,
+                                lambda n: order[n] >= lower)
+
+        # reassign the affected indexes: everything that reaches the source
+        # before everything reachable from the target.
+        nodes = sorted(backward, key=order.get) + sorted(forward, key=order.get)
+        indexes = sorted(order[n] for n in nodes)
+        for node, index in zip(nodes, indexes):
+            order[node] = index
+
+    def remove_edge(self, source, target):
+        """
+        Remove an edge added with :meth:`ReachabilityIndex.add_edge`.
+
+        Args:
+            source (str): id of the node with the output port.
+            target (str): id of the node with the input port.
+        """
+        count = self._succ.get(source, {}).get(target)
+        if not count:
+            return
+        if count > 1:
+            self._succ[source][target] = count - 1
+            self._pred[target][source] = count - 1
+            return
+        del self._succ[source][target]
+        del self._pred[target][source]
+        if not self._ordered:
+            self._dirty = True
+
+    def successors(self, node):
+        """
+        Args:
+            node (str): node id.
+
+        Returns:
+            list[str]: ids of the nodes connected to the node outputs.
+        """
+        return list(self._succ.get(node, ()))
+
+    def predecessors(self, node):
+        """
+        Args:
+            node (str): node id.
+
+        Returns:
+            list[str]: ids of the nodes connected to the node inputs.
+        """
+        return list(self._pred.get(node, ()))
+
+    def is_acyclic(self):
+        """
+        Returns:
+            bool: true if the graph has no cycle.
+        """
+        self._update_order()
+        return self._ordered
+
+    def reachable(self, source, target):
+        """
+        Check if the target node is downstream of the source node.
+
+        Args:
+            source (str): node id.
+            target (str): node id.
+
+        Returns:
+            bool: true if there's a path from source to target.
+        """
+        if source not in self._succ or target not in self._succ:
+            return False
+        if source == target:
+            return True
+        self._update_order()
+        if self._ordered:
+            order = self._order
+            upper = order[target]
+            if order[source] > upper:
+                return False
+            return self._search(source, self._succ,
+                                lambda n: order[n] <= upper,
+                                stop=target) is None
+        return self._search(source, self._succ, stop=target) is None
+
+    def would_create_cycle(self, source, target):
+        """
+        Check if an edge from the source node to the target node would
+        create a cycle.
+
+        Args:
+            source (str): id of the node with the output port.
+            target (str): id of the node with the input port.
+
+        Returns:
+            bool: true if the new edge would close a cycle.
+        """
+        return source == target or self.reachable(target, source)
+
+    def accepts_edge(self, source, target):
+        """
+        Check if an edge from the source node to the target node keeps the
+        graph acyclic, a node connecting to itself is only rejected if it
+        already loops on itself (same as the port item search of the
+        viewer).
+
+        Args:
+            source (str): id of the node with the output port.
+            target (str): id of the node with the input port.
+
+        Returns:
+            bool: true if the connection is valid.
+        """
+        if source == target:
+            return not any(self.reachable(n, source)
+                           for n in self.successors(source))
+        return not self.reachable(target, source)
+
+    def strongly_connected_components(self):
+        """
+        Returns the strongly connected components of the graph (Tarjan).
+
+        Returns:
+            list[list[str]]: node ids of every component, downstream
+                components first.
+        """
+        index_of = {}
+        low = {}
+        on_stack = set()
+        stack = []
+        components = []
+        index = 0
+        for root in self._succ:
+            if root in index_of:
+                continue
+            index_of[root] = low[root] = index
+            index += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self._succ[root]))]
+            while work:
+                node, children = work[-1]
+                for child in children:
+                    if child not in index_of:
+                        index_of[child] = low[child] = index
+                        index += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(self._succ[child])))
+                        break
+                    if child in on_stack:
+                        low[node] = min(low[node], index_of[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == index_of[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+        return components
+
+    def cycles(self):
+        """
+        Returns the groups of nodes that loop on themselves, that's every
+        strongly connected component with more than one node and the nodes
+        connected to themselves.
+
+        Returns:
+            list[list[str]]: node ids of every looping component.
+        """
+        return [c for c in self.strongly_connected_components()
+                if len(c) > 1 or c[0] in self._succ[c[0]]]
+
+    def _update_order(self):
+        """
+        Rebuild the topological order (Kahn) after edges were removed from a
+        cyclic graph.
+        """
+        if not self._dirty:
+            return
+        self._dirty = False
+        in_degree = {n: len(p) for n, p in self._pred.items()}
+        ready = sorted((n for n, d in in_degree.items() if not d),
+                       key=self._order.get, reverse=True)
+        order = []
+        while ready:
+            node = ready.pop()
+            order.append(node)
+            for successor in self._succ[node]:
+                in_degree[successor] -= 1
+                if not in_degree[successor]:
+                    ready.append(successor)
+        if len(order) != len(self._succ):
+            return
+        self._order = {n: i for i, n in enumerate(order)}
+        self._next_index = len(order)
+        self._ordered = True
+
+    @staticmethod
+    def _search(start, adjacency, accept=None, stop=None):
+        """
+        Depth first search with a visited set.
+
+        Args:
+            start (str): start node.
+            adjacency (dict): successors or predecessors.
+            accept (function): only visit the nodes it returns true for.
+            stop (str): node that ends the search.
+
+        Returns:
+            list[str]: visited nodes or None if the stop node was reached.
+        """
+        visited = {start}
+        found = [start]
+        stack = [start]
+        while stack:
+            for node in adjacency[stack.pop()]:
+                if node == stop:
+                    return None
+                if node in visited or (accept and not accept(node)):
+                    continue
+                visited.add(node)
+                found.append(node)
+                stack.append(node)
+        return found
@@ -0,0 +1,142 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+import json
+
+from NodeGraphQt.constants import PortTypeEnum
+
+
+def iter_serialized_nodes(nodes, connections):
+    """
+    Serialize nodes one at a time.
+
+    Pipes are collected into ``connections`` while the nodes are serialized,
+    each pipe only once (deduplicated with a set).
+
+    Args:
+        nodes (list[NodeGraphQt.NodeObject]): nodes to serialize.
+        connections (list): list the serialized pipes are appended to.
+
+    Yields:
+        tuple(str, dict): node id and node data.
+    """
+    seen_nodes = set()
+    seen_pipes = set()
+    for n in nodes:
+        # update the node model.
+        n.update_model()
+
+        for n_id, n_data in n.model.to_dict.items():
+            if n_id in seen_nodes:
+                continue
+            seen_nodes.add(n_id)
+
+            # serialize connections
+            inputs = n_data.pop('inputs') if n_data.get('inputs') else {}
+            outputs = n_data.pop('outputs') if n_data.get('outputs') else {}
+
+            for pname, conn_data in inputs.items():
+                for conn_id, prt_names in conn_data.items():
+                    for conn_prt in prt_names:
+                        key = (n_id, pname, conn_id, conn_prt)
+                        if key in seen_pipes:
+                            continue
+                        seen_pipes.add(key)
+                        connections.append({
+                            PortTypeEnum.IN.value: [n_id, pname],
+                            PortTypeEnum.OUT.value: [conn_id, conn_prt]
+                        })
+
+            for pname, conn_data in outputs.items():
+                for conn_id, prt_names in conn_data.items():
+                    for conn_prt in prt_names:
+                        key = (conn_id, conn_prt, n_id, pname)
+                        if key in seen_pipes:
+                            continue
+                        seen_pipes.add(key)
+                        connections.append({
+                            PortTypeEnum.OUT.value: [n_id, pname],
+                            PortTypeEnum.IN.value: [conn_id, conn_prt]
+                        })
+
+            yield n_id, n_data
+
+
+def serialize_nodes(graph_data, nodes):
+    """
+    Serialize nodes to a session dict.
+
+    Args:
+        graph_data (dict): graph session settings.
+        nodes (list[NodeGraphQt.NodeObject]): nodes to serialize.
+
+    Returns:
+        dict: serialized data.
+    """
+    serial_data = {'graph': graph_data, 'nodes': {}, 'connections': []}
+    nodes_data = serial_data['nodes']
+    for n_id, n_data in iter_serialized_nodes(nodes,
+                                              serial_data['connections']):
+        nodes_data[n_id] = n_data
+
+    if not serial_data['connections']:
+        serial_data.pop('connections')
+
+    return serial_data
+
+
+def write_nodes(graph_data, nodes, file_out, indent=None, separators=None,
+                default=None):
+    """
+    Stream the serialized session straight to a file object, one node at a
+    time, without building the session dict first.
+
+    The output is the same as ``json.dump(serialize_nodes(...), file_out)``
+    with the same ``indent``, ``separators`` and ``default`` arguments.
+
+    Args:
+        graph_data (dict): graph session settings.
+        nodes (list[NodeGraphQt.NodeObject]): nodes to serialize.
+        file_out (file): text file object to write to.
+        indent (int): json indent.
+        separators (tuple): json (item, key) separators.
+        default (callable): json default function.
+    """
+    encoder = json.JSONEncoder(
+        indent=indent, separators=separators, default=default
+    )
+    item_sep = encoder.item_separator
+    key_sep = encoder.key_separator
+
+    def newline(depth):
+        if indent is None:
+            return ''
+        return '\n' + ' ' * (indent * depth)
+
+    def dump(value, depth):
+        text = encoder.encode(value)
+        if indent is None:
+            return text
+        # strings are escaped so the only new lines come from the indent.
+        return text.replace('\n', newline(depth))
+
+    write = file_out.write
+    write('{' + newline(1) + '"graph"' + key_sep + dump(graph_data, 1))
+
+    write(item_sep + newline(1) + '"nodes"' + key_sep + '{')
+    connections = []
+    sep = ''
+    for n_id, n_data in iter_serialized_nodes(nodes, connections):
+        write(sep + newline(2) + encoder.encode(n_id) + key_sep +
+              dump(n_data, 2))
+        sep = item_sep
+    write((newline(1) if sep else '') + '}')
+
+    if connections:
+        write(item_sep + newline(1) + '"connections"' + key_sep + '[')
+        sep = ''
+        for pipe in connections:
+            write(sep + newline(2) + dump(pipe, 2))
+            sep = item_sep
+        write(newline(1) + ']')
+
+    write(newline(0) + '}')
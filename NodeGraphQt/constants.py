@@ -66,6 +66,17 @@ class LayoutDirectionEnum(Enum):
     VERTICAL = 1
 
 
+class LayoutModeEnum(Enum):
+    """
+    Node graph auto layout algorithm:
+    :py:mod:`NodeGraphQt.constants.LayoutModeEnum`
+    """
+    #: layered layout following the connections.
+    LAYERED = 0
+    #: force directed layout (requires numpy).
+    FORCE_DIRECTED = 1
+
+
 # =================================== VIEWER ===================================
 
 
@@ -10,7 +10,7 @@ from NodeGraphQt.errors import (
     PortRegistrationError,
     NodeWidgetError
 )
-from NodeGraphQt.qgraphics.node_base import NodeItem
+from NodeGraphQt.qgraphics.node_base import NodeItem, NodeWidgetSlot
 from NodeGraphQt.widgets.node_widgets import (
     NodeBaseWidget,
     NodeCheckBox,
@@ -61,10 +61,39 @@ class BaseNode(NodeObject):
         self._inputs = []
         self._outputs = []
 
+    def create_view(self):
+        """
+        Create the node item if it hasn't been created yet and draw the
+        pipes to the connected nodes that already have their node item.
+
+        See Also:
+            :meth:`NodeObject.create_view`
+
+        Returns:
+            NodeGraphQt.qgraphics.node_base.NodeItem: node item.
+        """
+        if self._view is not None:
+            return self._view
+        view = super(BaseNode, self).create_view()
+        if self._graph is None:
+            return view
+        for port in self._inputs + self._outputs:
+            for connected_port in port.connected_ports():
+                node = connected_port.node()
+                if node is self and port.type_() == PortTypeEnum.IN.value:
+                    # drawn from the output port.
+                    continue
+                if node.has_view():
+                    port.view.connect_to(connected_port.view)
+        return view
+
     def update_model(self):
         """
         Update the node model from view.
         """
+        if self._view is None:
+            # nothing changed on the node item yet.
+            return
         for name, val in self.view.properties.items():
             if name in ['inputs', 'outputs']:
                 continue
@@ -94,7 +123,7 @@ class BaseNode(NodeObject):
                 else:
                     undo_cmd.redo()
                 return
-        elif name == 'disabled':
+        elif name == 'disabled' and self._view is not None:
             # redraw the connected pipes in the scene.
             ports = self.view.inputs + self.view.outputs
             for port in ports:
@@ -123,7 +152,8 @@ class BaseNode(NodeObject):
         # base logic to update the model and view attributes only.
         super(BaseNode, self).set_layout_direction(value)
         # redraw the node.
-        self._view.draw_node()
+        if self._view is not None:
+            self._view.draw_node()
 
     def set_icon(self, icon=None):
         """
@@ -208,6 +238,38 @@ class BaseNode(NodeObject):
         #        to address a seg fault issue when exiting the application.
         widget.parent()
 
+    def add_lod_widget(self, name, widget_cls):
+        """
+        Add a custom node widget that's only created while the node is on
+        screen and zoomed in close enough to interact with.
+
+        Until then the node paints a cheap preview set with
+        :meth:`NodeGraphQt.qgraphics.node_base.NodeWidgetSlot.set_preview`
+        and widgets that leave the view are recycled for other nodes.
+
+        Note:
+            Unlike :meth:`BaseNode.add_custom_widget` no node property is
+            created, the value is pushed to the widget with
+            :meth:`NodeGraphQt.NodeBaseWidget.set_value` when it's bound.
+
+        Args:
+            name (str): widget name.
+            widget_cls (type): :class:`NodeGraphQt.NodeBaseWidget` subclass,
+                created without arguments.
+
+        Returns:
+            NodeGraphQt.qgraphics.node_base.NodeWidgetSlot: the widget slot.
+        """
+        if self._view is None:
+            # the slot is added to the node item once it's created.
+            slot = NodeWidgetSlot(name, widget_cls)
+            self._setup_view(lambda view: view.add_lod_slot(slot))
+            return slot
+        slot = self.view.add_lod_widget(name, widget_cls)
+        #: redraw node to address calls outside the "__init__" func.
+        self.view.draw_node()
+        return slot
+
     def add_combo_menu(self, name, label='', items=None, tooltip=None,
                        tab=None):
         """
@@ -376,13 +438,8 @@ class BaseNode(NodeObject):
         port_args = [name, multi_input, display_name, locked]
         if painter_func and callable(painter_func):
             port_args.append(painter_func)
-        view = self.view.add_input(*port_args)
-
-        if color:
-            view.color = color
-            view.border_color = [min([255, max([0, i + 80])]) for i in color]
 
-        port = Port(self, view)
+        port = Port(self, None)
         port.model.type_ = PortTypeEnum.IN.value
         port.model.name = name
         port.model.display_name = display_name
@@ -390,6 +447,8 @@ class BaseNode(NodeObject):
         port.model.locked = locked
         self._inputs.append(port)
         self.model.inputs[port.name()] = port.model
+        self._setup_view(
+            lambda view: self._add_port_view(view, port, port_args, color))
         return port
 
     def add_output(self, name='output', multi_output=True, display_name=True,
@@ -419,12 +478,8 @@ class BaseNode(NodeObject):
         port_args = [name, multi_output, display_name, locked]
         if painter_func and callable(painter_func):
             port_args.append(painter_func)
-        view = self.view.add_output(*port_args)
 
-        if color:
-            view.color = color
-            view.border_color = [min([255, max([0, i + 80])]) for i in color]
-        port = Port(self, view)
+        port = Port(self, None)
         port.model.type_ = PortTypeEnum.OUT.value
         port.model.name = name
         port.model.display_name = display_name
@@ -432,8 +487,33 @@ class BaseNode(NodeObject):
         port.model.locked = locked
         self._outputs.append(port)
         self.model.outputs[port.name()] = port.model
+        self._setup_view(
+            lambda view: self._add_port_view(view, port, port_args, color))
         return port
 
+    @staticmethod
+    def _add_port_view(view, port, port_args, color=None):
+        """
+        Add the port item to the node item.
+
+        Args:
+            view (NodeGraphQt.qgraphics.node_base.NodeItem): node item.
+            port (NodeGraphQt.Port): port object.
+            port_args (list): port item arguments.
+            color (tuple): initial port color (r, g, b) ``0-255``.
+        """
+        if port.type_() == PortTypeEnum.IN.value:
+            port_view = view.add_input(*port_args)
+        else:
+            port_view = view.add_output(*port_args)
+
+        if color:
+            port_view.color = color
+            port_view.border_color = [
+                min([255, max([0, i + 80])]) for i in color
+            ]
+        port._set_view(port_view)
+
     def get_input(self, port):
         """
         Get input port by the name or index.
@@ -492,9 +572,9 @@ class BaseNode(NodeObject):
             raise PortError('Error: Can\'t delete a port that is locked!')
         self._inputs.remove(port)
         self._model.inputs.pop(port.name())
-        self._view.delete_input(port.view)
+        self.view.delete_input(port.view)
         port.model.node = None
-        self._view.draw_node()
+        self.view.draw_node()
 
     def delete_output(self, port):
         """
@@ -522,9 +602,9 @@ class BaseNode(NodeObject):
             raise PortError('Error: Can\'t delete a port that is locked!')
         self._outputs.remove(port)
         self._model.outputs.pop(port.name())
-        self._view.delete_output(port.view)
+        self.view.delete_output(port.view)
         port.model.node = None
-        self._view.draw_node()
+        self.view.draw_node()
 
     def set_port_deletion_allowed(self, mode=False):
         """
@@ -592,10 +672,10 @@ class BaseNode(NodeObject):
                 '"set_port_deletion_allowed" is not enabled on this node.')
 
         for port in self._inputs:
-            self._view.delete_input(port.view)
+            self.view.delete_input(port.view)
             port.model.node = None
         for port in self._outputs:
-            self._view.delete_output(port.view)
+            self.view.delete_output(port.view)
             port.model.node = None
         self._inputs = []
         self._outputs = []
@@ -612,7 +692,7 @@ class BaseNode(NodeObject):
                          display_name=port['display_name'],
                          locked=port.get('locked') or False)
          for port in port_data['output_ports']]
-        self._view.draw_node()
+        self.view.draw_node()
 
     def inputs(self):
         """
@@ -705,7 +785,7 @@ class BaseNode(NodeObject):
         """
         nodes = OrderedDict()
         for p in self.input_ports():
-            nodes[p] = [cp.node() for cp in p.connected_ports()]
+            nodes[p] = [cp.node() for cp in p.peer_ports()]
         return nodes
 
     def connected_output_nodes(self):
@@ -717,7 +797,7 @@ class BaseNode(NodeObject):
         """
         nodes = OrderedDict()
         for p in self.output_ports():
-            nodes[p] = [cp.node() for cp in p.connected_ports()]
+            nodes[p] = [cp.node() for cp in p.peer_ports()]
         return nodes
 
     def add_accept_port_type(self, port, port_type_data):
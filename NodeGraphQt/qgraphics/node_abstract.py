@@ -8,6 +8,13 @@ from NodeGraphQt.constants import (
     NodeEnum
 )
 
+# item changes that move or resize the node.
+_BOUNDS_CHANGES = (
+    QtWidgets.QGraphicsItem.ItemPositionHasChanged,
+    QtWidgets.QGraphicsItem.ItemChildAddedChange,
+    QtWidgets.QGraphicsItem.ItemChildRemovedChange,
+)
+
 
 class AbstractNodeItem(QtWidgets.QGraphicsItem):
     """
@@ -18,7 +25,8 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
         super(AbstractNodeItem, self).__init__(parent)
         self.setFlags(
             QtWidgets.QGraphicsItem.ItemIsSelectable |
-            QtWidgets.QGraphicsItem.ItemIsMovable
+            QtWidgets.QGraphicsItem.ItemIsMovable |
+            QtWidgets.QGraphicsItem.ItemSendsGeometryChanges
         )
         self.setCacheMode(ITEM_CACHE_MODE)
         self.setZValue(Z_VAL_NODE)
@@ -36,6 +44,8 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
         }
         self._width = NodeEnum.WIDTH.value
         self._height = NodeEnum.HEIGHT.value
+        # viewer that took the node out of the scene (virtualized mode).
+        self._detached_viewer = None
 
     def __repr__(self):
         return '{}.{}(\'{}\')'.format(
@@ -44,6 +54,35 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
     def boundingRect(self):
         return QtCore.QRectF(0.0, 0.0, self._width, self._height)
 
+    def itemChange(self, change, value):
+        """
+        Re-implemented to keep the viewer node registry and spatial index
+        up to date.
+
+        Args:
+            change:
+            value:
+        """
+        if change == QtWidgets.QGraphicsItem.ItemSceneChange:
+            viewer = self.viewer()
+            if viewer:
+                viewer.unregister_item(self)
+        elif change == QtWidgets.QGraphicsItem.ItemSceneHasChanged:
+            viewer = self.viewer()
+            if viewer:
+                viewer.register_item(self)
+        elif change in _BOUNDS_CHANGES:
+            self._update_viewer_bounds()
+        return super(AbstractNodeItem, self).itemChange(change, value)
+
+    def _update_viewer_bounds(self):
+        """
+        Flag the node as moved or resized in the viewer spatial index.
+        """
+        viewer = self.viewer()
+        if viewer:
+            viewer.update_item_bounds(self)
+
     def mousePressEvent(self, event):
         """
         Re-implemented to update "self._properties['selected']" attribute.
@@ -122,6 +161,7 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
     @width.setter
     def width(self, width=0.0):
         self._width = width
+        self._update_viewer_bounds()
 
     @property
     def height(self):
@@ -130,6 +170,7 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
     @height.setter
     def height(self, height=0.0):
         self._height = height
+        self._update_viewer_bounds()
 
     @property
     def color(self):
@@ -239,11 +280,14 @@ class AbstractNodeItem(QtWidgets.QGraphicsItem):
         """
         if self.scene():
             return self.scene().viewer()
+        return self._detached_viewer
 
     def delete(self):
         """
         remove node view from the scene.
         """
+        if self._detached_viewer is not None:
+            self._detached_viewer.discard_detached_node(self)
         if self.scene():
             self.scene().removeItem(self)
 
@@ -248,7 +248,13 @@ class BackdropNodeItem(AbstractNodeItem):
         if self.scene():
             polygon = self.mapToScene(self.boundingRect())
             rect = polygon.boundingRect()
-            items = self.scene().items(rect, mode=mode[inc_intersects])
+            viewer = self.viewer()
+            if viewer:
+                items = viewer.items_in_area(
+                    rect, mode=mode[inc_intersects], children=False
+                )
+            else:
+                items = self.scene().items(rect, mode=mode[inc_intersects])
             for item in items:
                 if item == self or item == self._sizer:
                     continue
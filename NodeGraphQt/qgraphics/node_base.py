@@ -19,6 +19,215 @@ from NodeGraphQt.qgraphics.node_text_item import NodeTextItem
 from NodeGraphQt.qgraphics.port import PortItem, CustomPortItem
 
 
+class NodeWidgetPool(object):
+    """
+    Pool of recycled node widgets (:class:`NodeGraphQt.NodeBaseWidget`)
+    shared by all :class:`NodeWidgetSlot` items of the same widget class.
+
+    Args:
+        max_size (int): max free widgets kept per widget class.
+    """
+
+    def __init__(self, max_size=32):
+        self.max_size = max_size
+        self._free = {}
+        self._sizes = {}
+
+    def acquire(self, widget_cls):
+        """
+        Returns a free widget or a new one if the pool is empty.
+
+        Args:
+            widget_cls (type): NodeBaseWidget subclass.
+
+        Returns:
+            NodeGraphQt.NodeBaseWidget: widget.
+        """
+        free = self._free.get(widget_cls)
+        if free:
+            return free.pop()
+        return widget_cls()
+
+    def release(self, widget_cls, widget):
+        """
+        Take the widget out of the scene and keep it for reuse.
+
+        Args:
+            widget_cls (type): NodeBaseWidget subclass.
+            widget (NodeGraphQt.NodeBaseWidget): widget to recycle.
+        """
+        widget.setVisible(False)
+        widget.setParentItem(None)
+        if widget.scene():
+            widget.scene().removeItem(widget)
+        free = self._free.setdefault(widget_cls, [])
+        if len(free) < self.max_size:
+            free.append(widget)
+        else:
+            widget.deleteLater()
+
+    def size_hint(self, widget_cls):
+        """
+        Returns the size of the widget class, measured once from a pooled
+        widget.
+
+        Args:
+            widget_cls (type): NodeBaseWidget subclass.
+
+        Returns:
+            QtCore.QSizeF: widget size.
+        """
+        size = self._sizes.get(widget_cls)
+        if size is None:
+            widget = self.acquire(widget_cls)
+            size = self._sizes[widget_cls] = widget.boundingRect().size()
+            self.release(widget_cls, widget)
+        return size
+
+
+#: node widget pool shared by all the node items.
+NODE_WIDGET_POOL = NodeWidgetPool()
+
+
+class NodeWidgetSlot(QtWidgets.QGraphicsItem):
+    """
+    Level of detail stand-in for a node widget.
+
+    The slot reserves the widget size in the node layout and paints a cheap
+    preview (thumbnail and text). The real widget is taken from the
+    :data:`NODE_WIDGET_POOL` when the viewer binds the slot and returned to
+    the pool when it is unbound.
+
+    Args:
+        name (str): widget name.
+        widget_cls (type): NodeBaseWidget subclass created on demand.
+        parent (NodeItem): parent node item.
+    """
+
+    def __init__(self, name, widget_cls, parent=None):
+        super(NodeWidgetSlot, self).__init__(parent)
+        self._name = name
+        self._widget_cls = widget_cls
+        self._size = NODE_WIDGET_POOL.size_hint(widget_cls)
+        self._widget = None
+        self._value = None
+        self._title_align = 'center'
+        self._preview_pixmap = None
+        self._preview_text = ''
+
+    def boundingRect(self):
+        return QtCore.QRectF(0.0, 0.0, self._size.width(), self._size.height())
+
+    def paint(self, painter, option, widget):
+        """
+        Draws the widget preview while no widget is bound.
+
+        Args:
+            painter (QtGui.QPainter): painter used for drawing the item.
+            option (QtGui.QStyleOptionGraphicsItem):
+                used to describe the parameters needed to draw.
+            widget (QtWidgets.QWidget): not used.
+        """
+        if self._widget is not None:
+            return
+        painter.save()
+        margin = 10.0
+        rect = self.boundingRect().adjusted(margin, margin, -margin, -margin)
+        painter.setPen(QtCore.Qt.NoPen)
+        painter.setBrush(QtGui.QColor(0, 0, 0, 40))
+        painter.drawRoundedRect(rect, 3.0, 3.0)
+
+        parent = self.parentItem()
+        if parent is not None and getattr(parent, '_proxy_mode', False):
+            painter.restore()
+            return
+
+        pixmap = self._preview_pixmap
+        if pixmap is not None and not pixmap.isNull():
+            size = pixmap.size().scaled(rect.size().toSize(),
+                                        QtCore.Qt.KeepAspectRatio)
+            target = QtCore.QRectF(0.0, 0.0, size.width(), size.height())
+            target.moveCenter(rect.center())
+            painter.drawPixmap(target, pixmap, QtCore.QRectF(pixmap.rect()))
+        elif self._preview_text:
+            painter.setPen(QtGui.QColor(255, 255, 255, 120))
+            painter.drawText(rect, QtCore.Qt.AlignCenter, self._preview_text)
+        painter.restore()
+
+    def get_name(self):
+        return self._name
+
+    def widget_class(self):
+        return self._widget_cls
+
+    def widget(self):
+        """
+        Returns:
+            NodeGraphQt.NodeBaseWidget: bound widget or None.
+        """
+        return self._widget
+
+    def get_value(self):
+        return self._value
+
+    def set_value(self, value):
+        """
+        Set the value passed to the widget when it's bound.
+
+        Args:
+            value (object): widget value.
+        """
+        self._value = value
+        if self._widget is not None:
+            self._widget.set_value(value)
+
+    def set_preview(self, pixmap=None, text=''):
+        """
+        Set the preview painted while no widget is bound.
+
+        Args:
+            pixmap (QtGui.QPixmap): preview image.
+            text (str): text shown when there's no image.
+        """
+        self._preview_pixmap = pixmap
+        self._preview_text = text
+        if self._widget is None:
+            self.update()
+
+    def set_title_align(self, align):
+        self._title_align = align
+        if self._widget is not None:
+            self._widget.widget().setTitleAlign(align)
+
+    def is_bound(self):
+        return self._widget is not None
+
+    def bind(self):
+        """
+        Take a widget from the pool and place it over the slot.
+        """
+        if self._widget is not None:
+            return
+        widget = NODE_WIDGET_POOL.acquire(self._widget_cls)
+        widget.setParentItem(self)
+        widget.setPos(0.0, 0.0)
+        widget.widget().setTitleAlign(self._title_align)
+        widget.set_value(self._value)
+        widget.setVisible(True)
+        self._widget = widget
+        self.update()
+
+    def unbind(self):
+        """
+        Return the bound widget to the pool.
+        """
+        if self._widget is None:
+            return
+        widget, self._widget = self._widget, None
+        NODE_WIDGET_POOL.release(self._widget_cls, widget)
+        self.update()
+
+
 class NodeItem(AbstractNodeItem):
     """
     Base Node item.
@@ -44,6 +253,7 @@ class NodeItem(AbstractNodeItem):
         self._input_items = OrderedDict()
         self._output_items = OrderedDict()
         self._widgets = OrderedDict()
+        self._lod_widgets = OrderedDict()
         self._proxy_mode = False
         self._proxy_mode_threshold = 70
 
@@ -336,6 +546,23 @@ class NodeItem(AbstractNodeItem):
             for pipe in port.connected_pipes:
                 pipe.reset()
 
+    def _layout_widgets(self):
+        """
+        Returns the node widgets and level of detail widget slots in
+        layout order.
+
+        Returns:
+            list: NodeBaseWidget and NodeWidgetSlot items.
+        """
+        return list(self._widgets.values()) + list(self._lod_widgets.values())
+
+    @staticmethod
+    def _set_widget_title_align(widget, align):
+        if isinstance(widget, NodeWidgetSlot):
+            widget.set_title_align(align)
+        else:
+            widget.widget().setTitleAlign(align)
+
     def _calc_size_horizontal(self):
         # width, height from node name text.
         text_w = self._text_item.boundingRect().width()
@@ -371,7 +598,7 @@ class NodeItem(AbstractNodeItem):
         # width, height from node embedded widgets.
         widget_width = 0.0
         widget_height = 0.0
-        for widget in self._widgets.values():
+        for widget in self._layout_widgets():
             if not widget.isVisible():
                 continue
             w_width = widget.boundingRect().width()
@@ -416,7 +643,7 @@ class NodeItem(AbstractNodeItem):
 
         widget_width = 0.0
         widget_height = 0.0
-        for widget in self._widgets.values():
+        for widget in self._layout_widgets():
             if not widget.isVisible():
                 continue
             if widget.boundingRect().width() > widget_width:
@@ -508,47 +735,47 @@ class NodeItem(AbstractNodeItem):
             raise RuntimeError('Node graph layout direction not valid!')
 
     def _align_widgets_horizontal(self, v_offset):
-        if not self._widgets:
+        if not self._widgets and not self._lod_widgets:
             return
         rect = self.boundingRect()
         y = rect.y() + v_offset
         inputs = [p for p in self.inputs if p.isVisible()]
         outputs = [p for p in self.outputs if p.isVisible()]
-        for widget in self._widgets.values():
+        for widget in self._layout_widgets():
             if not widget.isVisible():
                 continue
             widget_rect = widget.boundingRect()
             if not inputs:
                 x = rect.left() + 10
-                widget.widget().setTitleAlign('left')
+                self._set_widget_title_align(widget, 'left')
             elif not outputs:
                 x = rect.right() - widget_rect.width() - 10
-                widget.widget().setTitleAlign('right')
+                self._set_widget_title_align(widget, 'right')
             else:
                 x = rect.center().x() - (widget_rect.width() / 2)
-                widget.widget().setTitleAlign('center')
+                self._set_widget_title_align(widget, 'center')
             widget.setPos(x, y)
             y += widget_rect.height()
 
     def _align_widgets_vertical(self, v_offset):
-        if not self._widgets:
+        if not self._widgets and not self._lod_widgets:
             return
         rect = self.boundingRect()
         y = rect.center().y() + v_offset
         widget_height = 0.0
-        for widget in self._widgets.values():
+        for widget in self._layout_widgets():
             if not widget.isVisible():
                 continue
             widget_rect = widget.boundingRect()
             widget_height += widget_rect.height()
         y -= widget_height / 2
 
-        for widget in self._widgets.values():
+        for widget in self._layout_widgets():
             if not widget.isVisible():
                 continue
             widget_rect = widget.boundingRect()
             x = rect.center().x() - (widget_rect.width() / 2)
-            widget.widget().setTitleAlign('center')
+            self._set_widget_title_align(widget, 'center')
             widget.setPos(x, y)
             y += widget_rect.height()
 
@@ -1047,6 +1274,70 @@ class NodeItem(AbstractNodeItem):
     def has_widget(self, name):
         return name in self._widgets.keys()
 
+    @property
+    def lod_widgets(self):
+        return self._lod_widgets.copy()
+
+    def add_lod_widget(self, name, widget_cls):
+        """
+        Add a node widget that's created on demand.
+
+        A :class:`NodeWidgetSlot` painting a preview is added instead of the
+        widget, the viewer binds a pooled widget to it while the node is on
+        screen and zoomed in close enough to interact with.
+
+        Args:
+            name (str): widget name.
+            widget_cls (type): NodeBaseWidget subclass.
+
+        Returns:
+            NodeWidgetSlot: the widget slot.
+        """
+        return self.add_lod_slot(NodeWidgetSlot(name, widget_cls))
+
+    def add_lod_slot(self, slot):
+        """
+        Add a widget slot created before the node item.
+
+        Args:
+            slot (NodeWidgetSlot): widget slot without parent.
+
+        Returns:
+            NodeWidgetSlot: the widget slot.
+        """
+        name = slot.get_name()
+        if name in self._widgets or name in self._lod_widgets:
+            raise NodeWidgetError('node already has widget "{}"'.format(name))
+        slot.setParentItem(self)
+        self._lod_widgets[name] = slot
+        return slot
+
+    def get_lod_widget(self, name):
+        slot = self._lod_widgets.get(name)
+        if slot:
+            return slot
+        raise NodeWidgetError('node has no widget "{}"'.format(name))
+
+    def set_lod_active(self, active):
+        """
+        Bind or unbind the pooled widgets of the level of detail slots.
+
+        Args:
+            active (bool): true to create the real widgets.
+        """
+        for slot in self._lod_widgets.values():
+            if active:
+                slot.bind()
+            else:
+                slot.unbind()
+
+    def delete(self):
+        """
+        Return pooled widgets and remove node view from the scene.
+        """
+        self.set_lod_active(False)
+        super(NodeItem, self).delete()
+
     def from_dict(self, node_dict):
         super(NodeItem, self).from_dict(node_dict)
         custom_prop = node_dict.get('custom') or {}
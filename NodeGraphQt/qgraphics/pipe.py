@@ -79,8 +79,29 @@ class PipeItem(QtWidgets.QGraphicsPathItem):
                 self.highlight()
             else:
                 self.reset()
+        # keep the viewer pipe registry up to date.
+        elif change == QtWidgets.QGraphicsPathItem.ItemSceneChange:
+            viewer = self.viewer()
+            if viewer:
+                viewer.unregister_item(self)
+        elif change == QtWidgets.QGraphicsPathItem.ItemSceneHasChanged:
+            viewer = self.viewer()
+            if viewer:
+                viewer.register_item(self)
         return super(PipeItem, self).itemChange(change, value)
 
+    def setPath(self, path):
+        """
+        Re-implemented to keep the viewer spatial index up to date.
+
+        Args:
+            path (QtGui.QPainterPath): pipe path.
+        """
+        super(PipeItem, self).setPath(path)
+        viewer = self.viewer()
+        if viewer:
+            viewer.update_item_bounds(self)
+
     def paint(self, painter, option, widget):
         """
         Draws the connection line between nodes.
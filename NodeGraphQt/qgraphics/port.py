@@ -255,8 +255,9 @@ class PortItem(QtWidgets.QGraphicsItem):
             for pipe in self.connected_pipes:
                 pipe.delete()
             return
-        if self.scene():
-            viewer = self.scene().viewer()
+        # either node may be out of the scene in virtualized mode.
+        viewer = self.node.viewer() or port.node.viewer()
+        if viewer:
             viewer.establish_connection(self, port)
         # redraw the ports.
         port.update()
@@ -0,0 +1,244 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+import math
+
+from Qt import QtCore
+
+
+class SpatialIndex(object):
+    """
+    Uniform grid over the scene bounding rects of the top level node and
+    pipe items, used by the viewer for the interaction queries (hit testing,
+    rubber band selection, pipe slicer...) instead of the scene queries that
+    go through every item including the text and port children.
+
+    The item rects include the children bounding rect and are only
+    re-computed when an item has been flagged with
+    :meth:`SpatialIndex.update` (moved or resized) and the index is queried.
+    """
+
+    def __init__(self, cell_size=256.0, max_cells=256, bounds_func=None):
+        """
+        Args:
+            cell_size (float): grid cell width and height.
+            max_cells (int): items covering more cells than this are kept
+                out of the grid and checked on every query.
+            bounds_func (function): returns the (left, top, right, bottom)
+                bounds of an item, defaults to
+                :meth:`SpatialIndex.item_bounds`.
+        """
+        self._bounds_func = bounds_func or self.item_bounds
+        self._cell_size = float(cell_size)
+        self._max_cells = max_cells
+        # {(column, row): set(items)}
+        self._cells = {}
+        # {item: (rect bounds, cell keys)}
+        self._items = {}
+        # {item: insertion number} to resolve the stacking order.
+        self._order = {}
+        self._next_order = 0
+        # items larger than "max_cells".
+        self._large = set()
+        # items to re-index before the next query.
+        self._dirty = set()
+
+    def __contains__(self, item):
+        return item in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    @staticmethod
+    def item_bounds(item):
+        """
+        Returns the scene bounds of the item and its children.
+
+        Args:
+            item (QtWidgets.QGraphicsItem): top level item.
+
+        Returns:
+            tuple(float): left, top, right, bottom.
+        """
+        rect = item.boundingRect() | item.childrenBoundingRect()
+        rect = item.mapRectToScene(rect)
+        return rect.left(), rect.top(), rect.right(), rect.bottom()
+
+    def clear(self):
+        """
+        Remove all the items.
+        """
+        self._cells = {}
+        self._items = {}
+        self._order = {}
+        self._next_order = 0
+        self._large = set()
+        self._dirty = set()
+
+    def insert(self, item):
+        """
+        Add an item to the index.
+
+        Args:
+            item (QtWidgets.QGraphicsItem): top level item.
+        """
+        if item in self._items:
+            self._unlink(item)
+        else:
+            self._order[item] = self._next_order
+            self._next_order += 1
+        self._dirty.discard(item)
+        self._link(item)
+
+    def remove(self, item):
+        """
+        Remove an item from the index.
+
+        Args:
+            item (QtWidgets.QGraphicsItem): top level item.
+        """
+        if item not in self._items:
+            return
+        self._unlink(item)
+        del self._order[item]
+        self._dirty.discard(item)
+
+    def update(self, item):
+        """
+        Flag an item that has been moved or resized, it's re-indexed on the
+        next query.
+
+        Args:
+            item (QtWidgets.QGraphicsItem): top level item.
+        """
+        if item in self._items:
+            self._dirty.add(item)
+
+    def stacking_key(self, item):
+        """
+        Sort key matching the scene stacking order of the top level items
+        (z value then insertion order).
+
+        Args:
+            item (QtWidgets.QGraphicsItem): indexed item.
+
+        Returns:
+            tuple: sort key.
+        """
+        return item.zValue(), self._order.get(item, -1)
+
+    def bounds(self, item):
+        """
+        Returns the indexed scene bounds of the item and its children.
+
+        Args:
+            item (QtWidgets.QGraphicsItem): indexed item.
+
+        Returns:
+            QtCore.QRectF: scene rect.
+        """
+        l, t, r, b = self._items[item][0]
+        return QtCore.QRectF(l, t, r - l, b - t)
+
+    def bounds_within(self, item, left, top, right, bottom):
+        """
+        Check if the indexed bounds of the item are inside the rect.
+
+        Args:
+            item (QtWidgets.QGraphicsItem): indexed item.
+            left (float): rect left.
+            top (float): rect top.
+            right (float): rect right.
+            bottom (float): rect bottom.
+
+        Returns:
+            bool: true if the item and its children are inside the rect.
+        """
+        l, t, r, b = self._items[item][0]
+        return l >= left and t >= top and r <= right and b <= bottom
+
+    def query(self, rect):
+        """
+        Returns the items with bounds intersecting the rect.
+
+        Args:
+            rect (QtCore.QRectF): scene rect.
+
+        Returns:
+            list[QtWidgets.QGraphicsItem]: items (unsorted).
+        """
+        self._flush()
+        left, top = rect.left(), rect.top()
+        right, bottom = rect.right(), rect.bottom()
+        min_col, min_row, max_col, max_row = self._cell_range(
+            left, top, right, bottom)
+
+        candidates = set(self._large)
+        cell_count = (max_col - min_col + 1) * (max_row - min_row + 1)
+        if cell_count > len(self._cells):
+            # rect covers more cells than are in use.
+            for (col, row), items in self._cells.items():
+                if min_col <= col <= max_col and min_row <= row <= max_row:
+                    candidates.update(items)
+        else:
+            cells = self._cells
+            for col in range(min_col, max_col + 1):
+                for row in range(min_row, max_row + 1):
+                    items = cells.get((col, row))
+                    if items:
+                        candidates.update(items)
+
+        found = []
+        for item in candidates:
+            l, t, r, b = self._items[item][0]
+            if l <= right and r >= left and t <= bottom and b >= top:
+                found.append(item)
+        return found
+
+    def _flush(self):
+        """
+        Re-index the flagged items.
+        """
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
+        for item in dirty:
+            if item in self._items:
+                self._unlink(item)
+                self._link(item)
+
+    def _cell_range(self, left, top, right, bottom):
+        size = self._cell_size
+        return (int(math.floor(left / size)), int(math.floor(top / size)),
+                int(math.floor(right / size)), int(math.floor(bottom / size)))
+
+    def _link(self, item):
+        bounds = self._bounds_func(item)
+        min_col, min_row, max_col, max_row = self._cell_range(*bounds)
+        cell_count = (max_col - min_col + 1) * (max_row - min_row + 1)
+        if cell_count > self._max_cells:
+            self._large.add(item)
+            self._items[item] = (bounds, ())
+            return
+        keys = [(col, row)
+                for col in range(min_col, max_col + 1)
+                for row in range(min_row, max_row + 1)]
+        cells = self._cells
+        for key in keys:
+            items = cells.get(key)
+            if items is None:
+                cells[key] = {item}
+            else:
+                items.add(item)
+        self._items[item] = (bounds, keys)
+
+    def _unlink(self, item):
+        bounds, keys = self._items.pop(item)
+        if not keys:
+            self._large.discard(item)
+            return
+        cells = self._cells
+        for key in keys:
+            items = cells[key]
+            items.discard(item)
+            if not items:
+                del cells[key]
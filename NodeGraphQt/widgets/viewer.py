@@ -1,6 +1,7 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 import math
+from collections import deque
 from distutils.version import LooseVersion
 
 from Qt import QtGui, QtCore, QtWidgets
@@ -16,11 +17,13 @@ from NodeGraphQt.constants import (
 )
 from NodeGraphQt.qgraphics.node_abstract import AbstractNodeItem
 from NodeGraphQt.qgraphics.node_backdrop import BackdropNodeItem
+from NodeGraphQt.qgraphics.node_base import NodeItem
 from NodeGraphQt.qgraphics.pipe import PipeItem, LivePipeItem
 from NodeGraphQt.qgraphics.port import PortItem
 from NodeGraphQt.qgraphics.slicer import SlicerPipeItem
 from NodeGraphQt.widgets.dialogs import BaseDialog, FileDialog
 from NodeGraphQt.widgets.scene import NodeScene
+from NodeGraphQt.widgets.spatial_index import SpatialIndex
 from NodeGraphQt.widgets.tab_search import TabSearchMenuWidget
 
 ZOOM_MIN = -0.95
@@ -45,6 +48,7 @@ class NodeViewer(QtWidgets.QGraphicsView):
     insert_node = QtCore.Signal(object, str, object)
     node_name_changed = QtCore.Signal(str, str)
     node_backdrop_updated = QtCore.Signal(str, str, object)
+    nodes_attached = QtCore.Signal(list)
 
     # pass through signals that are translated into "NodeGraph()" signals.
     node_selected = QtCore.Signal(str)
@@ -62,7 +66,19 @@ class NodeViewer(QtWidgets.QGraphicsView):
         """
         super(NodeViewer, self).__init__(parent)
 
+        # node and pipe items in the scene, kept up to date by the items
+        # (see "register_item()") and the selection cached from the scene
+        # "selectionChanged" signal.
+        self._node_items = {}
+        self._pipe_items = {}
+        self._selected_nodes = []
+        self._selected_pipes = []
+        # grid of the node and pipe bounding boxes for the interaction
+        # queries (see "items_in_area()").
+        self._spatial_index = SpatialIndex()
+
         self.setScene(NodeScene(self))
+        self.scene().selectionChanged.connect(self._on_selection_changed)
         self.setRenderHint(QtGui.QPainter.Antialiasing, True)
         self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
@@ -136,6 +152,8 @@ class NodeViewer(QtWidgets.QGraphicsView):
         if undo_stack:
             self._undo_action = undo_stack.createUndoAction(self, '&Undo')
             self._redo_action = undo_stack.createRedoAction(self, '&Redo')
+            # nodes may have moved in or out of the viewport.
+            undo_stack.indexChanged.connect(self.schedule_virtual_update)
         else:
             self._undo_action = None
             self._redo_action = None
@@ -158,6 +176,34 @@ class NodeViewer(QtWidgets.QGraphicsView):
         # TODO: maybe this should be a reference to the graph model instead?
         self.accept_connection_types = None
         self.reject_connection_types = None
+        # reference to the graph model reachability index used by
+        # "acyclic_check()".
+        self.reachability = None
+
+        # level of detail: nodes with bound (real) node widgets.
+        self._lod_threshold = 0.5
+        self._lod_nodes = set()
+        self._lod_timer = QtCore.QTimer(self)
+        self._lod_timer.setSingleShot(True)
+        self._lod_timer.setInterval(50)
+        self._lod_timer.timeout.connect(self.update_lod_widgets)
+
+        # virtualized mode: node items outside the viewport (plus margin) are
+        # kept out of the scene.
+        self._virtualized = False
+        self._virtual_margin = 0.5
+        self._detached_nodes = set()
+        # nodes that don't have a node item yet (see "add_deferred_node()").
+        self._deferred_nodes = set()
+        # grids of the detached node items and of the deferred nodes so only
+        # the ones near the viewport are looked at when the view changes.
+        self._detached_index = SpatialIndex()
+        self._deferred_index = SpatialIndex(
+            bounds_func=self._deferred_node_bounds)
+        self._virtual_timer = QtCore.QTimer(self)
+        self._virtual_timer.setSingleShot(True)
+        self._virtual_timer.setInterval(50)
+        self._virtual_timer.timeout.connect(self.update_virtual_items)
 
     def __repr__(self):
         return '<{}() object at {}>'.format(
@@ -269,20 +315,29 @@ class NodeViewer(QtWidgets.QGraphicsView):
         """
         self.setSceneRect(self._scene_range)
         self.fitInView(self._scene_range, QtCore.Qt.KeepAspectRatio)
+        self.schedule_virtual_update()
+        self.schedule_lod_update()
 
     def _combined_rect(self, nodes):
         """
         Returns a QRectF with the combined size of the provided node items.
 
         Args:
-            nodes (list[AbstractNodeItem]): list of node qgraphics items.
+            nodes (list[AbstractNodeItem or NodeGraphQt.NodeObject]): list of
+                node qgraphics items or deferred nodes
+                (see :meth:`NodeViewer.add_deferred_node`).
 
         Returns:
             QtCore.QRectF: combined rect
         """
-        group = self.scene().createItemGroup(nodes)
-        rect = group.boundingRect()
-        self.scene().destroyItemGroup(group)
+        # the detached and deferred nodes can't be grouped in the scene.
+        rect = QtCore.QRectF()
+        for node in nodes:
+            if node in self._deferred_nodes:
+                l, t, r, b = self._deferred_node_bounds(node)
+            else:
+                l, t, r, b = SpatialIndex.item_bounds(node)
+            rect |= QtCore.QRectF(l, t, r - l, b - t)
         return rect
 
     def _items_near(self, pos, item_type=None, width=20, height=20):
@@ -301,14 +356,7 @@ class NodeViewer(QtWidgets.QGraphicsView):
         """
         x, y = pos.x() - width, pos.y() - height
         rect = QtCore.QRectF(x, y, width, height)
-        items = []
-        excl = [self._LIVE_PIPE, self._SLICER_PIPE]
-        for item in self.scene().items(rect):
-            if item in excl:
-                continue
-            if not item_type or isinstance(item, item_type):
-                items.append(item)
-        return items
+        return self.items_in_area(rect, item_type=item_type)
 
     def _on_search_submitted(self, node_type):
         """
@@ -332,11 +380,11 @@ class NodeViewer(QtWidgets.QGraphicsView):
             path (QtGui.QPainterPath): slicer path.
         """
         ports = []
-        for i in self.scene().items(path):
-            if isinstance(i, PipeItem) and i != self._LIVE_PIPE:
-                if any([i.input_port.locked, i.output_port.locked]):
-                    continue
-                ports.append([i.input_port, i.output_port])
+        for i in self.items_in_area(path, item_type=PipeItem,
+                                    children=False):
+            if any([i.input_port.locked, i.output_port.locked]):
+                continue
+            ports.append([i.input_port, i.output_port])
         self.connection_sliced.emit(ports)
 
     # --- reimplemented events ---
@@ -534,13 +582,12 @@ class NodeViewer(QtWidgets.QGraphicsView):
                 self._rubber_band.hide()
 
                 rect = QtCore.QRect(self._origin_pos, event.pos()).normalized()
-                rect_items = self.scene().items(
-                    self.mapToScene(rect).boundingRect()
+                rect_items = self.items_in_area(
+                    self.mapToScene(rect).boundingRect(),
+                    item_type=AbstractNodeItem,
+                    children=False
                 )
-                node_ids = []
-                for item in rect_items:
-                    if isinstance(item, AbstractNodeItem):
-                        node_ids.append(item.id)
+                node_ids = [item.id for item in rect_items]
 
                 # emit the node selection signals.
                 if node_ids:
@@ -613,10 +660,8 @@ class NodeViewer(QtWidgets.QGraphicsView):
                 if not self._rubber_band.isVisible():
                     self._rubber_band.show()
                 map_rect = self.mapToScene(rect).boundingRect()
-                path = QtGui.QPainterPath()
-                path.addRect(map_rect)
                 self._rubber_band.setGeometry(rect)
-                self.scene().setSelectionArea(path)
+                self._set_selection_area(map_rect)
                 self.scene().update(map_rect)
 
                 if self.SHIFT_state or self.CTRL_state:
@@ -640,8 +685,12 @@ class NodeViewer(QtWidgets.QGraphicsView):
 
                 if self.pipe_collision:
                     colliding_pipes = [
-                        i for i in node.collidingItems()
-                        if isinstance(i, PipeItem) and i.isVisible()
+                        i for i in self.items_in_area(
+                            node.sceneBoundingRect(),
+                            item_type=PipeItem,
+                            children=False
+                        )
+                        if node.collidesWithItem(i)
                     ]
                     for pipe in colliding_pipes:
                         if not pipe.input_port:
@@ -1145,16 +1194,20 @@ class NodeViewer(QtWidgets.QGraphicsView):
         (adds a new pipe item to draw between 2 ports)
         """
         pipe = PipeItem()
-        self.scene().addItem(pipe)
+        # virtualized mode: pipes between 2 detached nodes stay out of the
+        # scene until one of the nodes is attached ("_attach_node()" draws
+        # the path then).
+        if start_port.scene() or end_port.scene():
+            self.scene().addItem(pipe)
         pipe.set_connections(start_port, end_port)
-        pipe.draw_path(pipe.input_port, pipe.output_port)
+        if pipe.scene():
+            pipe.draw_path(pipe.input_port, pipe.output_port)
         if start_port.node.selected or end_port.node.selected:
             pipe.highlight()
         if not start_port.node.visible or not end_port.node.visible:
             pipe.hide()
 
-    @staticmethod
-    def acyclic_check(start_port, end_port):
+    def acyclic_check(self, start_port, end_port):
         """
         Validate the node connections, so it doesn't loop itself.
 
@@ -1166,20 +1219,33 @@ class NodeViewer(QtWidgets.QGraphicsView):
             bool: True if port connection is valid.
         """
         start_node = start_port.node
-        check_nodes = [end_port.node]
+        end_node = end_port.node
+        if end_port.port_type == PortTypeEnum.IN.value:
+            out_id, in_id = start_node.id, end_node.id
+        else:
+            out_id, in_id = end_node.id, start_node.id
+
+        reachability = self.reachability
+        if reachability is not None and \
+                out_id in reachability and in_id in reachability:
+            return reachability.accepts_edge(out_id, in_id)
+
+        # no reachability index, search the port items.
         io_types = {
             PortTypeEnum.IN.value: 'outputs',
             PortTypeEnum.OUT.value: 'inputs'
         }
+        check_nodes = deque([end_node])
+        visited = {end_node}
         while check_nodes:
-            check_node = check_nodes.pop(0)
+            check_node = check_nodes.popleft()
             for check_port in getattr(check_node, io_types[end_port.port_type]):
-                if check_port.connected_ports:
-                    for port in check_port.connected_ports:
-                        if port.node != start_node:
-                            check_nodes.append(port.node)
-                        else:
-                            return False
+                for port in check_port.connected_ports:
+                    if port.node == start_node:
+                        return False
+                    if port.node not in visited:
+                        visited.add(port.node)
+                        check_nodes.append(port.node)
         return True
 
     # --- viewer ---
@@ -1329,6 +1395,172 @@ class NodeViewer(QtWidgets.QGraphicsView):
 
         return file_path
 
+    def register_item(self, item):
+        """
+        Add a node or pipe item to the viewer registries, called by the item
+        when it's been added to the scene.
+
+        Args:
+            item (AbstractNodeItem or PipeItem): graphic item.
+        """
+        if isinstance(item, AbstractNodeItem):
+            self._node_items[item] = None
+            self._spatial_index.insert(item)
+        elif isinstance(item, PipeItem):
+            self._pipe_items[item] = None
+            # the live pipe follows the cursor and is never queried.
+            if not isinstance(item, LivePipeItem):
+                self._spatial_index.insert(item)
+
+    def unregister_item(self, item):
+        """
+        Remove a node or pipe item from the viewer registries, called by the
+        item when it's about to be removed from the scene.
+
+        Args:
+            item (AbstractNodeItem or PipeItem): graphic item.
+        """
+        self._node_items.pop(item, None)
+        self._pipe_items.pop(item, None)
+        self._spatial_index.remove(item)
+
+    def update_item_bounds(self, item):
+        """
+        Flag a registered or detached node item (or a pipe item) that has
+        been moved or resized so it's re-indexed before the next query.
+
+        Args:
+            item (AbstractNodeItem or PipeItem): graphic item.
+        """
+        self._spatial_index.update(item)
+        self._detached_index.update(item)
+
+    def items_in_area(self, area, mode=QtCore.Qt.IntersectsItemShape,
+                      item_type=None, children=True, ordered=True):
+        """
+        Returns the visible items in the scene area in descending stacking
+        order like "QGraphicsScene.items()" but only the registered node and
+        pipe items (and their children) near the area are tested.
+
+        Args:
+            area (QtCore.QRectF or QtGui.QPainterPath): scene area.
+            mode (QtCore.Qt.ItemSelectionMode): shape selection mode.
+            item_type: filter item type. (optional)
+            children (bool): false to only return top level items.
+            ordered (bool): false to skip sorting the items.
+
+        Returns:
+            list[QtWidgets.QGraphicsItem]: qgraphics items.
+        """
+        if isinstance(area, QtGui.QPainterPath):
+            path = area
+            rect = area.boundingRect()
+            inner = None
+        else:
+            path = QtGui.QPainterPath()
+            path.addRect(area)
+            rect = area
+            inner = area.left(), area.top(), area.right(), area.bottom()
+        index = self._spatial_index
+        candidates = index.query(rect)
+        if ordered:
+            candidates.sort(key=index.stacking_key, reverse=True)
+        items = []
+        for item in candidates:
+            if not children:
+                if item_type and not isinstance(item, item_type):
+                    continue
+                if inner and index.bounds_within(item, *inner):
+                    # the whole item is in the rect no need to test its shape.
+                    if item.isVisible():
+                        items.append(item)
+                    continue
+            if not inner and mode == QtCore.Qt.IntersectsItemShape:
+                # cheap test with the item bounds before mapping the path.
+                if not path.intersects(index.bounds(item)):
+                    continue
+            self._collect_items(item, path, mode, children, items)
+        if item_type and children:
+            items = [i for i in items if isinstance(i, item_type)]
+        return items
+
+    def _collect_items(self, item, path, mode, children, items):
+        """
+        Append the item and its children colliding with the scene path to
+        the items list in descending stacking order.
+
+        Args:
+            item (QtWidgets.QGraphicsItem): graphic item.
+            path (QtGui.QPainterPath): scene path.
+            mode (QtCore.Qt.ItemSelectionMode): shape selection mode.
+            children (bool): include the child items.
+            items (list): found items.
+        """
+        if not item.isVisible():
+            return
+        behind = []
+        if children:
+            for child in reversed(item.childItems()):
+                if child.flags() & QtWidgets.QGraphicsItem.ItemStacksBehindParent:
+                    behind.append(child)
+                else:
+                    self._collect_items(child, path, mode, True, items)
+        local_path = item.mapFromScene(path)
+        if mode in (QtCore.Qt.ContainsItemShape,
+                    QtCore.Qt.ContainsItemBoundingRect):
+            # the scene also checks the bounding rect is in the area.
+            collides = local_path.contains(item.boundingRect())
+        else:
+            collides = True
+        if collides and item.collidesWithPath(local_path, mode):
+            items.append(item)
+        for child in behind:
+            self._collect_items(child, path, mode, True, items)
+
+    def _set_selection_area(self, rect):
+        """
+        Select the node and pipe items in the scene rect and unselect the
+        rest (same as "QGraphicsScene.setSelectionArea()") with the
+        "selectionChanged" signal emitted once.
+
+        Args:
+            rect (QtCore.QRectF): scene rect.
+        """
+        # "setSelected()" does nothing on items that can't be selected.
+        selection = set(
+            self.items_in_area(rect, children=False, ordered=False)
+        )
+        scene = self.scene()
+        current = set(scene.selectedItems())
+        if selection == current:
+            return
+        changed = bool(current - selection)
+        blocked = scene.blockSignals(True)
+        try:
+            for item in current - selection:
+                item.setSelected(False)
+            for item in selection - current:
+                item.setSelected(True)
+                changed = changed or item.isSelected()
+        finally:
+            scene.blockSignals(blocked)
+        if changed:
+            scene.selectionChanged.emit()
+
+    def _on_selection_changed(self):
+        """
+        Slot when the scene selection changed, caches the selected items.
+        """
+        nodes = []
+        pipes = []
+        for item in self.scene().selectedItems():
+            if isinstance(item, AbstractNodeItem):
+                nodes.append(item)
+            elif isinstance(item, PipeItem):
+                pipes.append(item)
+        self._selected_nodes = nodes
+        self._selected_pipes = pipes
+
     def all_pipes(self):
         """
         Returns all pipe qgraphic items.
@@ -1336,9 +1568,8 @@ class NodeViewer(QtWidgets.QGraphicsView):
         Returns:
             list[PipeItem]: instances of pipe items.
         """
-        excl = [self._LIVE_PIPE, self._SLICER_PIPE]
-        return [i for i in self.scene().items()
-                if isinstance(i, PipeItem) and i not in excl]
+        excl = (self._LIVE_PIPE, self._SLICER_PIPE)
+        return [i for i in self._pipe_items if i not in excl]
 
     def all_nodes(self):
         """
@@ -1347,8 +1578,7 @@ class NodeViewer(QtWidgets.QGraphicsView):
         Returns:
             list[AbstractNodeItem]: instances of node items.
         """
-        return [i for i in self.scene().items()
-                if isinstance(i, AbstractNodeItem)]
+        return list(self._node_items)
 
     def selected_nodes(self):
         """
@@ -1357,8 +1587,7 @@ class NodeViewer(QtWidgets.QGraphicsView):
         Returns:
             list[AbstractNodeItem]: instances of node items.
         """
-        return [i for i in self.scene().selectedItems()
-                if isinstance(i, AbstractNodeItem)]
+        return list(self._selected_nodes)
 
     def selected_pipes(self):
         """
@@ -1367,9 +1596,7 @@ class NodeViewer(QtWidgets.QGraphicsView):
         Returns:
             list[Pipe]: pipe items.
         """
-        pipes = [i for i in self.scene().selectedItems()
-                 if isinstance(i, PipeItem)]
-        return pipes
+        return list(self._selected_pipes)
 
     def selected_items(self):
         """
@@ -1379,14 +1606,7 @@ class NodeViewer(QtWidgets.QGraphicsView):
             tuple(list[AbstractNodeItem], list[Pipe]):
                 selected (node items, pipe items).
         """
-        nodes = []
-        pipes = []
-        for item in self.scene().selectedItems():
-            if isinstance(item, AbstractNodeItem):
-                nodes.append(item)
-            elif isinstance(item, PipeItem):
-                pipes.append(item)
-        return nodes, pipes
+        return list(self._selected_nodes), list(self._selected_pipes)
 
     def add_node(self, node, pos=None):
         """
@@ -1398,8 +1618,36 @@ class NodeViewer(QtWidgets.QGraphicsView):
         """
         pos = pos or (self._previous_pos.x(), self._previous_pos.y())
         node.pre_init(self, pos)
+        if self._virtualized and isinstance(node, NodeItem):
+            # attached by "update_virtual_items()" if it's in the viewport.
+            node._detached_viewer = self
+            self._detached_nodes.add(node)
+            node.post_init(self, pos)
+            self._detached_index.insert(node)
+            self.schedule_virtual_update()
+            return
         self.scene().addItem(node)
         node.post_init(self, pos)
+        if isinstance(node, NodeItem) and node.lod_widgets:
+            self.schedule_lod_update()
+
+    def add_nodes(self, nodes, positions=None):
+        """
+        Add node items into the scene in one batch, the viewport is only
+        repainted once all the items have been added.
+
+        Args:
+            nodes (list[AbstractNodeItem]): node item instances.
+            positions (list[tuple or list]): node scene positions (optional).
+        """
+        positions = positions or [None] * len(nodes)
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            for node, pos in zip(nodes, positions):
+                self.add_node(node, pos)
+        finally:
+            self.setUpdatesEnabled(updates_enabled)
 
     @staticmethod
     def remove_node(node):
@@ -1412,6 +1660,39 @@ class NodeViewer(QtWidgets.QGraphicsView):
         if isinstance(node, AbstractNodeItem):
             node.delete()
 
+    def clear_nodes(self):
+        """
+        Remove all the node and pipe items from the scene in one operation.
+
+        Warnings:
+            The removed items are deleted and can't be added back to the
+            scene, this is used when the whole session is cleared.
+        """
+        # return the pooled widgets before their slots are deleted.
+        for node in self._lod_nodes:
+            node.set_lod_active(False)
+        self._lod_nodes = set()
+        for node in self._detached_nodes:
+            node._detached_viewer = None
+        self._detached_nodes = set()
+        self._detached_index.clear()
+        self._deferred_nodes = set()
+        self._deferred_index.clear()
+
+        scene = self.scene()
+        viewer_items = [self._cursor_text, self._LIVE_PIPE, self._SLICER_PIPE]
+        for item in viewer_items:
+            scene.removeItem(item)
+        scene.clear()
+        # deleted items don't unregister themselves.
+        self._node_items = {}
+        self._pipe_items = {}
+        self._selected_nodes = []
+        self._selected_pipes = []
+        self._spatial_index.clear()
+        for item in viewer_items:
+            scene.addItem(item)
+
     def move_nodes(self, nodes, pos=None, offset=None):
         """
         Globally move specified nodes.
@@ -1569,6 +1850,238 @@ class NodeViewer(QtWidgets.QGraphicsView):
         if self.get_zoom() > 0.1:
             self.reset_zoom(self._scene_range.center())
 
+    def virtualized(self):
+        """
+        Returns true if node items outside the viewport are kept out of the
+        scene.
+
+        Returns:
+            bool: virtualized mode.
+        """
+        return self._virtualized
+
+    def set_virtualized(self, mode):
+        """
+        Enable/disable the virtualized mode.
+
+        In virtualized mode only the node items intersecting the viewport
+        (plus a margin) and their pipes are in the scene, the other node
+        items are detached and attached again when scrolled into view.
+
+        Args:
+            mode (bool): true to enable.
+        """
+        self._virtualized = mode
+        if mode:
+            self.update_virtual_items()
+        else:
+            # the created items are added straight to the scene.
+            for node in list(self._deferred_nodes):
+                node.create_view()
+            for node in list(self._detached_nodes):
+                self._attach_node(node)
+
+    def set_virtual_margin(self, margin):
+        """
+        Set the margin around the viewport where nodes stay attached.
+
+        Args:
+            margin (float): margin as a fraction of the viewport size.
+        """
+        self._virtual_margin = margin
+        self.schedule_virtual_update()
+
+    def detached_nodes(self):
+        """
+        Returns the node items currently kept out of the scene.
+
+        Returns:
+            list[AbstractNodeItem]: detached node items.
+        """
+        return list(self._detached_nodes)
+
+    def discard_detached_node(self, node):
+        """
+        Forget a detached node item that was deleted.
+
+        Args:
+            node (AbstractNodeItem): node item.
+        """
+        self._detached_nodes.discard(node)
+        self._detached_index.remove(node)
+        node._detached_viewer = None
+
+    def add_deferred_node(self, node):
+        """
+        Add a node that doesn't have a node item yet (virtualized mode).
+
+        The node model position and size stand in for the item bounds and
+        the item is created with :meth:`NodeGraphQt.NodeObject.create_view`
+        once the node gets near the viewport.
+
+        Args:
+            node (NodeGraphQt.NodeObject): node without a node item.
+        """
+        self._deferred_nodes.add(node)
+        self._deferred_index.insert(node)
+        self.schedule_virtual_update()
+
+    def remove_deferred_node(self, node):
+        """
+        Forget a deferred node that was deleted or got its node item.
+
+        Args:
+            node (NodeGraphQt.NodeObject): node without a node item.
+        """
+        self._deferred_nodes.discard(node)
+        self._deferred_index.remove(node)
+
+    def update_deferred_node(self, node):
+        """
+        Flag a deferred node that has been moved or resized.
+
+        Args:
+            node (NodeGraphQt.NodeObject): node without a node item.
+        """
+        self._deferred_index.update(node)
+        self.schedule_virtual_update()
+
+    def is_deferred_node(self, node):
+        """
+        Check if the node has been added without a node item.
+
+        Args:
+            node (NodeGraphQt.NodeObject): node object.
+
+        Returns:
+            bool: true if the node is waiting for its node item.
+        """
+        return node in self._deferred_nodes
+
+    @staticmethod
+    def _deferred_node_bounds(node):
+        x, y = node.model.pos
+        return x, y, x + node.model.width, y + node.model.height
+
+    def schedule_virtual_update(self):
+        """
+        Attach and detach node items once the view settled.
+        """
+        if not getattr(self, '_virtualized', False):
+            # disabled or called from "__init__" before the timer exists.
+            return
+        if not self._virtual_timer.isActive():
+            self._virtual_timer.start()
+
+    def _virtual_area(self):
+        rect = self.mapToScene(self.viewport().rect()).boundingRect()
+        dx = rect.width() * self._virtual_margin
+        dy = rect.height() * self._virtual_margin
+        return rect.adjusted(-dx, -dy, dx, dy)
+
+    def update_virtual_items(self):
+        """
+        Create the items of the deferred nodes intersecting the viewport
+        (plus margin), attach the detached node items intersecting it and
+        detach the node items outside of it.
+        """
+        if not self._virtualized:
+            return
+        area = self._virtual_area()
+        # the created items are added as detached node items.
+        for node in self._deferred_index.query(area):
+            node.create_view()
+        attached = []
+        for node in self._detached_index.query(area):
+            self._attach_node(node)
+            attached.append(node.id)
+        in_area = set(self._spatial_index.query(area))
+        for node in list(self._node_items):
+            if node in in_area or not isinstance(node, NodeItem):
+                continue
+            if not node.isSelected():
+                self._detach_node(node)
+        if attached:
+            self.nodes_attached.emit(attached)
+        self.schedule_lod_update()
+
+    @staticmethod
+    def _node_pipes(node):
+        pipes = []
+        for port in node.inputs + node.outputs:
+            pipes.extend(port.connected_pipes)
+        return pipes
+
+    def _attach_node(self, node):
+        self._detached_nodes.discard(node)
+        self._detached_index.remove(node)
+        node._detached_viewer = None
+        self.scene().addItem(node)
+        for pipe in self._node_pipes(node):
+            if pipe.scene() is None:
+                self.scene().addItem(pipe)
+            pipe.draw_path(pipe.input_port, pipe.output_port)
+
+    def _detach_node(self, node):
+        scene = self.scene()
+        for pipe in self._node_pipes(node):
+            other = pipe.output_port if pipe.input_port.node is node \
+                else pipe.input_port
+            if other.node.scene() is None and pipe.scene():
+                scene.removeItem(pipe)
+        scene.removeItem(node)
+        node._detached_viewer = self
+        self._detached_nodes.add(node)
+        self._detached_index.insert(node)
+
+    def lod_threshold(self):
+        """
+        Returns the minimum view scale where node widgets are created.
+
+        Returns:
+            float: view scale.
+        """
+        return self._lod_threshold
+
+    def set_lod_threshold(self, scale):
+        """
+        Set the minimum view scale where node widgets are created, below it
+        nodes only paint their widget previews.
+
+        Args:
+            scale (float): view scale (1.0 is not zoomed).
+        """
+        self._lod_threshold = scale
+        self.schedule_lod_update()
+
+    def schedule_lod_update(self):
+        """
+        Update the level of detail node widgets once the view settled.
+        """
+        if not hasattr(self, '_lod_timer'):
+            # called from "__init__" before the timer exists.
+            return
+        if not self._lod_timer.isActive():
+            self._lod_timer.start()
+
+    def update_lod_widgets(self):
+        """
+        Bind pooled widgets to the nodes on screen when the view is zoomed in
+        close enough and recycle the widgets of all other nodes.
+        """
+        near = set()
+        if self.transform().m11() >= self._lod_threshold:
+            rect = self.mapToScene(self.viewport().rect()).boundingRect()
+            for item in self.items_in_area(rect, item_type=NodeItem,
+                                           children=False):
+                if item.lod_widgets:
+                    near.add(item)
+        for node in self._lod_nodes - near:
+            node.set_lod_active(False)
+        for node in near - self._lod_nodes:
+            node.set_lod_active(True)
+        self._lod_nodes = near
+
     def force_update(self):
         """
         Redraw the current node graph scene.
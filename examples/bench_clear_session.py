@@ -0,0 +1,57 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Benchmark clearing a large node graph session.
+
+A chain of nodes is loaded with "NodeGraph.deserialize_session()", the
+pending events are processed and then "NodeGraph.clear_session()" is
+timed.
+
+    python -m examples.bench_clear_session --nodes 10000
+"""
+from Qt import QtWidgets
+
+from NodeGraphQt import NodeGraph
+
+from examples.bench_utils import (
+    BenchNode,
+    Timer,
+    argument_parser,
+    chain_session
+)
+
+
+def main():
+    parser = argument_parser(__doc__.splitlines()[1])
+    parser.add_argument('--virtualized', action='store_true',
+                        help='load the session in the virtualized mode')
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication([])
+
+    graph = NodeGraph()
+    graph.register_node(BenchNode)
+    graph.set_virtualized(args.virtualized)
+    # items the viewer keeps in the scene (cursor text, live pipe...)
+    viewer_items = len(graph.scene().items())
+    data = chain_session(args.nodes)
+
+    with Timer() as t:
+        graph.deserialize_session(data)
+    app.processEvents()
+    assert len(graph.all_nodes()) == args.nodes
+    print('load_session  {} nodes: {:.2f} s ({} scene items)'.format(
+        args.nodes, t.elapsed, len(graph.scene().items())))
+
+    with Timer() as t:
+        graph.clear_session()
+    assert not graph.all_nodes()
+    assert len(graph.scene().items()) == viewer_items
+    assert graph.undo_stack().count() == 0
+    print('clear_session {} nodes: {:.2f} s'.format(args.nodes, t.elapsed))
+
+    app.quit()
+
+
+if __name__ == '__main__':
+    main()
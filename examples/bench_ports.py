@@ -0,0 +1,141 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Benchmark connecting ports and traversing the port connections.
+
+Random pipes are made between the nodes, then the connected ports of every
+port are read with the old lookup through the peer nodes (see
+"lookup_connected_ports()"), "Port.connected_ports()" and
+"Port.peer_ports()".
+
+    python -m examples.bench_ports --nodes 5000 --edges 10000
+"""
+import random
+
+from Qt import QtWidgets
+
+from NodeGraphQt import NodeGraph
+
+from examples.bench_utils import BenchNode, Timer, argument_parser
+
+
+def lookup_connected_ports(port):
+    """
+    Connected ports looked up from the port model through the peer nodes
+    (how "Port.connected_ports()" used to build its result).
+
+    Args:
+        port (NodeGraphQt.Port): port object.
+
+    Returns:
+        list[NodeGraphQt.Port]: connected ports.
+    """
+    ports = []
+    graph = port.node().graph
+    for node_id, port_names in port.model.connected_ports.items():
+        node = graph.get_node_by_id(node_id)
+        for port_name in port_names:
+            if port.type_() == 'in':
+                ports.append(node.outputs()[port_name])
+            else:
+                ports.append(node.inputs()[port_name])
+    return ports
+
+
+def best_of(func, repeat):
+    """
+    Returns the result and the fastest run time of a function.
+
+    Args:
+        func (function): function to time.
+        repeat (int): number of runs.
+
+    Returns:
+        tuple: result, time in seconds.
+    """
+    times = []
+    result = None
+    for _ in range(repeat):
+        with Timer() as t:
+            result = func()
+        times.append(t.elapsed)
+    return result, min(times)
+
+
+def main():
+    parser = argument_parser(__doc__.splitlines()[1], nodes=5000)
+    parser.add_argument('--edges', type=int, default=10000,
+                        help='number of pipes (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='traversal runs, the fastest is reported '
+                             '(default: %(default)s)')
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication([])
+
+    graph = NodeGraph()
+    graph.register_node(BenchNode)
+    # random pipes may loop and only the port adjacency is measured here,
+    # the node items of nodes out of view are not built.
+    graph.set_acyclic(False)
+    graph.set_virtualized(True)
+
+    with Timer() as t:
+        nodes = [
+            graph.create_node(BenchNode.type_, selected=False,
+                              pos=[(i % 100) * 200, (i // 100) * 120],
+                              push_undo=False)
+            for i in range(args.nodes)
+        ]
+    print('create {} nodes: {:.2f} s'.format(args.nodes, t.elapsed))
+
+    rand = random.Random(0)
+    pairs = []
+    for i in range(args.edges):
+        src, trg = rand.sample(nodes, 2)
+        pairs.append((src.output(i % 2), trg.input(0)))
+
+    with Timer() as t:
+        for out_port, in_port in pairs:
+            out_port.connect_to(in_port, push_undo=False, emit_signal=False)
+    print('connect {} pipes: {:.1f} ms'.format(
+        args.edges, t.elapsed * 1e3))
+
+    ports = [p for n in nodes for p in n.input_ports() + n.output_ports()]
+
+    old, t_old = best_of(
+        lambda: [lookup_connected_ports(p) for p in ports], args.repeat)
+    new, t_new = best_of(
+        lambda: [p.connected_ports() for p in ports], args.repeat)
+    peers, t_peers = best_of(
+        lambda: [p.peer_ports() for p in ports], args.repeat)
+    nodes_down, t_nodes = best_of(
+        lambda: [n.connected_output_nodes() for n in nodes], args.repeat)
+
+    for p, a, b, c in zip(ports, old, new, peers):
+        assert set(a) == set(b) == set(c), p
+    count = sum(len(p) for p in new)
+    print('traverse {} ports ({} connections):'.format(len(ports), count))
+    print('  lookup through the peer nodes  {:.1f} ms'.format(t_old * 1e3))
+    print('  Port.connected_ports()         {:.1f} ms'.format(t_new * 1e3))
+    print('  Port.peer_ports()              {:.1f} ms'.format(t_peers * 1e3))
+    print('  connected_output_nodes()       {:.1f} ms ({} nodes)'.format(
+        t_nodes * 1e3, len(nodes_down)))
+
+    # the adjacency follows undo/redo of the connection commands.
+    undo_stack = graph.undo_stack()
+    out_port, in_port = nodes[0].output(1), nodes[1].input(0)
+    out_port.disconnect_from(in_port)
+    out_port.connect_to(in_port)
+    undo_stack.undo()
+    assert in_port not in out_port.peer_ports()
+    undo_stack.redo()
+    assert in_port in out_port.peer_ports()
+    assert set(lookup_connected_ports(in_port)) == set(in_port.peer_ports())
+    print('undo/redo: ok')
+
+    app.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Benchmark the rubber band selection and the viewer area queries.
+
+A chain of nodes is loaded on a grid, the viewer is zoomed out to show
+the whole graph and a rubber band is dragged over it with mouse events.
+The viewer area queries ("NodeViewer.items_in_area()") are then timed
+next to the same "QGraphicsScene.items()" queries.
+
+    python -m examples.bench_rubber_band --nodes 10000
+"""
+from Qt import QtCore, QtGui, QtWidgets
+
+from NodeGraphQt import NodeGraph
+from NodeGraphQt.qgraphics.pipe import PipeItem
+
+from examples.bench_utils import (
+    BenchNode,
+    Timer,
+    argument_parser,
+    chain_session,
+    median
+)
+
+
+def mouse_event(viewer, event_type, pos, buttons=QtCore.Qt.LeftButton):
+    """
+    Returns a left mouse button event at the viewer position.
+    """
+    pos = QtCore.QPointF(pos)
+    global_pos = QtCore.QPointF(viewer.viewport().mapToGlobal(pos.toPoint()))
+    return QtGui.QMouseEvent(event_type, pos, global_pos,
+                             QtCore.Qt.LeftButton, buttons,
+                             QtCore.Qt.NoModifier)
+
+
+def drag_rubber_band(viewer, start, end, steps):
+    """
+    Drag a rubber band from the start to the end position.
+
+    Returns:
+        list[float]: mouse move event times in seconds.
+    """
+    viewer.scene().clearSelection()
+    viewer.mousePressEvent(
+        mouse_event(viewer, QtCore.QEvent.MouseButtonPress, start))
+    delta = QtCore.QPointF(end - start) / steps
+    times = []
+    pos = QtCore.QPointF(start)
+    for _ in range(steps):
+        pos += delta
+        event = mouse_event(viewer, QtCore.QEvent.MouseMove, pos)
+        with Timer() as t:
+            viewer.mouseMoveEvent(event)
+        times.append(t.elapsed)
+    viewer.mouseReleaseEvent(mouse_event(
+        viewer, QtCore.QEvent.MouseButtonRelease, pos, QtCore.Qt.NoButton))
+    return times
+
+
+def time_query(func, repeat=5):
+    """
+    Returns the result and the fastest run time of a query.
+    """
+    times = []
+    result = None
+    for _ in range(repeat):
+        with Timer() as t:
+            result = func()
+        times.append(t.elapsed)
+    return result, min(times)
+
+
+def compare(label, area, viewer, mode=QtCore.Qt.IntersectsItemShape,
+            **kwargs):
+    """
+    Print the "items_in_area()" time next to the scene query time.
+    """
+    scene = viewer.scene()
+    indexed, t_index = time_query(
+        lambda: viewer.items_in_area(area, mode=mode, **kwargs))
+    scene_items, t_scene = time_query(lambda: scene.items(area, mode))
+    print('  {:<32} scene {:8.2f} ms, index {:8.2f} ms ({} items)'.format(
+        label, t_scene * 1e3, t_index * 1e3, len(indexed)))
+    return scene_items, indexed
+
+
+def main():
+    parser = argument_parser(__doc__.splitlines()[1])
+    parser.add_argument('--steps', type=int, default=50,
+                        help='rubber band mouse moves (default: %(default)s)')
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication([])
+
+    graph = NodeGraph()
+    graph.register_node(BenchNode)
+    with Timer() as t:
+        graph.deserialize_session(chain_session(args.nodes))
+    print('load {} nodes: {:.2f} s'.format(args.nodes, t.elapsed))
+
+    viewer = graph.viewer()
+    viewer.resize(1600, 1000)
+    viewer.show()
+    app.processEvents()
+
+    # zoom out to show the whole graph.
+    graph.clear_selection()
+    graph.fit_to_selection()
+    app.processEvents()
+    nodes_rect = viewer.scene().itemsBoundingRect()
+
+    # rubber band from an empty corner over the whole graph.
+    start = viewer.mapFromScene(nodes_rect.topLeft() - QtCore.QPointF(50, 50))
+    end = viewer.mapFromScene(nodes_rect.bottomRight())
+    times = drag_rubber_band(viewer, start, end, args.steps)
+    print('rubber band over the whole graph ({} moves):'.format(args.steps))
+    print('  median {:.2f} ms, max {:.2f} ms, {} nodes selected'.format(
+        median(times) * 1e3, max(times) * 1e3,
+        len(graph.selected_nodes())))
+
+    # rubber band over a 2000 x 1200 area.
+    end = viewer.mapFromScene(nodes_rect.topLeft() +
+                              QtCore.QPointF(2000, 1200))
+    times = drag_rubber_band(viewer, start, end, args.steps)
+    print('rubber band over a 2000 x 1200 area ({} moves):'.format(
+        args.steps))
+    print('  median {:.2f} ms, max {:.2f} ms, {} nodes selected'.format(
+        median(times) * 1e3, max(times) * 1e3,
+        len(graph.selected_nodes())))
+    graph.clear_selection()
+
+    # queries with the arguments used by the viewer interactions.
+    print('area queries:')
+    small_rect = QtCore.QRectF(nodes_rect.topLeft(), QtCore.QSizeF(2000, 1200))
+    compare('selection area, whole graph', nodes_rect, viewer,
+            children=False, ordered=False)
+    compare('selection area, 2000 x 1200', small_rect, viewer,
+            children=False, ordered=False)
+    center = nodes_rect.center()
+    compare('point hit, 20 x 20 area',
+            QtCore.QRectF(center.x() - 10, center.y() - 10, 20, 20), viewer)
+
+    # slicer path crossing one pipe of every row.
+    path = QtGui.QPainterPath(QtCore.QPointF(center.x(), nodes_rect.top()))
+    path.lineTo(center.x(), nodes_rect.bottom())
+    scene_items, pipes = compare('slicer path', path, viewer,
+                                 item_type=PipeItem, children=False)
+    assert set(pipes) == set(i for i in scene_items
+                             if isinstance(i, PipeItem))
+
+    # backdrop wrapped around a 20 x 20 block of nodes.
+    block = [graph.get_node_by_name('node {}'.format(row * 100 + col))
+             for row in range(20) for col in range(20)]
+    backdrop = graph.create_node('nodeGraphQt.nodes.BackdropNode',
+                                 push_undo=False)
+    backdrop.wrap_nodes(block)
+    compare('backdrop area', backdrop.view.sceneBoundingRect(), viewer,
+            mode=QtCore.Qt.ContainsItemShape, children=False)
+    contained, t_nodes = time_query(backdrop.view.get_nodes)
+    assert set(contained) == set(n.view for n in block)
+    print('  {:<32} {:>20.2f} ms ({} nodes)'.format(
+        'backdrop get_nodes', t_nodes * 1e3, len(contained)))
+
+    app.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""
+Shared helpers for the "bench_*.py" example benchmarks.
+
+The benchmarks are run from the repository root, for example:
+
+    python -m examples.bench_clear_session --nodes 10000
+
+Set "QT_QPA_PLATFORM=offscreen" to run them without a display.
+"""
+import argparse
+import time
+
+from NodeGraphQt import BaseNode
+
+
+class BenchNode(BaseNode):
+    """
+    A node class with 1 input and 2 outputs used by the benchmarks.
+    The input can take in multiple pipes.
+    """
+
+    # unique node identifier.
+    __identifier__ = 'nodes.bench'
+
+    # initial default node name.
+    NODE_NAME = 'node'
+
+    def __init__(self):
+        super(BenchNode, self).__init__()
+        self.add_input('in', multi_input=True)
+        self.add_output('next')
+        self.add_output('err')
+
+
+def argument_parser(description, nodes=10000):
+    """
+    Returns a command line parser with the common benchmark arguments.
+
+    Args:
+        description (str): benchmark description.
+        nodes (int): default node count.
+
+    Returns:
+        argparse.ArgumentParser: parser with the "--nodes" argument.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--nodes', type=int, default=nodes,
+                        help='number of nodes (default: %(default)s)')
+    return parser
+
+
+def chain_session(count, columns=100, spacing=(200, 120)):
+    """
+    Build the session data of "count" nodes laid out on a grid where each
+    node is connected to the previous one.
+
+    Args:
+        count (int): number of nodes.
+        columns (int): nodes per row.
+        spacing (tuple(int)): x, y distance between the nodes.
+
+    Returns:
+        dict: session data for "NodeGraph.deserialize_session()".
+    """
+    node_type = BenchNode.type_
+    nodes = {}
+    connections = []
+    for i in range(count):
+        nodes['n{}'.format(i)] = {
+            'type_': node_type,
+            'name': 'node {}'.format(i),
+            'pos': [(i % columns) * spacing[0], (i // columns) * spacing[1]],
+        }
+        if i:
+            connections.append({
+                'out': ['n{}'.format(i - 1), 'next'],
+                'in': ['n{}'.format(i), 'in'],
+            })
+    return {'graph': {}, 'nodes': nodes, 'connections': connections}
+
+
+class Timer(object):
+    """
+    Context manager measuring the elapsed time in seconds.
+
+    Example:
+        >>> with Timer() as t:
+        ...     do_something()
+        >>> print(t.elapsed)
+    """
+
+    def __init__(self):
+        self.elapsed = 0.0
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.elapsed = time.perf_counter() - self._start
+
+
+def median(values):
+    """
+    Returns the median of a list of numbers.
+
+    Args:
+        values (list[float]): numbers.
+
+    Returns:
+        float: median value.
+    """
+    values = sorted(values)
+    return values[len(values) // 2]
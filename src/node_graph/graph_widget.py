@@ -1,8 +1,8 @@
 import os
+from contextlib import contextmanager
 from pathlib import Path
 
 from PySide2.QtCore import Signal, Qt
-from PySide2.QtGui import QPixmap
 from PySide2.QtWidgets import QSizePolicy
 from Qt import QtWidgets
 from Qt.QtCore import QPropertyAnimation, QEasingCurve
@@ -11,8 +11,10 @@ from Qt.QtWidgets import (
 )
 
 from NodeGraphQt import NodeGraph, BaseNode, NodeBaseWidget
-from src.utils.app_config import Config
-from src.utils.task_node import TaskNode, TaskNodeManager
+from NodeGraphQt.base.commands import PortConnectedCmd
+from src.utils.app_config import Config, ConfigService
+from src.utils.task_node import TaskNode, TaskNodeManager, TaskNodeIndex
+from src.utils.thumbnail_service import ThumbnailService
 
 
 # 自定义可折叠面板
@@ -181,16 +183,31 @@ class CustomWidget(QWidget):
         self.set_brief_info()
 
     def set_brief_info(self, image_path=None):
-        """设置简略信息（图片）"""
+        """设置简略信息（图片缩略图，后台解码，完成前显示占位文本）"""
+        self._image_path = image_path
         if image_path:
-            pixmap = QPixmap(image_path)
-            if not pixmap.isNull():
+            # 占位文本, 缩略图就绪 (或加载失败) 时由回调替换
+            self._show_text("加载中...")
+            pixmap = ThumbnailService.instance().request(image_path, self._on_thumbnail_ready)
+            if pixmap is not None:
                 self.image_label.setPixmap(pixmap)
-                return
+            return
+
+        # 如果没有图片路径，显示默认文本
+        self._show_text("暂无简略信息")
+
+    def _on_thumbnail_ready(self, image_path, pixmap):
+        if image_path != self._image_path:
+            return  # 已经切换到其他图片
+        if pixmap is not None:
+            self.image_label.setPixmap(pixmap)
+        else:
+            # 图片加载失败
+            self._show_text("暂无简略信息")
 
-        # 如果没有图片路径或图片加载失败，显示默认文本
+    def _show_text(self, text):
         self.image_label.clear()
-        self.image_label.setText("暂无简略信息")
+        self.image_label.setText(text)
         self.image_label.setAlignment(Qt.AlignCenter)
 
 # 自定义节点
@@ -234,10 +251,9 @@ class DynamicNodeWidgetWrapper(NodeBaseWidget):
 
     def set_value(self, value):
         """
-        Set values to the input fields.
+        Set the template image path shown in the brief info.
         """
-
-        pass
+        self.get_custom_widget().set_brief_info(value)
 
 
 class MyNode(BaseNode):
@@ -248,6 +264,9 @@ class MyNode(BaseNode):
     __identifier__ = 'io.github.jchanvfx'
     NODE_NAME = 'my node'
 
+    # Set to False while TaskNodeGraph wires connections itself.
+    auto_connect = True
+
     def __init__(self):
         super(MyNode, self).__init__()
         self.image_path = None
@@ -256,8 +275,9 @@ class MyNode(BaseNode):
         self.add_output('interrupt')
         self.add_output('on_error')
         self.note_data = None
-        node_widget = DynamicNodeWidgetWrapper(self.view)
-        self.add_custom_widget(node_widget, tab='Custom')
+        # The proxy widget is only created while the node is zoomed in on
+        # screen, otherwise the slot paints the thumbnail.
+        self.preview_slot = self.add_lod_widget('dynamic_widget', DynamicNodeWidgetWrapper)
         # self._check_and_create_connections()
 
     def on_input_connected(self, in_port, out_port):
@@ -267,36 +287,40 @@ class MyNode(BaseNode):
 
     def update(self):
         super().update()
-        # Original config loading logic
-        current_dir = os.getcwd()
-        config_path = os.path.join(current_dir, "config", "app_config.json")
-        app_config = Config.from_file(config_path)
-        resource_path = app_config.maa_resource_path
-
         # New connection logic
-        self._check_and_create_connections()
-
-        # Original widget update logic
-        custom_widgets = self.view.widgets
-        if not custom_widgets:
-            return
+        if self.auto_connect:
+            self._check_and_create_connections()
+        self.update_preview()
 
-        wrapper_widget = next(iter(custom_widgets.values()), None)
-        if not wrapper_widget:
-            return
+    def update_preview(self):
+        """Refresh the brief info widget from note_data."""
+        # Shared in-memory config, only re-read when app_config.json changes
+        resource_path = ConfigService().get().maa_resource_path
 
-        custom_widget = wrapper_widget.get_custom_widget()
-        if not custom_widget:
-            return
         if self.note_data and 'template' in self.note_data:
             template = self.note_data['template']
             if isinstance(template, str):
                 self.image_path = os.path.join(resource_path, "image", template)
-                # custom_widget.set_brief_info(image_path)
             elif isinstance(template, list):
                 self.image_path = os.path.join(resource_path, "image", template[0])
-        custom_widget.set_brief_info(self.image_path)
 
+        # The bound widget (if any) shows the image, the slot paints the thumbnail
+        self.preview_slot.set_value(self.image_path)
+        if not self.image_path:
+            self.preview_slot.set_preview(text="暂无简略信息")
+            return
+        self.preview_slot.set_preview(text="加载中...")
+        pixmap = ThumbnailService.instance().request(self.image_path, self._on_thumbnail_ready)
+        if pixmap is not None:
+            self.preview_slot.set_preview(pixmap)
+
+    def _on_thumbnail_ready(self, image_path, pixmap):
+        if image_path != self.image_path:
+            return
+        if pixmap is not None:
+            self.preview_slot.set_preview(pixmap)
+        else:
+            self.preview_slot.set_preview(text="暂无简略信息")
 
     def _check_and_create_connections(self):
         """
@@ -330,13 +354,22 @@ class MyNode(BaseNode):
 
 class TaskNodeGraph(QtWidgets.QWidget):
     node_select = Signal()  # Changed to more generic name
+    graph_rebuilt = Signal()  # Emitted once after refresh_graph() rebuilt the canvas
+    config_changed = Signal(object)  # ConfigService notifications, queued to the GUI thread
+
+    # Graphs with more nodes only keep the node items around the viewport in the scene
+    VIRTUALIZE_NODE_COUNT = 2000
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.node_graph = None
         self.node_manager = TaskNodeManager()  # Add TaskNodeManager
+        self._shown_file_path = None  # File currently shown on the canvas
         self.setup_ui()
         self.task_nodes = {}  # Dictionary to store graph nodes: {node_id: graph_node}
+        self._resource_path = ConfigService().get().maa_resource_path
+        self.config_changed.connect(self.on_config_changed)
+        ConfigService().subscribe(self.config_changed.emit)
 
     def setup_ui(self):
         layout = QtWidgets.QVBoxLayout(self)
@@ -363,28 +396,52 @@ class TaskNodeGraph(QtWidgets.QWidget):
     def load_from_file(self, file_path: str):
         """Load nodes from file using TaskNodeManager"""
         if self.node_manager.load_from_file(file_path):
-            self.refresh_graph()
+            if self._shown_file_path == self.node_manager.get_current_file_path():
+                # Same file reloaded: only patch what changed.
+                self.sync_graph()
+            else:
+                self.refresh_graph()
             return True
         return False
 
     def refresh_graph(self):
-        """Refresh the entire graph based on TaskNodeManager's nodes"""
-        # Clear existing graph
-        self.node_graph.clear_session()
-        self.task_nodes.clear()
-
-        # Create nodes for each TaskNode in manager
-        for task_node in self.node_manager.get_all_nodes():
-            self.create_graph_node(task_node)
+        """
+        Rebuild the entire graph from TaskNodeManager's nodes.
 
-        # Auto layout all nodes
-        nodes = self.node_graph.all_nodes()
-        self.node_graph.auto_layout_nodes(nodes=nodes, down_stream=False)
+        Nodes are created without auto connection, then all pipes are built
+        in one pass by _build_connections(). Graph signals are blocked and
+        nothing is recorded on the undo stack while rebuilding; graph_rebuilt
+        is emitted once at the end.
+        """
+        viewer = self.node_graph.viewer()
+        viewer.setUpdatesEnabled(False)
+        signals_blocked = self.node_graph.blockSignals(True)
+        try:
+            # Clear existing graph
+            self.node_graph.clear_session()
+            self.task_nodes.clear()
+            self.node_graph.set_virtualized(
+                len(self.node_manager.get_all_nodes()) > self.VIRTUALIZE_NODE_COUNT)
+
+            with self._auto_connect_suspended():
+                for task_node in self.node_manager.get_all_nodes():
+                    self.task_nodes[task_node.id] = self._new_graph_node(task_node)
+                self._build_connections()
+
+            # Auto layout all nodes
+            nodes = self.node_graph.all_nodes()
+            self.node_graph.auto_layout_nodes(nodes=nodes, down_stream=False)
+            self.node_graph.clear_undo_stack()
+        finally:
+            self.node_graph.blockSignals(signals_blocked)
+            viewer.setUpdatesEnabled(True)
+        self._shown_file_path = self.node_manager.get_current_file_path()
+        self.graph_rebuilt.emit()
 
     def create_graph_node(self, task_node: TaskNode) -> MyNode:
         """Create a graph node from a TaskNode"""
-        # Convert TaskNode to node configuration
-        node_config = task_node.to_dict()
+        # Shared read-only view of the TaskNode's cached serialisation
+        node_config = task_node.as_dict_view()
         # node_config.pop('NODE_NAME', None)  # Remove NODE_NAME from config
         # Create graph node
         graph_node = self.node_graph.create_node(
@@ -400,18 +457,193 @@ class TaskNodeGraph(QtWidgets.QWidget):
         graph_node.update()
         return graph_node
 
+    @contextmanager
+    def _auto_connect_suspended(self):
+        """Stop MyNode.update() from scanning the graph for connections."""
+        MyNode.auto_connect = False
+        try:
+            yield
+        finally:
+            MyNode.auto_connect = True
+
+    def sync_graph(self):
+        """
+        Patch the graph to match TaskNodeManager instead of rebuilding it.
+
+        Graph nodes are matched to task nodes by id first, then by name, so
+        nodes keep their positions. Only added, removed or changed nodes and
+        pipes touch the scene.
+        """
+        if not self.task_nodes:
+            self.refresh_graph()
+            return
+
+        old_nodes = self.task_nodes
+        unmatched = {graph_node.NODE_NAME: graph_node for graph_node in old_nodes.values()}
+        new_nodes = {}
+        created = []
+        with self._auto_connect_suspended():
+            for task_node in self.node_manager.get_all_nodes():
+                graph_node = old_nodes.get(task_node.id)
+                if graph_node is None or unmatched.get(graph_node.NODE_NAME) is not graph_node:
+                    graph_node = unmatched.get(task_node.NODE_NAME)
+                if graph_node is not None:
+                    del unmatched[graph_node.NODE_NAME]
+                    self._patch_graph_node(graph_node, task_node)
+                else:
+                    graph_node = self._new_graph_node(task_node)
+                    created.append(graph_node)
+                new_nodes[task_node.id] = graph_node
+
+            removed = list(unmatched.values())
+            if removed:
+                self.node_graph.delete_nodes(removed, push_undo=False)
+            self.task_nodes = new_nodes
+            self._sync_connections()
+
+        self._place_new_nodes(created)
+        self._shown_file_path = self.node_manager.get_current_file_path()
+
+    def reload_changed_files(self, file_paths):
+        """Reload the shown file if it was changed outside the editor."""
+        current = self.node_manager.get_current_file_path()
+        if current is None:
+            return
+        if Path(current).resolve() not in {Path(p).resolve() for p in file_paths}:
+            return
+        if self.node_manager.has_unsaved_changes():
+            print(f"{current} changed on disk, keeping unsaved edits")
+            return
+        self.load_from_file(str(current))
+
+    def on_config_changed(self, config: Config):
+        """Reload all previews when the resource path changed."""
+        if config.maa_resource_path == self._resource_path:
+            return
+        self._resource_path = config.maa_resource_path
+        for graph_node in self.task_nodes.values():
+            graph_node.update_preview()
+
+    def refresh_previews(self, image_paths):
+        """Reload the preview of nodes whose template image changed."""
+        changed = {Path(p).resolve() for p in image_paths}
+        for graph_node in self.task_nodes.values():
+            if graph_node.image_path and Path(graph_node.image_path).resolve() in changed:
+                graph_node.update_preview()
+
+    def _new_graph_node(self, task_node: TaskNode) -> MyNode:
+        """Create a graph node for a TaskNode without wiring its connections."""
+        graph_node = self.node_graph.create_node(
+            'io.github.jchanvfx.MyNode',
+            name=task_node.NODE_NAME,
+            selected=False,
+            push_undo=False
+        )
+        graph_node.node_id = task_node.id
+        graph_node.note_data = task_node.as_dict_view()
+        graph_node.update_preview()
+        return graph_node
+
+    def _patch_graph_node(self, graph_node: MyNode, task_node: TaskNode):
+        """Update an existing graph node in place from a TaskNode."""
+        graph_node.node_id = task_node.id
+        if graph_node.NODE_NAME != task_node.NODE_NAME:
+            graph_node.set_property('name', task_node.NODE_NAME, push_undo=False)
+        note_data = task_node.as_dict_view()
+        if note_data is not graph_node.note_data:
+            changed = note_data != graph_node.note_data
+            graph_node.note_data = note_data
+            if changed:
+                graph_node.update_preview()
+
+    def _wanted_connections(self):
+        """
+        Compute the pipes described by next/interrupt/on_error.
+
+        Returns:
+            list[tuple]: unique (src_graph_node, field, dst_graph_node) in
+            node table order.
+        """
+        by_name = {}
+        task_nodes = []
+        for task_id, graph_node in self.task_nodes.items():
+            task_node = self.node_manager.get_node_by_id(task_id)
+            task_nodes.append((task_node, graph_node))
+            by_name.setdefault(task_node.NODE_NAME, graph_node)
+
+        wanted = {}
+        for task_node, graph_node in task_nodes:
+            for field in TaskNodeIndex.REFERENCE_FIELDS:
+                for target in TaskNodeIndex.normalize_refs(getattr(task_node, field)):
+                    target_node = by_name.get(target)
+                    if target_node is not None:
+                        wanted[(graph_node, field, target_node)] = None
+        return list(wanted)
+
+    def _build_connections(self):
+        """
+        Create every pipe of freshly created graph nodes in one pass.
+
+        Pipes are added with PortConnectedCmd.redo() directly: no undo
+        entries, no port validation, no port_connected signals and no
+        on_input_connected() callbacks per pipe.
+        """
+        in_ports = {}
+        for src_node, field, dst_node in self._wanted_connections():
+            in_port = in_ports.get(dst_node.id)
+            if in_port is None:
+                in_port = in_ports[dst_node.id] = dst_node.get_input('in')
+            PortConnectedCmd(src_node.get_output(field), in_port, False).redo()
+
+    def _sync_connections(self):
+        """Connect and disconnect pipes so they match next/interrupt/on_error."""
+        wanted = {(src_node.id, field, dst_node.id)
+                  for src_node, field, dst_node in self._wanted_connections()}
+
+        existing = set()
+        for graph_node in self.task_nodes.values():
+            for field in TaskNodeIndex.REFERENCE_FIELDS:
+                for port in graph_node.get_output(field).connected_ports():
+                    existing.add((graph_node.id, field, port.node().id))
+
+        for src_id, field, dst_id in existing - wanted:
+            out_port = self.node_graph.get_node_by_id(src_id).get_output(field)
+            in_port = self.node_graph.get_node_by_id(dst_id).get_input('in')
+            out_port.disconnect_from(in_port, push_undo=False)
+        for src_id, field, dst_id in wanted - existing:
+            out_port = self.node_graph.get_node_by_id(src_id).get_output(field)
+            in_port = self.node_graph.get_node_by_id(dst_id).get_input('in')
+            out_port.connect_to(in_port, push_undo=False)
+
+    def _place_new_nodes(self, nodes):
+        """Place newly added nodes to the right of a connected existing node."""
+        new_ids = {node.id for node in nodes}
+        offsets = {}
+        for node in nodes:
+            anchor = None
+            for port_nodes in node.connected_input_nodes().values():
+                anchor = next((n for n in port_nodes if n.id not in new_ids), None)
+                if anchor:
+                    break
+            if anchor is None:
+                continue
+            count = offsets.get(anchor.id, 0)
+            offsets[anchor.id] = count + 1
+            node.set_pos(anchor.x_pos() + anchor.view.width + 150,
+                         anchor.y_pos() + count * (node.view.height + 20))
+
     def update_node(self, task_node: TaskNode):
         """Update or create a node in the graph based on a TaskNode"""
         if task_node.id in self.task_nodes:
             # Update existing node
             graph_node = self.task_nodes[task_node.id]
             graph_node.NODE_NAME = task_node.NODE_NAME
-            graph_node.note_data = task_node.to_dict()
+            graph_node.note_data = task_node.as_dict_view()
         else:
             # Create new node
             self.create_graph_node(task_node)
-        # Save changes
-        self.save_to_file()
+        # Save changes (debounced, written in the background)
+        self.node_manager.schedule_save()
 
     def save_to_file(self, file_path: str = None):
         return self.node_manager.save_to_file(file_path)
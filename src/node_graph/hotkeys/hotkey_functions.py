@@ -1,4 +1,5 @@
 #!/usr/bin/python
+from NodeGraphQt.constants import LayoutModeEnum
 from src.utils.task_node import TaskNode, TaskNodeManager
 
 
@@ -12,85 +13,20 @@ def add_base_node(graph):
     task_node=TaskNode()
     node=graph.create_node('io.github.jchanvfx.MyNode')
     node.node_id=task_node.id
-    node.note_data=task_node.to_dict()
+    node.note_data=task_node.as_dict_view()
     TaskNodeManager().add_node(task_node)
     # graph.add_node('BaseNode')
 
 
 def reset_pos(graph):
     """
-    Reset node graph position using NetworkX's neato layout with proper spacing.
+    Reset node graph positions with the built-in force directed layout,
+    computed in the background and animated into place.
 
     Args:
         graph: The graph object containing nodes and their connections
-
-    Note:
-        Requires networkx and pygraphviz to be installed:
-        pip install networkx pygraphviz
-    """
-    import networkx as nx
-
-    # 创建 NetworkX 有向图
-    nx_graph = nx.DiGraph()
-
-    # 获取所有节点
-    nodes = graph.all_nodes()
-
-    # 添加边到 NetworkX 图中
-    for node in nodes:
-        # 获取输入和输出连接
-        input_nodes = node.connected_input_nodes()
-        output_nodes = node.connected_output_nodes()
-
-        # 添加输入边
-        for input_node in input_nodes:
-            nx_graph.add_edge(input_node.name, node.name)
-
-        # 添加输出边
-        for output_node in output_nodes:
-            nx_graph.add_edge(node.name, output_node.name)
-
-    try:
-        # 使用 neato 布局算法
-        pos = nx.nx_agraph.graphviz_layout(nx_graph, prog="neato")
-
-        # 缩放位置以确保适当的间距
-        # 使用 10 作为缩放因子,可以根据需要调整
-        scaled_pos = {
-            node_name: (x * 10, -y * 10)  # 反转 y 轴以获得更好的可视化效果
-            for node_name, (x, y) in pos.items()
-        }
-
-        # 将计算出的位置应用到图中的节点
-        for node in nodes:
-            if node.name in scaled_pos:
-                x, y = scaled_pos[node.name]
-                success = node.set_pos(x, y)
-                if success:
-                    print(f"Node {node.name} position set to ({x}, {y})")
-                else:
-                    print(f"Failed to set position for node {node.name}")
-
-    except Exception as e:
-        print(f"Error during layout calculation: {str(e)}")
-        # 如果 graphviz 布局失败,回退到简单的圆形布局
-        try:
-            pos = nx.circular_layout(nx_graph)
-            scaled_pos = {
-                node_name: (x * 5, y * 5)  # 使用更大的缩放因子确保节点间距
-                for node_name, (x, y) in pos.items()
-            }
-
-            for node in nodes:
-                if node.name in scaled_pos:
-                    x, y = scaled_pos[node.name]
-                    node.set_pos(x, y)
-                    print(f"Node {node.name} position set to ({x}, {y}) using fallback layout")
-
-        except Exception as e:
-            print(f"Fallback layout also failed: {str(e)}")
-            return False
-
+    """
+    graph.auto_layout_nodes_async(mode=LayoutModeEnum.FORCE_DIRECTED.value, warm_start=False)
     return True
 
 
@@ -362,7 +298,7 @@ def layout_graph_down(graph):
     Auto layout the nodes down stream.
     """
     nodes = graph.selected_nodes() or graph.all_nodes()
-    graph.auto_layout_nodes(nodes=nodes, down_stream=True)
+    graph.auto_layout_nodes_async(nodes=nodes, down_stream=True)
 
 
 def layout_graph_up(graph):
@@ -370,7 +306,7 @@ def layout_graph_up(graph):
     Auto layout the nodes up stream.
     """
     nodes = graph.selected_nodes() or graph.all_nodes()
-    graph.auto_layout_nodes(nodes=nodes, down_stream=False)
+    graph.auto_layout_nodes_async(nodes=nodes, down_stream=False)
 
 
 def toggle_node_search(graph):
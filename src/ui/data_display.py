@@ -10,7 +10,7 @@ from PySide2.QtWidgets import (
 )
 from PySide2.QtWidgets import QWidget, QVBoxLayout, QLabel, QMenu, QPushButton
 
-from src.utils.app_config import Config
+from src.utils.app_config import ConfigService
 from src.utils.maa_controller import MaaController
 
 
@@ -188,10 +188,7 @@ class CoordinateLabel(QLabel):
 
         # Save with timestamp
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        current_dir = os.getcwd()
-        config_path = os.path.join(current_dir, "config", "app_config.json")
-        app_config = Config.from_file(config_path)
-        resource_path = app_config.maa_resource_path
+        resource_path = ConfigService().get().maa_resource_path
         image_path=os.path.join(f'template\screenshot_{timestamp}.png')
         save_path = os.path.join(resource_path, "image",image_path)
         os.makedirs(os.path.dirname(save_path), exist_ok=True)  # 确保目录存在
@@ -12,6 +12,7 @@ from src.ui.note_setting_widget import NoteSettingWidget
 from src.ui.setting_widget import SettingWidget
 from src.utils.app_config import AdbConfig
 from src.utils.maa_controller import MaaController
+from src.utils.task_node import TaskNodeManager
 
 
 class MainWindow(QMainWindow):
@@ -40,6 +41,7 @@ class MainWindow(QMainWindow):
         left_layout = QVBoxLayout(left_widget)
         left_layout.setContentsMargins(5, 5, 5, 5)
         setting_widget = SettingWidget()
+        self.setting_widget = setting_widget
         left_layout.addWidget(setting_widget)
 
         # 中间节点面板
@@ -80,6 +82,8 @@ class MainWindow(QMainWindow):
         setting_widget.connect_adb_signal.connect(self.initialize_controller)
         setting_widget.connect_resource_signal.connect(self.initialize_resource)
         setting_widget.open_pipeline_in_node_graph_signal.connect(node_graph.load_from_file)
+        setting_widget.pipeline_files_changed_signal.connect(node_graph.reload_changed_files)
+        setting_widget.image_files_changed_signal.connect(node_graph.refresh_previews)
         node_graph.node_select.connect(note_widget.load_settings_from_node)
         data_display.screen_label.update_screenshot_path.connect(note_widget.update_template_path)
         note_widget.save_settings_signal.connect(node_graph.add_node)
@@ -162,6 +166,12 @@ class MainWindow(QMainWindow):
         """
         splitter.setStyleSheet(stylesheet)
 
+    def closeEvent(self, event):
+        # 写出延迟保存中尚未写入的修改
+        TaskNodeManager().flush_pending_save()
+        self.setting_widget.stop_resource_watcher()
+        super().closeEvent(event)
+
     def click_display(self,point:QPoint):
         asyncio.create_task(self.async_clicked_display(point))
         self.data_display.refresh_screen()
@@ -26,7 +26,7 @@ class NoteSettingWidget(QWidget):
         self.setup_bindings()
         self.update_ui_from_settings(self.settings)
         self.maa_controller = MaaController()
-        self.settings.signals.property_changed.connect(self.update_settings_when_property_changed)
+        self.settings.signals.fields_changed.connect(self.update_settings_when_fields_changed)
 
     def init_ui(self):
         # 创建主布局
@@ -72,7 +72,7 @@ class NoteSettingWidget(QWidget):
 
         self.main_layout=setting_layout
 
-    def update_settings_when_property_changed(self, field: str, value: object):
+    def update_settings_when_fields_changed(self, fields: list):
         self.update_ui_from_settings(self.settings)
 
     def save_node(self):
@@ -386,7 +386,7 @@ class NoteSettingWidget(QWidget):
 
             # 使用copy_from方法复制属性
             self.settings.copy_from(self.node)
-            self.settings.signals.property_changed.connect(self.update_settings_when_property_changed)
+            self.settings.signals.fields_changed.connect(self.update_settings_when_fields_changed)
 
             # 更新UI
             self.update_ui_from_settings(self.settings)
@@ -598,13 +598,4 @@ class NoteSettingWidget(QWidget):
         """
         # 提取文件名并去掉 .json 后缀
         base_name = Path(self.node_file_name).stem
-
-        step = 1
-        while True:
-            new_node_name = f"{base_name}_step_{step}"
-
-            # 假设 get_node_by_name 是方法，检查节点名称是否已存在
-            if self.task_node_manager.get_node_by_name(new_node_name) is None:
-                return new_node_name
-
-            step += 1
+        return self.task_node_manager.generate_unique_name(base_name)
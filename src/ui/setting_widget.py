@@ -4,7 +4,12 @@ from functools import partial
 from PySide2.QtCore import Signal
 from PySide2.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel, QLineEdit, QHBoxLayout, QScrollArea
 
-from src.utils.app_config import AdbConfig, Config
+from src.utils.app_config import AdbConfig, ConfigService
+from src.utils.pipeline_cache import PipelineCache
+from src.utils.pipeline_loader import PipelineLoader
+from src.utils.pipeline_saver import is_own_write
+from src.utils.resource_watcher import ResourceWatcher, ResourceChanges
+from src.utils.task_node import TaskNodeManager
 
 
 class SettingWidget(QWidget):
@@ -12,13 +17,20 @@ class SettingWidget(QWidget):
     connect_adb_signal = Signal(AdbConfig, str)
     connect_resource_signal = Signal(str)
     open_pipeline_in_node_graph_signal = Signal(str)
+    pipeline_files_changed_signal = Signal(list)
+    image_files_changed_signal = Signal(list)
+    # 由监视线程发出, 排队到界面线程处理
+    resource_changes_detected = Signal(object)
 
     def __init__(self):
         super().__init__()
         layout = QVBoxLayout(self)
-        current_dir = os.getcwd()
-        self.config_path = os.path.join(current_dir, "config", "app_config.json")
-        self.app_config = Config.from_file(self.config_path)
+        self.config_service = ConfigService()
+        self.config_path = self.config_service.config_path
+        self.app_config = self.config_service.get()
+        self.loader = None
+        self.resource_watcher = None
+        self.resource_changes_detected.connect(self.on_resource_changes)
 
         # ADB 设置组
         adb_group_layout = QVBoxLayout()
@@ -29,7 +41,7 @@ class SettingWidget(QWidget):
         host_layout = QHBoxLayout()
         host_label = QLabel("主机地址:")
         self.host_input = QLineEdit(self.app_config.adb_config.adb_path)
-        self.host_input.textChanged.connect(self.update_adb_config)  # 添加信号槽
+        self.host_input.editingFinished.connect(self.update_adb_config)  # 编辑完成后再保存
         host_layout.addWidget(host_label)
         host_layout.addWidget(self.host_input)
         adb_group_layout.addLayout(host_layout)
@@ -38,7 +50,7 @@ class SettingWidget(QWidget):
         port_layout = QHBoxLayout()
         port_label = QLabel("端口:")
         self.port_input = QLineEdit(self.app_config.adb_config.adb_address)
-        self.port_input.textChanged.connect(self.update_adb_config)  # 添加信号槽
+        self.port_input.editingFinished.connect(self.update_adb_config)  # 编辑完成后再保存
         port_layout.addWidget(port_label)
         port_layout.addWidget(self.port_input)
         adb_group_layout.addLayout(port_layout)
@@ -60,7 +72,7 @@ class SettingWidget(QWidget):
         resource_layout = QHBoxLayout()
         resource_label = QLabel("资源路径:")
         self.resource_input = QLineEdit(self.app_config.maa_resource_path)
-        self.resource_input.textChanged.connect(self.update_resource_path)  # 添加信号槽
+        self.resource_input.editingFinished.connect(self.update_resource_path)  # 编辑完成后再保存
         resource_layout.addWidget(resource_label)
         resource_layout.addWidget(self.resource_input)
         resource_group_layout.addLayout(resource_layout)
@@ -87,15 +99,23 @@ class SettingWidget(QWidget):
         layout.addStretch(1)  # <--- Add this line
 
     def update_adb_config(self):
-        """更新 ADB 设置并保存到配置文件"""
+        """更新 ADB 设置并保存到配置文件, 未改变时不保存"""
+        self.app_config = self.config_service.get()
+        adb_config = self.app_config.adb_config
+        if (adb_config.adb_path == self.host_input.text()
+                and adb_config.adb_address == self.port_input.text()):
+            return
         self.app_config.adb_config.adb_path = self.host_input.text()
         self.app_config.adb_config.adb_address = self.port_input.text()
-        self.app_config.to_file(self.config_path)
+        self.config_service.save(self.app_config)
 
     def update_resource_path(self):
-        """更新资源路径并保存到配置文件"""
+        """更新资源路径并保存到配置文件, 未改变时不保存"""
+        self.app_config = self.config_service.get()
+        if self.app_config.maa_resource_path == self.resource_input.text():
+            return
         self.app_config.maa_resource_path = self.resource_input.text()
-        self.app_config.to_file(self.config_path)
+        self.config_service.save(self.app_config)
 
     def connect_adb(self):
         host = self.host_input.text()
@@ -111,14 +131,49 @@ class SettingWidget(QWidget):
         self.connect_adb_signal.emit(adb_config, user_path)
 
     def connect_resource(self):
+        self.update_resource_path()
         resource_path = self.resource_input.text()
         self.connect_resource_signal.emit(resource_path)
         pipeline_dir = os.path.join(resource_path, "pipeline")
         if os.path.exists(pipeline_dir) and os.path.isdir(pipeline_dir):
-            self.display_json_files(pipeline_dir)
-
-    def display_json_files(self, pipeline_dir):
-        """显示 pipeline 文件夹下的所有 JSON 文件"""
+            loader = PipelineLoader(resource_path, cache=PipelineCache.for_resource(resource_path)).load()
+            print(loader.format_report())
+            TaskNodeManager().set_resource(loader)
+            self.loader = loader
+            self.display_json_files(loader)
+            self.start_resource_watcher(resource_path)
+
+    def start_resource_watcher(self, resource_path: str):
+        """监视资源目录, 文件变化时增量更新"""
+        self.stop_resource_watcher()
+        self.resource_watcher = ResourceWatcher(resource_path, self.resource_changes_detected.emit).start()
+
+    def stop_resource_watcher(self):
+        if self.resource_watcher is not None:
+            self.resource_watcher.stop()
+            self.resource_watcher = None
+
+    def on_resource_changes(self, changes: ResourceChanges):
+        """只重新加载变化的 pipeline 文件, 并通知节点图"""
+        loader = self.loader
+        if loader is None:
+            return
+        # 本程序自己保存的文件已经同步到加载器中
+        changed = [p for p in changes.pipeline_changed() if not is_own_write(p)]
+        for file_path in changes.pipeline_removed:
+            loader.remove_file(file_path)
+        if changed:
+            loader.load_files(changed)
+        if changes.pipeline_added or changes.pipeline_removed or changed:
+            self.display_json_files(loader)
+        if changed:
+            self.pipeline_files_changed_signal.emit([str(p) for p in changed])
+        images = changes.images_changed()
+        if images:
+            self.image_files_changed_signal.emit([str(p) for p in images])
+
+    def display_json_files(self, loader: PipelineLoader):
+        """显示 pipeline 文件夹下的所有 JSON 文件及其节点数"""
         # 清空布局
         for i in reversed(range(self.json_files_layout.count())):
             item = self.json_files_layout.itemAt(i)
@@ -127,13 +182,16 @@ class SettingWidget(QWidget):
                 widget.deleteLater()
 
         # 添加 JSON 文件
-        json_files = [f for f in os.listdir(pipeline_dir) if f.endswith(".json")]
-        for file_name in json_files:
+        for pipeline_path in loader.list_pipeline_files():
+            nodes = loader.get_file_nodes(pipeline_path)
+            file_name = loader.relative_name(pipeline_path)
+            if nodes is None:
+                file_label = QLabel(f"{file_name} (加载失败)")
+            else:
+                file_label = QLabel(f"{file_name} ({len(nodes)})")
             file_layout = QHBoxLayout()
-            file_label = QLabel(file_name)
             open_button = QPushButton("打开")
-            pipeline_path = os.path.join(pipeline_dir, file_name)
-            open_button.clicked.connect(partial(self.open_in_node_graph, pipeline_path))
+            open_button.clicked.connect(partial(self.open_in_node_graph, str(pipeline_path)))
             file_layout.addWidget(file_label)
             file_layout.addStretch()
             file_layout.addWidget(open_button)
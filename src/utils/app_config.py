@@ -1,5 +1,9 @@
 import json
+import os
+import threading
+import time
 from dataclasses import dataclass, asdict
+from typing import Callable, List, Optional, Tuple
 
 @dataclass
 class AdbConfig:
@@ -31,4 +35,105 @@ class Config:
 
     def to_file(self, file_path):
         data = {'adb_config': asdict(self.adb_config), 'log_level': self.log_level, 'maa_user_path': self.maa_user_path, 'maa_resource_path': self.maa_resource_path}
-        json.dump(data, open(file_path, 'w'), indent=4)
\ No newline at end of file
+        with open(file_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=4)
+
+
+class ConfigService:
+    """
+    进程内共享的 app_config.json 缓存单例.
+
+    get() 返回内存中的 Config, 最多每 check_interval 秒检查一次文件 mtime,
+    文件被外部修改时才重新解析. save() 写穿到文件并更新缓存.
+    配置变化时通知通过 subscribe() 注册的回调.
+    """
+    _instance: Optional['ConfigService'] = None  # 类变量，存储单例实例
+
+    def __new__(cls, *args, **kwargs):
+        """实现单例模式."""
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, config_path: Optional[str] = None, check_interval: float = 1.0) -> None:
+        """初始化配置服务.
+
+        Args:
+            config_path (str): 配置文件路径, 默认为 ./config/app_config.json.
+            check_interval (float): 两次检查文件 mtime 之间的最短间隔 (秒).
+        """
+        if not hasattr(self, "_initialized"):  # 避免重复初始化
+            self.config_path = config_path or os.path.join(os.getcwd(), "config", "app_config.json")
+            self.check_interval = check_interval
+            self._lock = threading.RLock()
+            self._config: Optional[Config] = None
+            self._file_state: Optional[Tuple[int, int]] = None
+            self._checked_at = 0.0
+            self._subscribers: List[Callable[[Config], None]] = []
+            self._initialized = True  # 标记已初始化
+
+    def get(self) -> Config:
+        """获取当前配置, 只有文件改变后才会重新读取."""
+        with self._lock:
+            now = time.monotonic()
+            if self._config is not None and now - self._checked_at < self.check_interval:
+                return self._config
+            self._checked_at = now
+            state = self._stat()
+            if self._config is not None and state == self._file_state:
+                return self._config
+            reloaded = self._config is not None
+            self._config = Config.from_file(self.config_path)
+            self._file_state = state
+            config = self._config
+        if reloaded:
+            self._notify(config)
+        return config
+
+    def save(self, config: Optional[Config] = None) -> None:
+        """写入配置文件并更新缓存.
+
+        Args:
+            config (Config): 新配置, 默认写入当前缓存的 (可能已被原地修改的) 配置.
+        """
+        with self._lock:
+            config = config or self.get()
+            config.to_file(self.config_path)
+            self._config = config
+            self._file_state = self._stat()
+            self._checked_at = time.monotonic()
+        self._notify(config)
+
+    def reload(self) -> Config:
+        """忽略检查间隔, 立即检查文件是否改变."""
+        with self._lock:
+            self._checked_at = 0.0
+        return self.get()
+
+    def subscribe(self, callback: Callable[[Config], None]) -> None:
+        """注册配置变化回调, 回调参数为新的 Config."""
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[Config], None]) -> None:
+        """取消注册配置变化回调."""
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.config_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _notify(self, config: Config) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(config)
+            except Exception as e:
+                print(f"Error notifying config subscriber: {e}")
\ No newline at end of file
@@ -0,0 +1,121 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple, Iterable, Union
+
+from src.utils.task_node import TaskNode
+
+# {node_name: {field: value}}, 只包含 TaskNode 已知字段
+NodeTable = Dict[str, Dict[str, Any]]
+
+
+class PipelineCache:
+    """
+    已解析 pipeline 的磁盘缓存.
+
+    每个文件以 路径 + mtime + 大小 + 内容哈希 作为键, 保存过滤后的节点表
+    (pickle 后的二进制). mtime 和大小未变时直接命中; 变化时再比较内容哈希,
+    内容相同 (例如 git checkout 只改了 mtime) 仍然命中, 只有真正修改过的文件需要重新解析.
+    """
+    CACHE_VERSION = 1
+
+    def __init__(self, cache_file: Union[str, Path]) -> None:
+        """初始化缓存并读取已有的缓存文件.
+
+        Args:
+            cache_file (Union[str, Path]): 缓存文件路径.
+        """
+        self.cache_file = Path(cache_file)
+        # path -> (mtime_ns, size, digest, pickled NodeTable)
+        self._entries: Dict[str, Tuple[int, int, bytes, bytes]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.load()
+
+    @classmethod
+    def for_resource(cls, resource_path: Union[str, Path], cache_dir: Union[str, Path] = "cache") -> 'PipelineCache':
+        """获取某个资源目录对应的缓存, 缓存文件位于当前工作目录下的 cache_dir 中."""
+        resource_path = Path(resource_path).resolve()
+        key = hashlib.sha1(os.fsencode(resource_path)).hexdigest()[:16]
+        return cls(Path(os.getcwd(), cache_dir, f"pipeline_{key}.cache"))
+
+    @staticmethod
+    def content_hash(content: bytes) -> bytes:
+        """计算文件内容的哈希."""
+        return hashlib.blake2b(content, digest_size=16).digest()
+
+    def _header(self) -> Tuple[int, Tuple[str, ...]]:
+        # TaskNode 字段变化时旧缓存自动失效
+        return self.CACHE_VERSION, TaskNode.FIELDS
+
+    def load(self) -> None:
+        """从磁盘读取缓存, 文件不存在或版本不符时使用空缓存."""
+        self._entries = {}
+        try:
+            with open(self.cache_file, 'rb') as f:
+                header, entries = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Ignoring pipeline cache {self.cache_file}: {e}")
+            return
+        if header == self._header() and isinstance(entries, dict):
+            self._entries = entries
+
+    def save(self) -> None:
+        """有修改时将缓存原子地写回磁盘."""
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = pickle.dumps((self._header(), self._entries), protocol=pickle.HIGHEST_PROTOCOL)
+            self._dirty = False
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_file.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            print(f"Error saving pipeline cache: {e}")
+
+    def lookup(self, file_path: Path, stat: os.stat_result) -> Optional[NodeTable]:
+        """按 mtime 和大小查找, 不读取文件内容."""
+        entry = self._entries.get(os.fspath(file_path))
+        if entry is None or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+            return None
+        return pickle.loads(entry[3])
+
+    def lookup_content(self, file_path: Path, stat: os.stat_result, digest: bytes) -> Optional[NodeTable]:
+        """按内容哈希查找; 命中时更新记录的 mtime 和大小."""
+        key = os.fspath(file_path)
+        entry = self._entries.get(key)
+        if entry is None or entry[2] != digest:
+            return None
+        with self._lock:
+            self._entries[key] = (stat.st_mtime_ns, stat.st_size, digest, entry[3])
+            self._dirty = True
+        return pickle.loads(entry[3])
+
+    def store(self, file_path: Path, stat: os.stat_result, digest: bytes, table: NodeTable) -> None:
+        """保存一个文件的节点表."""
+        blob = pickle.dumps(table, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._entries[os.fspath(file_path)] = (stat.st_mtime_ns, stat.st_size, digest, blob)
+            self._dirty = True
+
+    def prune(self, file_paths: Iterable[Path]) -> None:
+        """移除不在 file_paths 中的文件 (已删除的文件) 的缓存."""
+        keep = {os.fspath(p) for p in file_paths}
+        with self._lock:
+            stale = [key for key in self._entries if key not in keep]
+            for key in stale:
+                del self._entries[key]
+            if stale:
+                self._dirty = True
@@ -0,0 +1,257 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, List, Dict, Tuple, Iterable, Union, Set
+
+from src.utils.pipeline_cache import PipelineCache, NodeTable
+from src.utils.task_node import TaskNode, TaskNodeIndex
+
+
+class PipelineLoader:
+    """
+    整个资源目录的 pipeline 加载器.
+
+    在线程池中并行读取 ``{resource}/pipeline`` 下的全部 JSON 文件,
+    合并为一个跨文件的节点命名空间, 检测重名节点并解析跨文件的
+    next/interrupt/on_error 引用, 同时记录每个文件的解析耗时.
+    提供 PipelineCache 时, 未修改的文件直接从缓存加载.
+    """
+
+    def __init__(self, resource_path: Union[str, Path], max_workers: Optional[int] = None,
+                 cache: Optional[PipelineCache] = None) -> None:
+        """初始化加载器.
+
+        Args:
+            resource_path (Union[str, Path]): 资源目录, 即包含 pipeline 文件夹的目录.
+            max_workers (int, optional): 线程池大小, 默认由 ThreadPoolExecutor 决定.
+            cache (PipelineCache, optional): 已解析 pipeline 的磁盘缓存.
+        """
+        self.resource_path: Path = Path(resource_path).resolve()
+        self.pipeline_dir: Path = self.resource_path / "pipeline"
+        self.max_workers = max_workers
+        self.cache = cache
+        self.cached_files: Set[Path] = set()  # 最近一次加载中命中缓存的文件
+        self._files: Dict[Path, Dict[str, TaskNode]] = {}  # file -> {name: node}
+        self._namespace: Dict[str, List[Path]] = {}  # name -> 定义该名称的文件
+        self.parse_times: Dict[Path, float] = {}
+        self.errors: Dict[Path, str] = {}
+        self.load_time: float = 0.0
+
+    @staticmethod
+    def normalize_path(file_path: Union[str, Path]) -> Path:
+        """统一文件路径的形式, 作为内部字典的键."""
+        return Path(file_path).resolve()
+
+    def list_pipeline_files(self) -> List[Path]:
+        """列出 pipeline 目录 (含子目录) 下的全部 JSON 文件."""
+        if not self.pipeline_dir.is_dir():
+            return []
+        return sorted(p.resolve() for p in self.pipeline_dir.rglob("*.json") if p.is_file())
+
+    def contains(self, file_path: Union[str, Path]) -> bool:
+        """检查文件是否位于本资源的 pipeline 目录下."""
+        try:
+            self.normalize_path(file_path).relative_to(self.pipeline_dir)
+        except ValueError:
+            return False
+        return True
+
+    def load(self) -> 'PipelineLoader':
+        """并行加载全部 pipeline 文件, 替换已加载的内容."""
+        self._files.clear()
+        self._namespace.clear()
+        self.parse_times.clear()
+        self.errors.clear()
+        file_paths = self.list_pipeline_files()
+        if self.cache is not None:
+            # 先移除已删除文件的缓存, 由 load_files 一并写回磁盘.
+            self.cache.prune(file_paths)
+        self.load_files(file_paths)
+        return self
+
+    def load_files(self, file_paths: Iterable[Union[str, Path]]) -> Dict[Path, Dict[str, TaskNode]]:
+        """并行 (重新) 加载指定文件并合并进命名空间.
+
+        Returns:
+            Dict[Path, Dict[str, TaskNode]]: 成功加载的文件及其节点.
+        """
+        file_paths = [self.normalize_path(p) for p in file_paths]
+        start = time.perf_counter()
+        loaded = {}
+        self.cached_files = set()
+        if file_paths:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(self._parse_file, file_paths))
+            for file_path, nodes, elapsed, error, from_cache in results:
+                self.parse_times[file_path] = elapsed
+                if from_cache:
+                    self.cached_files.add(file_path)
+                if error is not None:
+                    self.errors[file_path] = error
+                    self.remove_file(file_path)
+                    continue
+                self.errors.pop(file_path, None)
+                self._set_file_nodes(file_path, nodes)
+                loaded[file_path] = nodes
+        if self.cache is not None:
+            self.cache.save()
+        self.load_time = time.perf_counter() - start
+        return loaded
+
+    def _parse_file(self, file_path: Path) -> Tuple[Path, Dict[str, TaskNode], float, Optional[str], bool]:
+        """在工作线程中解析单个文件, 优先使用缓存."""
+        start = time.perf_counter()
+        from_cache = False
+        try:
+            stat = file_path.stat()
+            table = self.cache.lookup(file_path, stat) if self.cache is not None else None
+            if table is None:
+                content = file_path.read_bytes()
+                digest = PipelineCache.content_hash(content)
+                if self.cache is not None:
+                    table = self.cache.lookup_content(file_path, stat, digest)
+                if table is None:
+                    table = self._parse_table(content)
+                    if self.cache is not None:
+                        self.cache.store(file_path, stat, digest, table)
+                else:
+                    from_cache = True
+            else:
+                from_cache = True
+            nodes = {name: TaskNode.from_dict(name, fields) for name, fields in table.items()}
+        except (OSError, ValueError) as e:
+            return file_path, {}, time.perf_counter() - start, str(e), False
+        return file_path, nodes, time.perf_counter() - start, None, from_cache
+
+    @staticmethod
+    def _parse_table(content: bytes) -> NodeTable:
+        """解析 JSON 内容并只保留 TaskNode 已知的字段."""
+        data = json.loads(content.decode('utf-8'))
+        if not isinstance(data, dict):
+            raise ValueError("Invalid file format: expected dictionary")
+        table = {}
+        for node_name, node_data in data.items():
+            if not isinstance(node_data, dict):
+                print(f"Error loading node {node_name}: expected dictionary")
+                continue
+            table[node_name] = {k: v for k, v in node_data.items() if k in TaskNode.FIELDS}
+        return table
+
+    def set_file_nodes(self, file_path: Union[str, Path], nodes: Iterable[TaskNode]) -> None:
+        """用内存中的节点替换某个文件的内容 (例如保存之后), 无需重新解析."""
+        file_path = self.normalize_path(file_path)
+        self._set_file_nodes(file_path, {node.NODE_NAME: node for node in nodes if node.NODE_NAME})
+
+    def _set_file_nodes(self, file_path: Path, nodes: Dict[str, TaskNode]) -> None:
+        self._unregister_names(file_path)
+        self._files[file_path] = nodes
+        for name in nodes:
+            self._namespace.setdefault(name, []).append(file_path)
+
+    def remove_file(self, file_path: Union[str, Path]) -> None:
+        """从命名空间中移除一个文件的全部节点."""
+        file_path = self.normalize_path(file_path)
+        self._unregister_names(file_path)
+        self._files.pop(file_path, None)
+
+    def _unregister_names(self, file_path: Path) -> None:
+        for name in self._files.get(file_path, {}):
+            files = self._namespace.get(name)
+            if files is None:
+                continue
+            if file_path in files:
+                files.remove(file_path)
+            if not files:
+                del self._namespace[name]
+
+    def get_files(self) -> List[Path]:
+        """获取已加载的文件列表."""
+        return sorted(self._files)
+
+    def get_file_nodes(self, file_path: Union[str, Path]) -> Optional[Dict[str, TaskNode]]:
+        """获取某个文件中的节点 {name: node}, 未加载时返回 None."""
+        return self._files.get(self.normalize_path(file_path))
+
+    def has_name(self, node_name: str) -> bool:
+        """检查名称是否已在任意文件中定义."""
+        return node_name in self._namespace
+
+    def get_node(self, node_name: str) -> Optional[TaskNode]:
+        """在整个资源中按名称查找节点, 重名时返回最先加载的定义."""
+        files = self._namespace.get(node_name)
+        if not files:
+            return None
+        return self._files[files[0]][node_name]
+
+    def get_node_file(self, node_name: str) -> Optional[Path]:
+        """获取定义该节点的文件."""
+        files = self._namespace.get(node_name)
+        return files[0] if files else None
+
+    def get_node_count(self) -> int:
+        """获取全部文件中的节点总数."""
+        return sum(len(nodes) for nodes in self._files.values())
+
+    def find_duplicates(self) -> Dict[str, List[Path]]:
+        """获取在多个位置定义的节点名称 {name: [file, ...]}."""
+        return {name: list(files) for name, files in self._namespace.items() if len(files) > 1}
+
+    def find_unresolved_references(self) -> Dict[Tuple[Path, str], List[str]]:
+        """获取在整个资源中都找不到目标的引用 {(file, node_name): [target, ...]}."""
+        unresolved = {}
+        for file_path, nodes in self._files.items():
+            for name, node in nodes.items():
+                missing = [target
+                           for field in TaskNodeIndex.REFERENCE_FIELDS
+                           for target in TaskNodeIndex.normalize_refs(getattr(node, field))
+                           if target not in self._namespace]
+                if missing:
+                    unresolved[(file_path, name)] = missing
+        return unresolved
+
+    def find_cross_file_references(self) -> Dict[Tuple[Path, str], List[Tuple[str, Path]]]:
+        """获取跳转到其它文件中节点的引用 {(file, node_name): [(target, target_file), ...]}."""
+        cross = {}
+        for file_path, nodes in self._files.items():
+            for name, node in nodes.items():
+                targets = []
+                for field in TaskNodeIndex.REFERENCE_FIELDS:
+                    for target in TaskNodeIndex.normalize_refs(getattr(node, field)):
+                        if target in nodes:
+                            continue
+                        target_file = self.get_node_file(target)
+                        if target_file is not None:
+                            targets.append((target, target_file))
+                if targets:
+                    cross[(file_path, name)] = targets
+        return cross
+
+    def relative_name(self, file_path: Union[str, Path]) -> str:
+        """获取文件相对 pipeline 目录的显示名称."""
+        file_path = self.normalize_path(file_path)
+        try:
+            return file_path.relative_to(self.pipeline_dir).as_posix()
+        except ValueError:
+            return os.fspath(file_path)
+
+    def format_report(self, slowest: int = 5) -> str:
+        """生成加载报告: 总耗时, 最慢的文件, 错误, 重名与无法解析的引用."""
+        total_parse = sum(self.parse_times.values())
+        lines = [
+            f"Loaded {self.get_node_count()} nodes from {len(self._files)} files "
+            f"in {self.load_time * 1000:.1f} ms (parse total {total_parse * 1000:.1f} ms, "
+            f"{len(self.cached_files)} from cache)"
+        ]
+        for file_path, elapsed in sorted(self.parse_times.items(), key=lambda item: item[1],
+                                         reverse=True)[:slowest]:
+            lines.append(f"  {self.relative_name(file_path)}: {elapsed * 1000:.2f} ms")
+        for file_path, error in self.errors.items():
+            lines.append(f"  error in {self.relative_name(file_path)}: {error}")
+        for name, files in self.find_duplicates().items():
+            lines.append(f"  duplicate node '{name}' in: "
+                         f"{', '.join(self.relative_name(p) for p in files)}")
+        for (file_path, name), targets in self.find_unresolved_references().items():
+            lines.append(f"  unresolved in {self.relative_name(file_path)}/{name}: {', '.join(targets)}")
+        return "\n".join(lines)
@@ -0,0 +1,169 @@
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Any, Dict, Tuple, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.utils.task_node import TaskNodeManager
+
+# 本进程最近写入的文件 -> 写入后的 (mtime_ns, size), 用于区分外部修改
+_written_files: Dict[Path, Tuple[int, int]] = {}
+_written_lock = threading.Lock()
+
+
+def is_own_write(file_path: Union[str, Path]) -> bool:
+    """检查文件当前内容是否就是本进程最后一次通过 atomic_write_json 写入的内容."""
+    file_path = Path(file_path).resolve()
+    with _written_lock:
+        state = _written_files.get(file_path)
+    if state is None:
+        return False
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return False
+    return (stat.st_mtime_ns, stat.st_size) == state
+
+
+def atomic_write_json(file_path: Union[str, Path], data: Any) -> None:
+    """原子地写入 JSON 文件.
+
+    先写入同目录下的临时文件并 fsync, 再用 os.replace 替换目标文件,
+    崩溃时目标文件要么是旧内容, 要么是完整的新内容.
+    """
+    file_path = Path(file_path).resolve()
+    file_path.parent.mkdir(parents=True, exist_ok=True)  # 创建父目录
+    fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+        stat = file_path.stat()
+        with _written_lock:
+            _written_files[file_path] = (stat.st_mtime_ns, stat.st_size)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class PipelineSaver:
+    """
+    TaskNodeManager 的延迟 (write-behind) 保存器.
+
+    mark_dirty() 只记录脏状态并推迟截止时间, 一段时间内的连续编辑合并为一次写入.
+    序列化和写文件在后台线程中完成, 写入使用 atomic_write_json.
+    持续编辑时最多推迟 max_delay 秒; 进程退出时通过 atexit 自动 flush().
+    """
+
+    def __init__(self, manager: 'TaskNodeManager', delay: float = 0.5, max_delay: float = 5.0) -> None:
+        """初始化保存器.
+
+        Args:
+            manager (TaskNodeManager): 需要保存的管理器.
+            delay (float): 最后一次编辑后等待多少秒再写入.
+            max_delay (float): 从第一次未保存的编辑开始, 最多等待多少秒.
+        """
+        self._manager = manager
+        self.delay = delay
+        self.max_delay = max_delay
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()  # 保证同一时刻只有一个写入
+        self._dirty_path: Optional[Path] = None
+        self._first_dirty_time = 0.0
+        self._deadline = 0.0
+        self._worker: Optional[threading.Thread] = None
+        atexit.register(self.flush)
+
+    def is_dirty(self) -> bool:
+        """是否有尚未写入的修改."""
+        return self._dirty_path is not None
+
+    def get_dirty_path(self) -> Optional[Path]:
+        """获取等待写入的文件路径."""
+        return self._dirty_path
+
+    def mark_dirty(self, file_path: Union[str, Path]) -> None:
+        """标记文件需要保存, 并重新开始计时."""
+        with self._condition:
+            now = time.monotonic()
+            if self._dirty_path is None:
+                self._first_dirty_time = now
+            self._dirty_path = Path(file_path)
+            self._deadline = min(now + self.delay, self._first_dirty_time + self.max_delay)
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="PipelineSaver", daemon=True)
+                self._worker.start()
+            self._condition.notify()
+
+    def cancel(self) -> None:
+        """丢弃尚未写入的修改."""
+        with self._condition:
+            self._dirty_path = None
+            self._condition.notify()
+
+    def save_now(self, file_path: Union[str, Path]) -> None:
+        """丢弃尚未写入的修改, 在当前线程立即完整写入文件.
+
+        持有写入锁完成 取消 + 序列化 + 写入, 后台线程中正在进行的保存不会在之后用旧内容覆盖文件.
+
+        Args:
+            file_path (Union[str, Path]): 文件路径.
+
+        Raises:
+            Exception: 序列化或写入失败.
+        """
+        with self._write_lock:
+            self.cancel()
+            atomic_write_json(file_path, self._manager.serialize())
+
+    def flush(self) -> bool:
+        """立即在当前线程写入尚未保存的修改.
+
+        Returns:
+            bool: 没有待写入内容或写入成功返回 True, 失败返回 False.
+        """
+        return self._save_pending()
+
+    def _run(self) -> None:
+        """后台线程: 等待截止时间到达后写入."""
+        while True:
+            with self._condition:
+                while self._dirty_path is None:
+                    self._condition.wait()
+                while self._dirty_path is not None:
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+            self._save_pending()
+
+    def _save_pending(self) -> bool:
+        with self._write_lock:
+            with self._condition:
+                file_path = self._dirty_path
+                self._dirty_path = None
+            if file_path is None:
+                return True
+            try:
+                atomic_write_json(file_path, self._manager.serialize())
+                return True
+            except Exception as e:
+                print(f"Error saving nodes to file: {e}")
+                with self._condition:
+                    # 写入失败时保留脏状态, 稍后重试或由 flush() 再次尝试
+                    if self._dirty_path is None:
+                        now = time.monotonic()
+                        self._dirty_path = file_path
+                        self._first_dirty_time = now
+                        self._deadline = now + self.max_delay
+                return False
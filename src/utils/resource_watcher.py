@@ -0,0 +1,344 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, List, Dict, Tuple, Set, Callable, Union
+
+IMAGE_SUFFIXES = {'.png', '.jpg', '.jpeg', '.bmp'}
+
+
+@dataclass
+class ResourceChanges:
+    """一次 (防抖合并后的) 资源目录变更."""
+    pipeline_added: List[Path] = field(default_factory=list)
+    pipeline_removed: List[Path] = field(default_factory=list)
+    pipeline_modified: List[Path] = field(default_factory=list)
+    image_added: List[Path] = field(default_factory=list)
+    image_removed: List[Path] = field(default_factory=list)
+    image_modified: List[Path] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return any((self.pipeline_added, self.pipeline_removed, self.pipeline_modified,
+                    self.image_added, self.image_removed, self.image_modified))
+
+    def pipeline_changed(self) -> List[Path]:
+        """新增或修改过的 pipeline 文件."""
+        return self.pipeline_added + self.pipeline_modified
+
+    def images_changed(self) -> List[Path]:
+        """新增、删除或修改过的图片文件."""
+        return self.image_added + self.image_removed + self.image_modified
+
+
+class _InotifyBackend:
+    """基于 Linux inotify 的变更检测, 只返回被触及的路径."""
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+                  | IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+    _EVENT = struct.Struct('iIII')
+
+    def __init__(self, roots: List[Path]) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._libc = libc
+        self._fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, Path] = {}  # watch descriptor -> directory
+        self.overflowed = False
+        self.removed_dirs: Set[Path] = set()  # 被删除或移出的目录, 由 ResourceWatcher 展开为其中的已知文件
+        for root in roots:
+            self._add_tree(root)
+
+    @staticmethod
+    def available() -> bool:
+        if not sys.platform.startswith('linux'):
+            return False
+        library = ctypes.util.find_library('c')
+        return library is not None and hasattr(ctypes.CDLL(library), 'inotify_init1')
+
+    def _add_tree(self, root: Path) -> None:
+        if not root.is_dir():
+            return
+        self._add_watch(root)
+        for dir_path, dir_names, _ in os.walk(root):
+            for name in dir_names:
+                self._add_watch(Path(dir_path, name))
+
+    def _add_watch(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), self.WATCH_MASK)
+        if wd >= 0:
+            self._dirs[wd] = directory
+
+    def _remove_tree(self, root: Path) -> None:
+        """停止监视目录及其子目录 (目录被移出后 watch 仍会跟随它)."""
+        for wd, directory in list(self._dirs.items()):
+            if directory == root or root in directory.parents:
+                del self._dirs[wd]
+                self._libc.inotify_rm_watch(self._fd, wd)
+
+    def poll(self, timeout: float) -> Set[Path]:
+        """等待最多 timeout 秒, 返回期间被触及的文件路径."""
+        touched: Set[Path] = set()
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return touched
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return touched
+        offset = 0
+        while offset + self._EVENT.size <= len(data):
+            wd, mask, _, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            if mask & self.IN_Q_OVERFLOW:
+                self.overflowed = True
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None:
+                continue
+            if mask & self.IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            if not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    # 新目录: 继续监视, 并把其中已有的文件视为被触及
+                    self._add_tree(path)
+                    touched.update(p for p in path.rglob('*') if p.is_file())
+                elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                    # 目录被删除或移出: 其中的文件不会再单独产生事件
+                    self._remove_tree(path)
+                    self.removed_dirs.add(path)
+                continue
+            touched.add(path)
+        return touched
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class _PollingBackend:
+    """基于 mtime 轮询的变更检测.
+
+    每次轮询只 stat 已知文件, 并且只对 mtime 变化过的目录重新列目录,
+    不需要每次遍历整个目录树.
+    """
+
+    def __init__(self, roots: List[Path], files: Dict[Path, Tuple[int, int]]) -> None:
+        self._files = dict(files)  # 上次轮询时的文件状态
+        self._dirs: Dict[Path, int] = {}
+        self.overflowed = False
+        for root in roots:
+            self._scan_dir(root)
+
+    def _scan_dir(self, directory: Path) -> Set[Path]:
+        """记录目录 mtime, 返回其中未知的文件 (递归进入新目录)."""
+        found: Set[Path] = set()
+        try:
+            self._dirs[directory] = directory.stat().st_mtime_ns
+            entries = list(os.scandir(directory))
+        except OSError:
+            self._dirs.pop(directory, None)
+            return found
+        for entry in entries:
+            path = Path(entry.path)
+            if entry.is_dir():
+                if path not in self._dirs:
+                    found.update(self._scan_dir(path))
+            elif path not in self._files:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                self._files[path] = (stat.st_mtime_ns, stat.st_size)
+                found.add(path)
+        return found
+
+    def poll(self, timeout: float) -> Set[Path]:
+        time.sleep(timeout)
+        touched: Set[Path] = set()
+        for path, state in list(self._files.items()):
+            try:
+                stat = path.stat()
+            except OSError:
+                del self._files[path]
+                touched.add(path)
+                continue
+            if (stat.st_mtime_ns, stat.st_size) != state:
+                self._files[path] = (stat.st_mtime_ns, stat.st_size)
+                touched.add(path)
+        for directory, mtime in list(self._dirs.items()):
+            try:
+                changed = directory.stat().st_mtime_ns != mtime
+            except OSError:
+                self._dirs.pop(directory, None)
+                continue
+            if changed:
+                touched.update(self._scan_dir(directory))
+        return touched
+
+    def close(self) -> None:
+        pass
+
+
+class ResourceWatcher:
+    """
+    监视资源目录下 pipeline 与 image 文件的变化.
+
+    Linux 下使用 inotify, 其它平台回退为 mtime 轮询. 变更会在 debounce 秒内
+    无新事件后合并为一个 ResourceChanges, 在后台线程中传给 callback.
+    """
+
+    def __init__(self, resource_path: Union[str, Path], callback: Callable[[ResourceChanges], None],
+                 debounce: float = 0.3, poll_interval: float = 1.0,
+                 use_inotify: Optional[bool] = None) -> None:
+        """初始化监视器.
+
+        Args:
+            resource_path (Union[str, Path]): 资源目录.
+            callback (Callable[[ResourceChanges], None]): 变更回调 (在监视线程中调用).
+            debounce (float): 合并变更的静默时间 (秒).
+            poll_interval (float): 轮询模式下的轮询间隔 (秒).
+            use_inotify (bool, optional): 是否使用 inotify, 默认可用时使用.
+        """
+        self.resource_path = Path(resource_path).resolve()
+        self.pipeline_dir = self.resource_path / "pipeline"
+        self.image_dir = self.resource_path / "image"
+        self.callback = callback
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_inotify = _InotifyBackend.available() if use_inotify is None else use_inotify
+        self._files: Dict[Path, Tuple[int, int]] = {}  # 已知文件 -> (mtime_ns, size)
+        self._backend = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def _roots(self) -> List[Path]:
+        return [p for p in (self.pipeline_dir, self.image_dir) if p.is_dir()]
+
+    def _kind(self, path: Path) -> Optional[str]:
+        """返回 'pipeline' / 'image', 与资源无关的文件返回 None."""
+        suffix = path.suffix.lower()
+        if suffix == '.json' and self.pipeline_dir in path.parents:
+            return 'pipeline'
+        if suffix in IMAGE_SUFFIXES and self.image_dir in path.parents:
+            return 'image'
+        return None
+
+    def _snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        files = {}
+        for root in self._roots():
+            for path in root.rglob('*'):
+                if self._kind(path) is None:
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                files[path] = (stat.st_mtime_ns, stat.st_size)
+        return files
+
+    def start(self) -> 'ResourceWatcher':
+        """开始在后台线程中监视."""
+        if self._thread is not None:
+            return self
+        self._files = self._snapshot()
+        roots = self._roots()
+        if self.use_inotify:
+            try:
+                self._backend = _InotifyBackend(roots)
+            except OSError as e:
+                print(f"inotify unavailable, falling back to polling: {e}")
+                self._backend = None
+        if self._backend is None:
+            self._backend = _PollingBackend(roots, self._files)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="ResourceWatcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """停止监视并等待后台线程退出."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._backend.close()
+        self._backend = None
+
+    def _run(self) -> None:
+        pending: Set[Path] = set()
+        last_event = 0.0
+        while not self._stop.is_set():
+            timeout = self.debounce if isinstance(self._backend, _InotifyBackend) else self.poll_interval
+            if pending:
+                timeout = min(timeout, max(0.0, last_event + self.debounce - time.monotonic()))
+            touched = self._backend.poll(timeout)
+            removed_dirs = getattr(self._backend, 'removed_dirs', None)
+            if removed_dirs:
+                # 被删除或移出的目录: 其中所有已知文件都视为被触及
+                touched |= {p for p in self._files
+                            if any(d in p.parents for d in removed_dirs)}
+                removed_dirs.clear()
+            if self._backend.overflowed:
+                # 事件队列溢出: 与完整快照比较一次
+                self._backend.overflowed = False
+                touched |= set(self._files) | set(self._snapshot())
+            touched = {p for p in touched if self._kind(p) is not None}
+            if touched:
+                pending |= touched
+                last_event = time.monotonic()
+            if pending and time.monotonic() - last_event >= self.debounce:
+                changes = self._classify(pending)
+                pending = set()
+                if changes:
+                    try:
+                        self.callback(changes)
+                    except Exception as e:
+                        print(f"Error handling resource changes: {e}")
+
+    def _classify(self, paths: Set[Path]) -> ResourceChanges:
+        """对照已知状态, 将被触及的路径分为新增/删除/修改."""
+        changes = ResourceChanges()
+        for path in sorted(paths):
+            kind = self._kind(path)
+            try:
+                stat = path.stat()
+                state = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                state = None
+            old_state = self._files.get(path)
+            if state is None:
+                if old_state is None:
+                    continue
+                del self._files[path]
+                getattr(changes, f"{kind}_removed").append(path)
+            elif old_state is None:
+                self._files[path] = state
+                getattr(changes, f"{kind}_added").append(path)
+            elif old_state != state:
+                self._files[path] = state
+                getattr(changes, f"{kind}_modified").append(path)
+        return changes
@@ -1,89 +1,143 @@
 import copy
 import json
+import re
 import uuid
-from dataclasses import dataclass
+from contextlib import contextmanager, ExitStack
 from pathlib import Path
-from typing import Optional, List, Union, Dict, Any
+from types import MappingProxyType
+from typing import Optional, List, Union, Dict, Any, Tuple, Set, Iterable, Iterator, Callable, TYPE_CHECKING
 
 from PySide2.QtCore import QObject, Signal
 
+from src.utils.pipeline_saver import PipelineSaver
+
+if TYPE_CHECKING:
+    from src.utils.pipeline_loader import PipelineLoader
+
 
 class TaskNodeSignals(QObject):
     """信号类，用于 TaskNode 属性变更通知."""
     property_changed = Signal(str, object)
+    # 一次变更 (或一次批量更新) 中实际发生变化的字段列表
+    fields_changed = Signal(list)
 
 
-@dataclass
 class TaskNode:
     """
     表示一个任务节点的数据类.
+
+    字段值保存在 __slots__ 中, 属性在类创建时一次性定义;
+    信号对象只在首次访问 signals (即 UI 订阅) 时创建.
+    赋值与原值相同时不会发出信号; 在 batch_update() 中的多次赋值
+    合并为一次 fields_changed 通知.
+    to_dict() 的结果会被缓存, 只在属性 setter 修改字段时失效.
     """
-    NODE_NAME: Optional[str] = None
-    recognition: Optional[str] = None
-    action: Optional[str] = None
-    custom_action: Optional[str] = None
-    custom_action_param: Optional[str] = None
-    enabled: Optional[bool] = None
-    focus: Optional[bool] = None
-    inverse: Optional[bool] = None
-    roi: Optional[List[int]] = None
-    roi_offset: Optional[List[int]] = None
-    threshold: Optional[float] = None
-    expected: Optional[str] = None
-    target: Optional[Union[str, List[int]]] = None
-    template: Optional[Union[str, List[str]]] = None
-    target_offset: Optional[List[int]] = None
-    next: Optional[List[str]] = None
-    interrupt: Optional[List[str]] = None
-    on_error: Optional[List[str]] = None
-    rate_limit: Optional[int] = None
-    timeout: Optional[int] = None
-    pre_delay: Optional[int] = None
-    post_delay: Optional[int] = None
-    pre_wait_freezes: Optional[int] = None
-    post_wait_freezes: Optional[int] = None
-    key: Optional[int] = None
-    InputText: Optional[str] = None
-    StartApp: Optional[str] = None
-    StopApp: Optional[str] = None
-    Command: Optional[str] = None
-    package: Optional[str] = None
+    NODE_NAME: Optional[str]
+    recognition: Optional[str]
+    action: Optional[str]
+    custom_action: Optional[str]
+    custom_action_param: Optional[str]
+    enabled: Optional[bool]
+    focus: Optional[bool]
+    inverse: Optional[bool]
+    roi: Optional[List[int]]
+    roi_offset: Optional[List[int]]
+    threshold: Optional[float]
+    expected: Optional[str]
+    target: Optional[Union[str, List[int]]]
+    template: Optional[Union[str, List[str]]]
+    target_offset: Optional[List[int]]
+    next: Optional[List[str]]
+    interrupt: Optional[List[str]]
+    on_error: Optional[List[str]]
+    rate_limit: Optional[int]
+    timeout: Optional[int]
+    pre_delay: Optional[int]
+    post_delay: Optional[int]
+    pre_wait_freezes: Optional[int]
+    post_wait_freezes: Optional[int]
+    key: Optional[int]
+    InputText: Optional[str]
+    StartApp: Optional[str]
+    StopApp: Optional[str]
+    Command: Optional[str]
+    package: Optional[str]
+
+    FIELDS = tuple(__annotations__)
+    _PRIVATE_FIELDS = {name: f"_{name}" for name in FIELDS}  # 字段名 -> 保存值的 slot
+    __slots__ = ('id', '_index', '_signals', '_batch_depth', '_pending_fields', '_dict_cache',
+                 '_dict_version') + tuple(_PRIVATE_FIELDS.values())
 
     def __init__(self) -> None:
         """初始化 TaskNode 实例."""
-        self.signals: TaskNodeSignals = TaskNodeSignals()
+        self._signals: Optional[TaskNodeSignals] = None
         self.id: str = str(uuid.uuid4())[:8]
-        self._init_properties()
+        self._index: Optional['TaskNodeIndex'] = None  # 所属管理器的索引
+        self._batch_depth: int = 0
+        self._pending_fields: Optional[List[str]] = None  # 批量更新中已变化的字段
+        self._dict_cache: Optional[MappingProxyType] = None  # 序列化结果的只读缓存
+        self._dict_version: int = 0  # 字段修改计数, 用于丢弃后台线程构建期间已过期的缓存
+        for private_field in self._PRIVATE_FIELDS.values():
+            setattr(self, private_field, None)
 
-    def _init_properties(self) -> None:
-        """初始化所有属性的 getter 和 setter 方法."""
-        for field_name in self.__dataclass_fields__:
-            if field_name in ["signals", "id"]:
-                continue
+    @property
+    def signals(self) -> TaskNodeSignals:
+        """属性变更信号, 首次访问时创建."""
+        if self._signals is None:
+            self._signals = TaskNodeSignals()
+        return self._signals
 
-            private_field = f"_{field_name}"
-            setattr(self, private_field, None)
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.FIELDS)
 
-            def getter(self, field=field_name):
-                return getattr(self, f"_{field}")
+    def __repr__(self) -> str:
+        values = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"{self.__class__.__name__}({values})"
 
-            def setter(self, value, field=field_name):
-                setattr(self, f"_{field}", value)
-                if hasattr(self, 'signals'):  # 检查 signals 属性是否存在
-                    self.signals.property_changed.emit(field, value)
+    @contextmanager
+    def batch_update(self) -> Iterator['TaskNode']:
+        """批量更新属性, 结束时只发出一次 fields_changed 通知.
 
-            setattr(self.__class__, field_name, property(getter, setter))
+        批量期间不发出 property_changed, 索引也只在结束时刷新一次. 可嵌套使用.
+
+        Example:
+            with node.batch_update():
+                node.recognition = "OCR"
+                node.next = ["a", "b"]
+        """
+        if self._batch_depth == 0:
+            self._pending_fields = []
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                changed_fields = self._pending_fields
+                self._pending_fields = None
+                self._notify_changed(changed_fields)
+
+    def _notify_changed(self, changed_fields: List[str]) -> None:
+        """刷新索引并向订阅者发送字段变更通知."""
+        if not changed_fields:
+            return
+        if self._index is not None and any(
+                name in TaskNodeIndex.INDEXED_FIELDS for name in changed_fields):
+            self._index.update_node(self)
+        if self._signals is not None:
+            self._signals.fields_changed.emit(changed_fields)
 
     def copy_from(self, other: 'TaskNode') -> None:
         """从另一个 TaskNode 实例复制所有属性，同时保留信号处理."""
         self.id = other.id  # 复制 id
-        for field_name in self.__dataclass_fields__:
-            if field_name in ["signals"]:  # 只排除 signals，允许复制 id
-                continue
-            value = getattr(other, field_name)
-            if isinstance(value, (list, dict)):
-                value = copy.deepcopy(value)  # 深拷贝列表和字典
-            setattr(self, field_name, value)
+        with self.batch_update():
+            for field_name in self.FIELDS:
+                value = getattr(other, field_name)
+                if isinstance(value, (list, dict)):
+                    value = copy.deepcopy(value)  # 深拷贝列表和字典
+                setattr(self, field_name, value)
 
     @classmethod
     def create_empty(cls) -> 'TaskNode':
@@ -92,16 +146,36 @@ class TaskNode:
 
     def update_from_dict(self, data: Dict[str, Any]) -> None:
         """从字典更新节点属性."""
-        for field_name, value in data.items():
-            if field_name in self.__dataclass_fields__ and field_name not in ["signals", "id"]:
-                setattr(self, field_name, value)
+        with self.batch_update():
+            for field_name, value in data.items():
+                if field_name in self.FIELDS:
+                    setattr(self, field_name, value)
 
     def to_dict(self) -> dict:
         """Convert TaskNode to dictionary for serialization"""
+        return dict(self.as_dict_view())
+
+    def as_dict_view(self) -> MappingProxyType:
+        """获取 to_dict() 结果的只读视图.
+
+        视图在字段未改变时被缓存并共享 (例如 MyNode.note_data 与保存),
+        不需要重新序列化. 就地修改列表等字段值后需要重新赋值该字段, 缓存才会失效.
+
+        后台保存线程也会调用此方法: 构建期间字段被修改时, 结果照常返回但不会留在缓存中.
+        """
+        cache = self._dict_cache
+        if cache is None:
+            version = self._dict_version
+            cache = MappingProxyType(self._build_dict())
+            self._dict_cache = cache
+            if self._dict_version != version:
+                # setter 在构建期间或写入缓存之前修改了字段, 丢弃可能过期的结果
+                self._dict_cache = None
+        return cache
+
+    def _build_dict(self) -> dict:
         result = {}
-        for field_name in self.__dataclass_fields__:
-            if field_name in ["signals", "id"]:
-                continue
+        for field_name in self.FIELDS:
             value = getattr(self, field_name)
             if value is not None:
                 if field_name == 'target':
@@ -143,15 +217,232 @@ class TaskNode:
     def from_dict(cls, name: str, data: Dict[str, Any]) -> 'TaskNode':
         """从字典创建 TaskNode 实例."""
         node = cls.create_empty()
-        node_data = data.copy()
-        node_data['NODE_NAME'] = name
-        node_data.pop('signals', None) # 移除 'signals' 字段
-
-        valid_fields = {k: v for k, v in node_data.items() if k in cls.__dataclass_fields__} # 过滤未知字段
-        node.update_from_dict(valid_fields)
+        # 新建的节点还没有订阅者和索引, 直接写入字段值并忽略未知字段
+        for field_name, value in data.items():
+            private_field = cls._PRIVATE_FIELDS.get(field_name)
+            if private_field is not None:
+                setattr(node, private_field, value)
+        node._NODE_NAME = name
         return node
 
 
+def _is_unchanged(old_value: Any, new_value: Any) -> bool:
+    """判断赋值是否没有实际改变字段值."""
+    if old_value is new_value:
+        # 同一个 list/dict 可能已被就地修改, 视为已变更
+        return not isinstance(new_value, (list, dict))
+    return type(old_value) is type(new_value) and old_value == new_value
+
+
+def _make_field_property(field_name: str) -> property:
+    """创建 TaskNode 字段属性, setter 同步索引并在已订阅时发出信号."""
+    private_field = f"_{field_name}"
+    indexed = field_name in TaskNodeIndex.INDEXED_FIELDS
+
+    def getter(self):
+        return getattr(self, private_field)
+
+    def setter(self, value):
+        if _is_unchanged(getattr(self, private_field), value):
+            return
+        setattr(self, private_field, value)
+        # 先增加计数再清空缓存, 与 as_dict_view() 的检查顺序配合
+        self._dict_version += 1
+        self._dict_cache = None
+        if self._pending_fields is not None:
+            if field_name not in self._pending_fields:
+                self._pending_fields.append(field_name)
+            return
+        if indexed and self._index is not None:
+            self._index.update_node(self)
+        if self._signals is not None:
+            self._signals.property_changed.emit(field_name, value)
+            self._signals.fields_changed.emit([field_name])
+
+    return property(getter, setter)
+
+
+class TaskNodeIndex:
+    """
+    TaskNode 索引.
+
+    维护 名称 -> 节点、节点 -> 出边引用、目标名称 -> 引用者 三张表,
+    由 TaskNode 的属性 setter 在 NODE_NAME/next/interrupt/on_error 变更时同步更新.
+    """
+    REFERENCE_FIELDS: Tuple[str, ...] = ('next', 'interrupt', 'on_error')
+    INDEXED_FIELDS: Tuple[str, ...] = ('NODE_NAME',) + REFERENCE_FIELDS
+    STEP_NAME_REGEX = re.compile(r'^(.*)_step_(\d+)$')
+
+    def __init__(self) -> None:
+        self._nodes: Dict[str, TaskNode] = {}
+        # name -> {node_id: node}, 按插入顺序保存同名节点
+        self._by_name: Dict[str, Dict[str, TaskNode]] = {}
+        # node_id -> 已索引的名称
+        self._names: Dict[str, Optional[str]] = {}
+        # node_id -> {field: (target, ...)}
+        self._references: Dict[str, Dict[str, Tuple[str, ...]]] = {}
+        # target -> {node_id: {field, ...}}
+        self._referrers: Dict[str, Dict[str, Set[str]]] = {}
+        # base_name -> 最小的可能空闲序号
+        self._name_counters: Dict[str, int] = {}
+
+    @staticmethod
+    def normalize_refs(value: Any) -> Tuple[str, ...]:
+        """将 next/interrupt/on_error 的值统一为非空字符串元组."""
+        if not value:
+            return ()
+        if isinstance(value, str):
+            return (value,)
+        return tuple(v for v in value if isinstance(v, str) and v)
+
+    def add_node(self, node: TaskNode) -> None:
+        """将节点加入索引."""
+        self._nodes[node.id] = node
+        node._index = self
+        self._index_name(node)
+        self._index_references(node)
+
+    def remove_node(self, node: TaskNode) -> None:
+        """将节点从索引中移除."""
+        if self._nodes.get(node.id) is not node:
+            return
+        self._unindex_name(node.id)
+        self._unindex_references(node.id)
+        del self._nodes[node.id]
+        if node._index is self:
+            node._index = None
+
+    def update_node(self, node: TaskNode) -> None:
+        """在节点名称或引用字段变化后重新索引该节点."""
+        if self._nodes.get(node.id) is not node:
+            return
+        if self._names.get(node.id) != node.NODE_NAME:
+            self._unindex_name(node.id)
+            self._index_name(node)
+        self._unindex_references(node.id)
+        self._index_references(node)
+
+    def clear(self) -> None:
+        """清空索引."""
+        for node in self._nodes.values():
+            if node._index is self:
+                node._index = None
+        self._nodes.clear()
+        self._by_name.clear()
+        self._names.clear()
+        self._references.clear()
+        self._referrers.clear()
+        self._name_counters.clear()
+
+    def _index_name(self, node: TaskNode) -> None:
+        name = node.NODE_NAME
+        self._names[node.id] = name
+        if name is not None:
+            self._by_name.setdefault(name, {})[node.id] = node
+
+    def _unindex_name(self, node_id: str) -> None:
+        name = self._names.pop(node_id, None)
+        if name is None:
+            return
+        nodes = self._by_name.get(name)
+        if nodes is not None:
+            nodes.pop(node_id, None)
+            if nodes:
+                return
+            del self._by_name[name]
+
+        # 名称被释放, 回退计数器使最小的空闲序号可以被重新使用
+        match = self.STEP_NAME_REGEX.match(name)
+        if not match:
+            return
+        base_name, step = match.group(1), int(match.group(2))
+        counter = self._name_counters.get(base_name)
+        if counter is not None and step < counter:
+            self._name_counters[base_name] = step
+
+    def _index_references(self, node: TaskNode) -> None:
+        references = {}
+        for field in self.REFERENCE_FIELDS:
+            targets = self.normalize_refs(getattr(node, field))
+            if not targets:
+                continue
+            references[field] = targets
+            for target in targets:
+                self._referrers.setdefault(target, {}).setdefault(node.id, set()).add(field)
+        self._references[node.id] = references
+
+    def _unindex_references(self, node_id: str) -> None:
+        references = self._references.pop(node_id, {})
+        for targets in references.values():
+            for target in targets:
+                referrers = self._referrers.get(target)
+                if referrers is None:
+                    continue
+                referrers.pop(node_id, None)
+                if not referrers:
+                    del self._referrers[target]
+
+    def get_node_by_name(self, node_name: str) -> Optional[TaskNode]:
+        """通过名称获取节点, 同名时返回最早加入的节点."""
+        nodes = self._by_name.get(node_name)
+        if not nodes:
+            return None
+        return next(iter(nodes.values()))
+
+    def has_name(self, node_name: str) -> bool:
+        """检查名称是否已被占用."""
+        return node_name in self._by_name
+
+    def get_references(self, node_id: str) -> Dict[str, List[str]]:
+        """获取节点的出边引用 {field: [target, ...]}."""
+        return {field: list(targets)
+                for field, targets in self._references.get(node_id, {}).items()}
+
+    def get_referrers(self, node_name: str,
+                      fields: Optional[Iterable[str]] = None) -> List[TaskNode]:
+        """获取所有跳转到指定名称的节点.
+
+        Args:
+            node_name (str): 目标节点名称.
+            fields (Iterable[str], optional): 只统计这些字段, 默认 next/interrupt/on_error 全部.
+        """
+        referrers = self._referrers.get(node_name)
+        if not referrers:
+            return []
+        if fields is None:
+            return [self._nodes[node_id] for node_id in referrers]
+        fields = set(fields)
+        return [self._nodes[node_id]
+                for node_id, ref_fields in referrers.items()
+                if ref_fields & fields]
+
+    def generate_unique_name(self, base_name: str,
+                             is_taken: Optional[Callable[[str], bool]] = None) -> str:
+        """生成形如 '{base_name}_step_{n}' 的唯一名称, 序号取最小的空闲值.
+
+        每个 base_name 记录最小的可能空闲序号 (名称释放时回退), 不需要重新扫描全部节点.
+        生成的名称在被节点使用之前不会占用序号.
+
+        Args:
+            base_name (str): 名称前缀.
+            is_taken (Callable[[str], bool], optional): 额外判断名称是否已被占用.
+        """
+        step = self._name_counters.get(base_name, 1)
+        while f"{base_name}_step_{step}" in self._by_name:
+            step += 1
+        self._name_counters[base_name] = step
+        name = f"{base_name}_step_{step}"
+        while name in self._by_name or (is_taken is not None and is_taken(name)):
+            step += 1
+            name = f"{base_name}_step_{step}"
+        return name
+
+
+for _field_name in TaskNode.FIELDS:
+    setattr(TaskNode, _field_name, _make_field_property(_field_name))
+del _field_name
+
+
 class TaskNodeManager:
     """
     TaskNode 管理器单例类.
@@ -171,7 +462,10 @@ class TaskNodeManager:
         """初始化 TaskNodeManager 实例."""
         if not hasattr(self, "_initialized"):  # 避免重复初始化
             self._nodes: Dict[str, TaskNode] = {}
+            self._index: TaskNodeIndex = TaskNodeIndex()
             self._current_file_path: Optional[Path] = None
+            self._resource: Optional['PipelineLoader'] = None  # 整个资源目录的跨文件命名空间
+            self._saver: PipelineSaver = PipelineSaver(self)  # 延迟保存器
             self.selected_node: Optional[TaskNode] = None
             self._initialized = True  # 标记已初始化
 
@@ -189,23 +483,19 @@ class TaskNodeManager:
             if not file_path.exists():
                 raise FileNotFoundError(f"File not found: {file_path}")
 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            self.flush_pending_save()  # 切换文件前写出未保存的修改
 
-            if not isinstance(data, dict):
-                raise ValueError("Invalid file format: expected dictionary")
+            nodes = None
+            if self._resource is not None:
+                # 资源已整体加载过时直接复用解析结果
+                nodes = self._resource.get_file_nodes(file_path)
+            if nodes is None:
+                nodes = self._read_nodes(file_path)
 
             self.clear_nodes() # 清空现有节点
 
-            for node_name, node_data in data.items():
-                try:
-                    node = TaskNode.create_empty()
-                    node_data['NODE_NAME'] = node_name
-                    node.update_from_dict(node_data)
-                    self.add_node(node)
-                except Exception as e:
-                    print(f"Error loading node {node_name}: {e}")
-                    continue
+            for node in nodes.values():
+                self.add_node(node)
 
             self._current_file_path = file_path
             return True
@@ -220,6 +510,32 @@ class TaskNodeManager:
             print(f"Error loading nodes from file: {e}")
             return False
 
+    @staticmethod
+    def _read_nodes(file_path: Path) -> Dict[str, TaskNode]:
+        """从 JSON 文件读取节点 {name: node}."""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        if not isinstance(data, dict):
+            raise ValueError("Invalid file format: expected dictionary")
+
+        nodes = {}
+        for node_name, node_data in data.items():
+            try:
+                nodes[node_name] = TaskNode.from_dict(node_name, node_data)
+            except Exception as e:
+                print(f"Error loading node {node_name}: {e}")
+                continue
+        return nodes
+
+    def set_resource(self, resource: Optional['PipelineLoader']) -> None:
+        """设置当前资源目录的加载器, 用于跨文件查找和复用解析结果."""
+        self._resource = resource
+
+    def get_resource(self) -> Optional['PipelineLoader']:
+        """获取当前资源目录的加载器."""
+        return self._resource
+
     def save_to_file(self, file_path: Union[str, Path] = None) -> bool:
         """保存节点到 JSON 文件.
 
@@ -236,20 +552,12 @@ class TaskNodeManager:
                 file_path = self._current_file_path
             else:
                 file_path = Path(file_path)
+                if file_path != self._saver.get_dirty_path():
+                    self.flush_pending_save()  # 先写出其它文件未保存的修改
                 self._current_file_path = file_path
 
-            file_path.parent.mkdir(parents=True, exist_ok=True) # 创建父目录
-
-            data: Dict[str, Any] = {}
-            for node in self._nodes.values():
-                if node.NODE_NAME:
-                    node_data = node.to_dict()
-                    node_data.pop('NODE_NAME', None) # 移除 'NODE_NAME' 字段
-                    data[node.NODE_NAME] = node_data
-
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False) # 保存为 JSON 文件
-
+            self._saver.save_now(file_path)  # 丢弃待写入的请求并保存为 JSON 文件
+            self._sync_resource(file_path)
             return True
 
         except ValueError as e:
@@ -259,17 +567,71 @@ class TaskNodeManager:
             print(f"Error saving nodes to file: {e}")
             return False
 
+    def serialize(self) -> Dict[str, Any]:
+        """将全部节点序列化为 pipeline JSON 的字典结构 {NODE_NAME: data}.
+
+        可在后台线程中调用, 遍历前先复制节点列表.
+        """
+        data: Dict[str, Any] = {}
+        for node in list(self._nodes.values()):
+            if node.NODE_NAME:
+                # 使用缓存的序列化结果, 并移除 'NODE_NAME' 字段
+                data[node.NODE_NAME] = {key: value for key, value in node.as_dict_view().items()
+                                        if key != 'NODE_NAME'}
+        return data
+
+    def schedule_save(self) -> bool:
+        """延迟保存到当前文件.
+
+        只标记脏状态, 短时间内的多次编辑合并为一次后台原子写入.
+
+        Returns:
+            bool: 已安排保存返回 True, 没有当前文件路径时返回 False.
+        """
+        if self._current_file_path is None:
+            print("Value error: No file path specified and no previous file path exists")
+            return False
+        self._sync_resource(self._current_file_path)
+        self._saver.mark_dirty(self._current_file_path)
+        return True
+
+    def flush_pending_save(self) -> bool:
+        """立即写出延迟保存中尚未写入的修改 (例如退出程序前)."""
+        return self._saver.flush()
+
+    def has_unsaved_changes(self) -> bool:
+        """是否有尚未写入文件的修改."""
+        return self._saver.is_dirty()
+
+    def set_save_delay(self, delay: float, max_delay: Optional[float] = None) -> None:
+        """设置延迟保存的合并窗口 (秒)."""
+        self._saver.delay = delay
+        if max_delay is not None:
+            self._saver.max_delay = max_delay
+
+    def _sync_resource(self, file_path: Path) -> None:
+        """将当前节点同步到资源命名空间."""
+        if self._resource is not None and self._resource.contains(file_path):
+            self._resource.set_file_nodes(file_path, self._nodes.values())
+
     def get_current_file_path(self) -> Optional[Path]:
         """获取当前文件路径."""
         return self._current_file_path
 
     def add_node(self, node: TaskNode) -> None:
-        """添加一个 TaskNode 到管理器."""
+        """添加一个 TaskNode 到管理器, 相同 id 的旧节点会被替换."""
+        old_node = self._nodes.get(node.id)
+        if old_node is not None and old_node is not node:
+            self._index.remove_node(old_node)
         self._nodes[node.id] = node
+        self._index.add_node(node)
 
     def remove_node(self, node_id: str) -> Optional[TaskNode]:
         """从管理器移除一个 TaskNode 并返回它."""
-        return self._nodes.pop(node_id, None)
+        node = self._nodes.pop(node_id, None)
+        if node is not None:
+            self._index.remove_node(node)
+        return node
 
     def get_node_by_id(self, node_id: str) -> Optional[TaskNode]:
         """通过 ID 获取 TaskNode."""
@@ -277,10 +639,53 @@ class TaskNodeManager:
 
     def get_node_by_name(self, node_name: str) -> Optional[TaskNode]:
         """通过 NODE_NAME 获取 TaskNode."""
-        for node in self._nodes.values():
-            if node.NODE_NAME == node_name:
-                return node
-        return None
+        return self._index.get_node_by_name(node_name)
+
+    def get_referrers(self, node_name: str,
+                      fields: Optional[Iterable[str]] = None) -> List[TaskNode]:
+        """获取所有通过 next/interrupt/on_error 跳转到 node_name 的 TaskNode."""
+        return self._index.get_referrers(node_name, fields)
+
+    def get_references(self, node_id: str) -> Dict[str, List[str]]:
+        """获取 TaskNode 的出边引用 {field: [target, ...]}."""
+        return self._index.get_references(node_id)
+
+    def reindex_node(self, node: TaskNode) -> None:
+        """就地修改 next 等列表后 (不经过 setter) 手动刷新索引."""
+        self._index.update_node(node)
+
+    def generate_unique_name(self, base_name: str) -> str:
+        """生成一个未被占用的节点名称, 同时避开资源中其它文件已定义的名称."""
+        is_taken = self._resource.has_name if self._resource is not None else None
+        return self._index.generate_unique_name(base_name, is_taken)
+
+    @contextmanager
+    def batch_update(self, node_ids: Optional[Iterable[str]] = None) -> Iterator[None]:
+        """对多个 TaskNode 同时开启批量更新, 结束时每个节点只通知一次.
+
+        Args:
+            node_ids (Iterable[str], optional): 参与批量更新的节点 id, 默认全部节点.
+        """
+        if node_ids is None:
+            nodes = list(self._nodes.values())
+        else:
+            nodes = [self._nodes[node_id] for node_id in node_ids if node_id in self._nodes]
+        with ExitStack() as stack:
+            for node in nodes:
+                stack.enter_context(node.batch_update())
+            yield
+
+    def update_nodes(self, updates: Dict[str, Dict[str, Any]]) -> None:
+        """批量更新多个节点的属性.
+
+        Args:
+            updates (Dict[str, Dict[str, Any]]): {node_id: {field: value}}.
+        """
+        with self.batch_update(updates.keys()):
+            for node_id, data in updates.items():
+                node = self._nodes.get(node_id)
+                if node is not None:
+                    node.update_from_dict(data)
 
     def get_all_nodes(self) -> List[TaskNode]:
         """获取所有 TaskNode."""
@@ -289,6 +694,7 @@ class TaskNodeManager:
     def clear_nodes(self) -> None:
         """移除所有 TaskNode."""
         self._nodes.clear()
+        self._index.clear()
 
     def get_node_count(self) -> int:
         """获取 TaskNode 总数."""
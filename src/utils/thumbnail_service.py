@@ -0,0 +1,181 @@
+import hashlib
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple, Callable, Union
+
+from PySide2.QtCore import QObject, Signal, QSize, Qt
+from PySide2.QtGui import QImage, QImageReader, QPixmap
+
+# (resolved path, mtime_ns, size)
+ThumbnailKey = Tuple[str, int, int]
+ThumbnailCallback = Callable[[str, Optional[QPixmap]], None]
+
+
+class ThumbnailService(QObject):
+    """
+    模板图片缩略图服务.
+
+    图片在线程池中解码并直接缩放到节点预览大小 (QImageReader.setScaledSize),
+    缩略图以 路径 + mtime + 大小 为键保存在按内存占用限制的 LRU 中,
+    文件修改后键随之变化, 旧缩略图被自然淘汰.
+    可选的磁盘缓存保存已缩放的 PNG, 下次启动时无需再解码原图.
+    """
+    _instance: Optional['ThumbnailService'] = None
+
+    # 工作线程 -> 界面线程: (key, QImage 或 None)
+    _decoded = Signal(object, object)
+
+    def __init__(self, size: Tuple[int, int] = (200, 150), max_bytes: int = 32 * 1024 * 1024,
+                 max_workers: Optional[int] = 4, disk_cache_dir: Union[str, Path, None] = None,
+                 parent: Optional[QObject] = None) -> None:
+        """初始化缩略图服务.
+
+        Args:
+            size (Tuple[int, int]): 缩略图最大宽高, 保持原图比例.
+            max_bytes (int): 内存中缩略图的总大小上限.
+            max_workers (int, optional): 解码线程数.
+            disk_cache_dir (Union[str, Path, None]): 磁盘缓存目录, None 表示不使用磁盘缓存.
+            parent (QObject): 父对象.
+        """
+        super().__init__(parent)
+        self.size = QSize(*size)
+        self.max_bytes = max_bytes
+        self.disk_cache_dir = Path(disk_cache_dir) if disk_cache_dir else None
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Thumbnail")
+        self._cache: 'OrderedDict[ThumbnailKey, QPixmap]' = OrderedDict()
+        self._cache_bytes = 0
+        self._pending: Dict[ThumbnailKey, List[Tuple[str, ThumbnailCallback]]] = {}
+        self._decoded.connect(self._on_decoded)
+
+    @classmethod
+    def instance(cls) -> 'ThumbnailService':
+        """获取共享实例, 磁盘缓存位于当前工作目录下的 cache/thumbnails 中."""
+        if cls._instance is None:
+            cls._instance = cls(disk_cache_dir=Path(os.getcwd(), "cache", "thumbnails"))
+        return cls._instance
+
+    @staticmethod
+    def make_key(image_path: Union[str, Path]) -> Optional[ThumbnailKey]:
+        """生成缓存键, 文件不存在时返回 None."""
+        try:
+            path = Path(image_path).resolve()
+            stat = path.stat()
+        except OSError:
+            return None
+        return str(path), stat.st_mtime_ns, stat.st_size
+
+    def get_cached(self, image_path: Union[str, Path]) -> Optional[QPixmap]:
+        """只查询内存缓存, 不会触发解码."""
+        key = self.make_key(image_path)
+        if key is None:
+            return None
+        pixmap = self._cache.get(key)
+        if pixmap is not None:
+            self._cache.move_to_end(key)
+        return pixmap
+
+    def request(self, image_path: Union[str, Path], callback: ThumbnailCallback) -> Optional[QPixmap]:
+        """请求缩略图.
+
+        已缓存时直接返回缩略图且不调用 callback; 否则返回 None,
+        解码完成后在界面线程调用 callback(image_path, pixmap), 失败时 pixmap 为 None.
+        """
+        image_path = str(image_path)
+        key = self.make_key(image_path)
+        if key is None:
+            callback(image_path, None)
+            return None
+        pixmap = self._cache.get(key)
+        if pixmap is not None:
+            self._cache.move_to_end(key)
+            return pixmap
+        callbacks = self._pending.get(key)
+        if callbacks is not None:
+            callbacks.append((image_path, callback))
+            return None
+        self._pending[key] = [(image_path, callback)]
+        self._executor.submit(self._decode, key)
+        return None
+
+    def invalidate(self, image_path: Union[str, Path]) -> None:
+        """丢弃某个路径的所有内存缩略图."""
+        path = str(Path(image_path).resolve())
+        for key in [k for k in self._cache if k[0] == path]:
+            self._cache_bytes -= self._pixmap_bytes(self._cache.pop(key))
+
+    def clear(self) -> None:
+        """清空内存缓存."""
+        self._cache.clear()
+        self._cache_bytes = 0
+
+    def _decode(self, key: ThumbnailKey) -> None:
+        """工作线程: 读取磁盘缓存或解码并缩放原图."""
+        image = None
+        try:
+            disk_path = self._disk_path(key)
+            if disk_path is not None and disk_path.exists():
+                image = QImage(str(disk_path))
+                if image.isNull():
+                    image = None
+            if image is None:
+                image = self._read_scaled(key[0])
+                if image is not None and disk_path is not None:
+                    disk_path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = disk_path.with_name(disk_path.name + ".tmp")
+                    if image.save(str(tmp_path), "PNG"):
+                        os.replace(tmp_path, disk_path)
+        except Exception as e:
+            print(f"Error loading thumbnail {key[0]}: {e}")
+        self._decoded.emit(key, image)
+
+    def _read_scaled(self, image_path: str) -> Optional[QImage]:
+        reader = QImageReader(image_path)
+        reader.setAutoTransform(True)
+        source_size = reader.size()
+        if source_size.isValid():
+            if source_size.width() > self.size.width() or source_size.height() > self.size.height():
+                # 解码时直接缩放, 不在内存中保留原图
+                reader.setScaledSize(source_size.scaled(self.size, Qt.KeepAspectRatio))
+        image = reader.read()
+        if image.isNull():
+            return None
+        if image.width() > self.size.width() or image.height() > self.size.height():
+            image = image.scaled(self.size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return image
+
+    def _disk_path(self, key: ThumbnailKey) -> Optional[Path]:
+        if self.disk_cache_dir is None:
+            return None
+        text = f"{key[0]}|{key[1]}|{key[2]}|{self.size.width()}x{self.size.height()}"
+        name = hashlib.sha1(text.encode('utf-8')).hexdigest()
+        return self.disk_cache_dir / name[:2] / f"{name}.png"
+
+    def _on_decoded(self, key: ThumbnailKey, image: Optional[QImage]) -> None:
+        """界面线程: 转换为 QPixmap, 写入 LRU 并通知等待者."""
+        pixmap = None
+        if image is not None:
+            pixmap = QPixmap.fromImage(image)
+            self._store(key, pixmap)
+        for image_path, callback in self._pending.pop(key, []):
+            try:
+                callback(image_path, pixmap)
+            except RuntimeError:
+                # 等待缩略图的控件已经被销毁
+                pass
+
+    def _store(self, key: ThumbnailKey, pixmap: QPixmap) -> None:
+        size = self._pixmap_bytes(pixmap)
+        old = self._cache.pop(key, None)
+        if old is not None:
+            self._cache_bytes -= self._pixmap_bytes(old)
+        self._cache[key] = pixmap
+        self._cache_bytes += size
+        while self._cache_bytes > self.max_bytes and len(self._cache) > 1:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_bytes -= self._pixmap_bytes(evicted)
+
+    @staticmethod
+    def _pixmap_bytes(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8